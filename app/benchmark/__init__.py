@@ -0,0 +1,3 @@
+"""
+Benchmarks on synthetic Python corpora
+"""
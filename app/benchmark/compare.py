@@ -0,0 +1,239 @@
+"""
+Benchmark regression gate
+Runs the benchmark suite (or loads a report) and compares per-phase
+throughput against a committed baseline, failing when a phase is
+significantly slower than the threshold allows
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+from pathlib import Path
+
+from benchmark.suite import BENCH_PHASES, DEFAULT_REPEAT, SCENARIOS, SCHEMA_VERSION, run_suite
+from gui.config_manager import ConfigManager
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+
+# Relative throughput drop that fails the gate
+DEFAULT_THRESHOLD = 0.10
+
+# Two-sided 95% critical values of Student's t by degrees of freedom
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+    10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042, 60: 2.000,
+}
+Z_95 = 1.960
+
+# The first run of a scenario is a warm-up, so an interval needs two more
+MIN_REPEAT = 3
+
+# Verdicts of a phase comparison
+PASS = 'ok'
+FASTER = 'faster'
+REGRESSION = 'REGRESSION'
+NOISY = 'noisy'
+UNMEASURED = 'TOO FEW RUNS'
+
+
+def t_critical(degrees_of_freedom):
+    """95% two-sided t value, rounding the degrees of freedom down to the table"""
+    if degrees_of_freedom < 1:
+        return math.inf
+    if degrees_of_freedom > max(T_CRITICAL_95):
+        return Z_95
+    return T_CRITICAL_95[max(df for df in T_CRITICAL_95 if df <= degrees_of_freedom)]
+
+
+def throughput_samples(scenario, phase):
+    """Tokens per second of each warm repetition of a phase"""
+    samples = scenario['phases'][phase]['seconds']
+    warm = samples[1:] or samples
+    tokens = scenario['corpus']['tokens']
+    return [tokens / seconds for seconds in warm if seconds > 0]
+
+
+def compare_samples(baseline, current):
+    """
+    Welch confidence interval for the relative change in mean throughput
+
+    Args:
+        baseline: Baseline throughput samples
+        current: Current throughput samples
+
+    Returns:
+        (change, low, high) as fractions of the baseline mean; the
+        interval is infinite when either side has fewer than two samples
+    """
+    base_mean = statistics.fmean(baseline)
+    change = (statistics.fmean(current) - base_mean) / base_mean
+    if len(baseline) < 2 or len(current) < 2:
+        return change, -math.inf, math.inf
+    base_var = statistics.variance(baseline) / len(baseline)
+    cur_var = statistics.variance(current) / len(current)
+    spread = base_var + cur_var
+    if spread == 0:
+        return change, change, change
+    # Welch–Satterthwaite degrees of freedom
+    df = spread ** 2 / (base_var ** 2 / (len(baseline) - 1) + cur_var ** 2 / (len(current) - 1))
+    margin = t_critical(int(df)) * math.sqrt(spread) / base_mean
+    return change, change - margin, change + margin
+
+
+def verdict(change, low, high, threshold):
+    """Classify a phase: a regression needs a drop beyond threshold that excludes no change"""
+    if not math.isfinite(low):
+        return UNMEASURED
+    if change < -threshold:
+        return REGRESSION if high < 0 else NOISY
+    if low > 0:
+        return FASTER
+    return PASS
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two benchmark reports
+
+    Args:
+        baseline: Baseline report dictionary
+        current: Current report dictionary
+        threshold: Relative throughput drop that counts as a regression
+
+    Returns:
+        (rows, warnings) where rows are dicts with scenario, phase,
+        baseline and current tokens/s, change, interval and verdict
+    """
+    warnings = []
+    for report, label in ((baseline, 'baseline'), (current, 'current')):
+        if report.get('schema_version') != SCHEMA_VERSION:
+            warnings.append(f"{label} report has schema version {report.get('schema_version')}, "
+                            f"expected {SCHEMA_VERSION}")
+    base_env, cur_env = baseline.get('environment', {}), current.get('environment', {})
+    for key in ('machine', 'cpu_count', 'python', 'antlr4_runtime'):
+        if base_env.get(key) != cur_env.get(key):
+            warnings.append(f"{key} differs: baseline {base_env.get(key)}, current {cur_env.get(key)}")
+
+    base_scenarios = {scenario['name']: scenario for scenario in baseline.get('scenarios', [])}
+    rows = []
+    for scenario in current.get('scenarios', []):
+        base = base_scenarios.get(scenario['name'])
+        if base is None:
+            warnings.append(f"{scenario['name']}: not in the baseline")
+            continue
+        if base['corpus']['sha256'] != scenario['corpus']['sha256']:
+            warnings.append(f"{scenario['name']}: corpus differs from the baseline's "
+                            f"(generator or parameters changed), not compared")
+            continue
+        for phase in BENCH_PHASES:
+            base_samples = throughput_samples(base, phase)
+            cur_samples = throughput_samples(scenario, phase)
+            if not base_samples or not cur_samples:
+                continue
+            change, low, high = compare_samples(base_samples, cur_samples)
+            rows.append({
+                'scenario': scenario['name'],
+                'phase': phase,
+                'baseline': statistics.fmean(base_samples),
+                'current': statistics.fmean(cur_samples),
+                'change': change,
+                'low': low,
+                'high': high,
+                'verdict': verdict(change, low, high, threshold),
+            })
+    return rows, warnings
+
+
+def format_rows(rows):
+    """Per-phase delta report"""
+    lines = [f"{'scenario':<18}{'phase':<10}{'baseline tok/s':>16}{'current tok/s':>16}"
+             f"{'change':>9}{'95% CI':>20}  verdict"]
+    for row in rows:
+        interval = (f"[{row['low']:+.1%}, {row['high']:+.1%}]"
+                    if math.isfinite(row['low']) else "(too few runs)")
+        lines.append(f"{row['scenario']:<18}{row['phase']:<10}{row['baseline']:>16.0f}{row['current']:>16.0f}"
+                     f"{row['change']:>+9.1%}{interval:>20}  {row['verdict']}")
+    return '\n'.join(lines)
+
+
+def load_report(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_report(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    """Regression gate entry point; returns 1 when a phase regressed or could not be measured"""
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark throughput against a stored baseline.")
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE),
+                        help="Baseline report (default: benchmark/baseline.json)")
+    parser.add_argument('--current', help="Compare this report instead of running the suite")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Fail when throughput drops by more than this fraction (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, help=f"Timed repetitions per scenario, at least {MIN_REPEAT} "
+                                                   f"(default: as many as the baseline)")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--output', '-o', help="Also write the current report to this file")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Run the suite and store the result as the new baseline")
+    args = parser.parse_args(argv)
+    if args.repeat is not None and args.repeat < MIN_REPEAT:
+        parser.error(f"--repeat must be at least {MIN_REPEAT}: the first run is a warm-up "
+                     f"and a confidence interval needs two more")
+
+    baseline = None
+    if not args.update_baseline:
+        try:
+            baseline = load_report(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 2
+
+    if args.current:
+        current = load_report(args.current)
+    else:
+        # Re-run the baseline's scenarios with its parameters so the corpora match
+        if baseline is not None:
+            scenarios = {scenario['name']: scenario['params'] for scenario in baseline['scenarios']}
+            repeat = args.repeat or max(scenario['repeat'] for scenario in baseline['scenarios'])
+            seed = baseline['scenarios'][0]['seed'] if baseline['scenarios'] else 0
+        else:
+            scenarios, repeat, seed = SCENARIOS, args.repeat or DEFAULT_REPEAT, 0
+        config = ConfigManager(args.config).get_config()
+        current = run_suite(scenarios, config, max(MIN_REPEAT, repeat), seed=seed,
+                            progress=lambda scenario: print(f"… {scenario['name']} done", file=sys.stderr))
+    if args.output:
+        write_report(current, args.output)
+
+    if args.update_baseline:
+        write_report(current, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    rows, warnings = compare_reports(baseline, current, args.threshold)
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+    print(format_rows(rows))
+    regressions = [row for row in rows if row['verdict'] == REGRESSION]
+    if regressions:
+        print(f"❌ {len(regressions)} phase(s) slower than the baseline by more than {args.threshold:.0%}")
+        return 1
+    unmeasured = [row for row in rows if row['verdict'] == UNMEASURED]
+    if unmeasured:
+        print(f"❌ {len(unmeasured)} phase(s) have too few warm runs for a confidence interval; "
+              f"re-run both reports with --repeat {MIN_REPEAT} or more")
+        return 1
+    print(f"✅ No phase slower than the baseline by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
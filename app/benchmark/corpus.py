@@ -0,0 +1,294 @@
+"""
+Synthetic corpus generator
+Writes reproducible Python modules whose size and shape (nesting depth,
+f-string and comprehension density, long expression chains) can be tuned
+to stress the lexer, the parser and the linters in different ways
+"""
+import argparse
+import hashlib
+import random
+import sys
+from pathlib import Path
+
+# Generation parameters and their defaults
+DEFAULT_PARAMS = {
+    'files': 4,                   # modules in the corpus
+    'lines': 300,                 # target lines per module
+    'nesting_depth': 3,           # deepest block nesting inside functions
+    'fstring_density': 0.2,       # share of string literals that are f-strings
+    'comprehension_density': 0.2, # share of assignments built by comprehensions
+    'expression_chain': 4,        # operands in the longest arithmetic/call chains
+}
+
+NAMES = ('alpha', 'beta', 'gamma', 'delta', 'value', 'total', 'count', 'index', 'item', 'result',
+         'offset', 'limit', 'record', 'payload', 'buffer', 'weight', 'score', 'node', 'key', 'entry')
+METHODS = ('strip', 'lower', 'upper', 'split', 'copy', 'items', 'keys', 'values', 'append', 'get')
+OPERATORS = ('+', '-', '*', '//', '%', '<<', '>>', '&', '|', '^')
+COMPARISONS = ('<', '<=', '>', '>=', '==', '!=')
+FORMAT_SPECS = ('', ':>8', ':.2f', ':08d', '!r', ':,')
+
+
+class _ModuleWriter:
+    """Emits one module statement by statement, tracking indentation"""
+
+    def __init__(self, rng, params):
+        self.rng = rng
+        self.params = params
+        self.lines = []
+        self.depth = 0
+        self.counter = 0
+
+    def emit(self, text):
+        self.lines.append('    ' * self.depth + text)
+
+    def fresh(self, prefix):
+        self.counter += 1
+        return f"{prefix}_{self.counter}"
+
+    # ----- expressions -----
+
+    def name(self, scope):
+        return self.rng.choice(scope)
+
+    def number(self):
+        return str(self.rng.randint(0, 999))
+
+    def string(self, scope):
+        if self.rng.random() < self.params['fstring_density']:
+            parts = []
+            for _ in range(self.rng.randint(1, 3)):
+                expression = self.chain(scope, max(1, self.params['expression_chain'] // 2))
+                parts.append(f"{self.rng.choice(NAMES)} {{{expression}{self.rng.choice(FORMAT_SPECS)}}}")
+            return 'f"' + ' '.join(parts) + '"'
+        return repr(' '.join(self.rng.sample(NAMES, 3)))
+
+    def operand(self, scope):
+        roll = self.rng.random()
+        if roll < 0.5:
+            return self.name(scope)
+        if roll < 0.8:
+            return self.number()
+        if roll < 0.9:
+            return f"len({self.name(scope)})"
+        return f"({self.name(scope)} {self.rng.choice(OPERATORS)} {self.number()})"
+
+    def chain(self, scope, length=None):
+        """Arithmetic chain of up to expression_chain operands"""
+        length = length or self.rng.randint(1, max(1, self.params['expression_chain']))
+        terms = [self.operand(scope)]
+        for _ in range(length - 1):
+            terms.append(self.rng.choice(OPERATORS))
+            terms.append(self.operand(scope))
+        return ' '.join(terms)
+
+    def call_chain(self, scope):
+        """Attribute, call and subscript chain such as a.strip().split()[0]"""
+        text = self.name(scope)
+        for _ in range(self.rng.randint(1, max(1, self.params['expression_chain']))):
+            roll = self.rng.random()
+            if roll < 0.6:
+                text += f".{self.rng.choice(METHODS)}()"
+            elif roll < 0.8:
+                text += f"[{self.number()}]"
+            else:
+                text += f".{self.rng.choice(NAMES)}"
+        return text
+
+    def comprehension(self, scope):
+        target = self.fresh('each')
+        inner = scope + [target]
+        clauses = f"for {target} in {self.name(scope)}"
+        if self.rng.random() < 0.5:
+            nested = self.fresh('part')
+            clauses += f" for {nested} in range({self.number()})"
+            inner = inner + [nested]
+        if self.rng.random() < 0.6:
+            clauses += f" if {self.name(inner)} {self.rng.choice(COMPARISONS)} {self.number()}"
+        element = self.chain(inner)
+        kind = self.rng.randrange(4)
+        if kind == 0:
+            return f"[{element} {clauses}]"
+        if kind == 1:
+            return f"{{{self.name(inner)}: {element} {clauses}}}"
+        if kind == 2:
+            return f"{{{element} {clauses}}}"
+        return f"sum({element} {clauses})"
+
+    def value(self, scope):
+        if self.rng.random() < self.params['comprehension_density']:
+            return self.comprehension(scope)
+        roll = self.rng.random()
+        if roll < 0.5:
+            return self.chain(scope)
+        if roll < 0.7:
+            return self.string(scope)
+        if roll < 0.85:
+            return self.call_chain(scope)
+        return f"[{', '.join(self.operand(scope) for _ in range(self.rng.randint(1, 5)))}]"
+
+    # ----- statements -----
+
+    def simple_statement(self, scope):
+        roll = self.rng.random()
+        if roll < 0.6:
+            target = self.fresh(self.rng.choice(NAMES))
+            self.emit(f"{target} = {self.value(scope)}")
+            scope.append(target)
+        elif roll < 0.75:
+            self.emit(f"{self.name(scope)} += {self.chain(scope)}")
+        elif roll < 0.9:
+            self.emit(f"print({self.string(scope)})")
+        else:
+            self.emit(f"{self.call_chain(scope)}")
+
+    def block(self, scope, depth, budget):
+        """Emit a block body of about budget lines, nesting up to depth more levels"""
+        scope = list(scope)
+        written = 0
+        while written < budget:
+            before = len(self.lines)
+            if depth > 0 and self.rng.random() < 0.3:
+                self.compound_statement(scope, depth, max(2, (budget - written) // 2))
+            else:
+                self.simple_statement(scope)
+            written += len(self.lines) - before
+        return scope
+
+    def compound_statement(self, scope, depth, budget):
+        kind = self.rng.randrange(4)
+        if kind == 0:
+            self.emit(f"if {self.chain(scope)} {self.rng.choice(COMPARISONS)} {self.number()}:")
+        elif kind == 1:
+            target = self.fresh('step')
+            self.emit(f"for {target} in range({self.chain(scope)}):")
+            scope = scope + [target]
+        elif kind == 2:
+            self.emit(f"while {self.name(scope)} {self.rng.choice(COMPARISONS)} {self.number()}:")
+        else:
+            self.emit("try:")
+        self.depth += 1
+        self.block(scope, depth - 1, budget)
+        self.depth -= 1
+        if kind == 0 and self.rng.random() < 0.5:
+            self.emit("else:")
+            self.depth += 1
+            self.block(scope, depth - 1, max(1, budget // 2))
+            self.depth -= 1
+        elif kind == 3:
+            self.emit("except (ValueError, KeyError) as error:")
+            self.depth += 1
+            self.emit(f"print({self.string(scope + ['error'])})")
+            self.depth -= 1
+
+    def function(self, scope, budget):
+        name = self.fresh('compute')
+        params = [self.fresh(self.rng.choice(NAMES)) for _ in range(self.rng.randint(0, 4))]
+        self.emit(f"def {name}({', '.join(params)}):")
+        self.depth += 1
+        body_scope = self.block(scope + params, self.params['nesting_depth'], budget)
+        self.emit(f"return {self.name(body_scope)}")
+        self.depth -= 1
+        self.emit("")
+        scope.append(name)
+
+    def klass(self, scope, budget):
+        name = self.fresh('Model').replace('_', '')
+        self.emit(f"class {name}:")
+        self.depth += 1
+        self.emit("def __init__(self, source):")
+        self.depth += 1
+        self.emit("self.source = source")
+        self.depth -= 1
+        for _ in range(self.rng.randint(1, 3)):
+            method = self.fresh('method')
+            self.emit(f"def {method}(self, argument):")
+            self.depth += 1
+            body_scope = self.block(scope + ['self', 'argument'], self.params['nesting_depth'] - 1,
+                                    max(2, budget // 3))
+            self.emit(f"return {self.name(body_scope)}")
+            self.depth -= 1
+        self.depth -= 1
+        self.emit("")
+        scope.append(name)
+
+    def module(self):
+        scope = list(NAMES[:5])
+        self.emit('"""Synthetic benchmark module"""')
+        self.emit("import os")
+        for name in scope:
+            self.emit(f"{name} = {self.number()}")
+        self.emit("")
+        while len(self.lines) < self.params['lines']:
+            roll = self.rng.random()
+            budget = self.rng.randint(5, 25)
+            if roll < 0.6:
+                self.function(scope, budget)
+            elif roll < 0.8:
+                self.klass(scope, budget)
+            else:
+                self.simple_statement(scope)
+        return '\n'.join(self.lines) + '\n'
+
+
+def generate_module(params, seed):
+    """
+    Generate the source of one module
+
+    Args:
+        params: Generation parameters (missing keys take DEFAULT_PARAMS)
+        seed: Random seed; the same seed and parameters give the same source
+
+    Returns:
+        Python source code
+    """
+    merged = dict(DEFAULT_PARAMS, **params)
+    return _ModuleWriter(random.Random(seed), merged).module()
+
+
+def generate_corpus(directory, params=None, seed=0):
+    """
+    Write a corpus of generated modules
+
+    Args:
+        directory: Output directory (created if needed)
+        params: Generation parameters (missing keys take DEFAULT_PARAMS)
+        seed: Base random seed; module i uses seed + i
+
+    Returns:
+        Dictionary with the 'files' written, total 'lines' and 'bytes',
+        and a 'sha256' over their contents
+    """
+    merged = dict(DEFAULT_PARAMS, **(params or {}))
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    files = []
+    lines = size = 0
+    for index in range(merged['files']):
+        source = generate_module(merged, seed + index)
+        path = directory / f"module_{index:03d}.py"
+        path.write_text(source, encoding='utf-8')
+        digest.update(source.encode('utf-8'))
+        files.append(path)
+        lines += source.count('\n')
+        size += len(source.encode('utf-8'))
+    return {'files': files, 'lines': lines, 'bytes': size, 'sha256': digest.hexdigest()}
+
+
+def main(argv=None):
+    """Corpus generator entry point"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Python corpus.")
+    parser.add_argument('directory', help="Output directory")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: %(default)s)")
+    for key, default in DEFAULT_PARAMS.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=type(default), default=default,
+                            help=f"(default: {default})")
+    args = parser.parse_args(argv)
+    params = {key: getattr(args, key) for key in DEFAULT_PARAMS}
+    corpus = generate_corpus(args.directory, params, args.seed)
+    print(f"Wrote {len(corpus['files'])} file(s), {corpus['lines']} lines, sha256 {corpus['sha256'][:12]}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Backend differential harness
+Lints a corpus with both the ANTLR and the ast backend and reports every
+file on which their findings differ, with the time each backend took
+"""
+import argparse
+import difflib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark.corpus import DEFAULT_PARAMS, generate_corpus
+from benchmark.stdlib import find_files, stdlib_path
+from benchmark.suite import SCENARIOS
+from gui.config_manager import ConfigManager
+from gui.linter_runner import BACKEND_ANTLR, BACKEND_AST, LinterRunner
+
+# Result entries that must be identical
+COMPARED_KEYS = ('listener_violations', 'semantic_output', 'errors')
+
+# Diff lines kept per differing entry
+MAX_DIFF_LINES = 20
+
+
+def compare_results(antlr_result, ast_result):
+    """
+    Differences between the two backends' results for one file
+
+    Returns:
+        Dict of result key -> unified diff lines (ANTLR '-', ast '+'),
+        empty when the findings match
+    """
+    differences = {}
+    for key in COMPARED_KEYS:
+        if antlr_result[key] != ast_result[key]:
+            diff = difflib.unified_diff(antlr_result[key], ast_result[key], 'antlr', 'ast', lineterm='', n=0)
+            differences[key] = list(diff)[2:]
+    return differences
+
+
+def run_differential(files, config, progress=None):
+    """
+    Lint files with both backends and compare the findings
+
+    Args:
+        files: Files to lint
+        config: Linter configuration (its 'backend' is ignored)
+        progress: Optional callback(current, total, filename)
+
+    Returns:
+        Report dictionary
+    """
+    runners = {backend: LinterRunner(dict(config, backend=backend)) for backend in (BACKEND_ANTLR, BACKEND_AST)}
+    seconds = dict.fromkeys(runners, 0.0)
+    mismatches = []
+    fallbacks = []
+    for index, path in enumerate(files, 1):
+        if progress:
+            progress(index, len(files), str(path))
+        results = {}
+        for backend, runner in runners.items():
+            start = time.perf_counter()
+            results[backend] = runner.lint_file(path)
+            seconds[backend] += time.perf_counter() - start
+        ast_result = results[BACKEND_AST]
+        if ast_result.get('metrics', {}).get('backend') != BACKEND_AST:
+            # CPython rejected the file; both results came from ANTLR
+            fallbacks.append(str(path))
+            continue
+        differences = compare_results(results[BACKEND_ANTLR], ast_result)
+        if differences:
+            mismatches.append({'file': str(path), 'differences': differences})
+    compared = len(files) - len(fallbacks)
+    return {
+        'files': len(files),
+        'compared': compared,
+        'fallbacks': fallbacks,
+        'mismatches': mismatches,
+        'seconds': seconds,
+        'speedup': seconds[BACKEND_ANTLR] / seconds[BACKEND_AST] if seconds[BACKEND_AST] else 0.0,
+    }
+
+
+def format_report(report):
+    """Human readable summary of a differential report"""
+    seconds = report['seconds']
+    lines = [
+        f"{report['files']} file(s): {report['compared']} compared, "
+        f"{len(report['fallbacks'])} rejected by CPython (linted with ANTLR by both)",
+        f"ANTLR {seconds[BACKEND_ANTLR]:.1f} s, ast {seconds[BACKEND_AST]:.2f} s "
+        f"({report['speedup']:.0f}x faster)",
+    ]
+    for mismatch in report['mismatches']:
+        lines.append(f"❌ {mismatch['file']}")
+        for key, diff in mismatch['differences'].items():
+            lines.append(f"  {key}:")
+            lines.extend(f"    {line}" for line in diff[:MAX_DIFF_LINES])
+            if len(diff) > MAX_DIFF_LINES:
+                lines.append(f"    … {len(diff) - MAX_DIFF_LINES} more line(s)")
+    if report['mismatches']:
+        lines.append(f"❌ Findings differ on {len(report['mismatches'])} file(s)")
+    else:
+        lines.append("✅ Both backends report the same findings")
+    return '\n'.join(lines)
+
+
+def collect_files(paths, exclude, limit=None):
+    """Python files under the given paths, sorted, optionally sampled evenly"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(find_files(path, exclude))
+        elif path.suffix == '.py':
+            files.append(path)
+    if limit and limit < len(files):
+        step = len(files) / limit
+        files = [files[int(index * step)] for index in range(limit)]
+    return files
+
+
+def main(argv=None):
+    """Harness entry point; returns 1 when the backends disagree on any file"""
+    parser = argparse.ArgumentParser(description="Check that the ast backend reports what the ANTLR backend does.")
+    parser.add_argument('paths', nargs='*', help="Files and folders to lint (default: the current folder)")
+    parser.add_argument('--stdlib', action='store_true',
+                        help=f"Also lint this interpreter's standard library ({stdlib_path()})")
+    parser.add_argument('--synthetic', action='store_true',
+                        help="Also lint a generated corpus of every benchmark scenario")
+    parser.add_argument('--limit', type=int, help="Lint an evenly spread sample of this many files")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--output', '-o', help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    config_manager = ConfigManager(args.config)
+    paths = list(args.paths)
+    if args.stdlib:
+        paths.append(stdlib_path())
+    if not paths and not args.synthetic:
+        paths = ['.']
+
+    with tempfile.TemporaryDirectory(prefix='pylinter-differential-') as temp_dir:
+        if args.synthetic:
+            for name, params in SCENARIOS.items():
+                generate_corpus(Path(temp_dir) / name, dict(DEFAULT_PARAMS, **params))
+            paths.append(temp_dir)
+        exclude = tuple(config_manager.get_exclude_patterns()) + ('site-packages', 'dist-packages')
+        files = collect_files(paths, exclude, args.limit)
+        if not files:
+            print("No Python files found.")
+            return 2
+
+        def progress(current, total, filename):
+            if current % 50 == 0 or current == total:
+                print(f"[{current}/{total}] {filename}", file=sys.stderr, flush=True)
+
+        report = run_differential(files, config_manager.get_config(), progress)
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Report written to {args.output}")
+    return 1 if report['mismatches'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Standard library harness
+Lints the running interpreter's own Lib/ directory as a realistic,
+offline workload and cross-checks that the ANTLR grammar accepts every
+file CPython accepts
+"""
+import argparse
+import ast
+import json
+import sys
+import sysconfig
+import time
+import warnings
+from pathlib import Path
+
+from gui.config_manager import ConfigManager
+from gui.linter_runner import LinterRunner
+from gui.parallel_runner import ParallelRunner
+from gui.run_metrics import RunMetrics
+
+# Directories under Lib/ that hold third-party code rather than the stdlib
+DEFAULT_EXCLUDE = ('site-packages', 'dist-packages')
+
+SLOWEST_FILES = 20
+
+
+def stdlib_path():
+    """Lib/ directory of the running interpreter"""
+    return Path(sysconfig.get_paths()['stdlib'])
+
+
+def find_files(root, exclude=DEFAULT_EXCLUDE, limit=None):
+    """
+    Python files under root in a stable order
+
+    Args:
+        root: Directory to search
+        exclude: Path components that exclude a file
+        limit: Optional number of files, taken evenly across the sorted
+            list so the sample covers every package
+
+    Returns:
+        List of Paths
+    """
+    files = sorted(path for path in Path(root).rglob('*.py')
+                   if not any(part in exclude for part in path.parts))
+    if limit and limit < len(files):
+        step = len(files) / limit
+        files = [files[int(index * step)] for index in range(limit)]
+    return files
+
+
+def cpython_accepts(path):
+    """
+    Check a file with CPython's own parser
+
+    Returns:
+        (accepted, seconds, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        source = path.read_bytes()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # invalid escape sequences and the like
+            ast.parse(source, str(path))
+    except (SyntaxError, ValueError, UnicodeDecodeError) as e:
+        return False, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return True, time.perf_counter() - start, None
+
+
+def syntax_errors(result):
+    """Lexer, parser and read errors of a lint result"""
+    return [error for error in result['errors']
+            if error.startswith(('Lexer:', 'Parser:', 'Parse error:', 'Skipped:'))]
+
+
+def run_harness(files, config, jobs=1, timeout=None, cross_check=True, progress=None, gc_batch=False):
+    """
+    Lint files and cross-check them against CPython
+
+    Args:
+        files: Files to lint
+        config: Linter configuration
+        jobs: Worker processes (1 lints in this process)
+        timeout: Optional per-file time limit in seconds
+        cross_check: Also parse every file with CPython's ast module
+        progress: Optional callback(current, total, filename)
+        gc_batch: Lint with the collector tuned for batches (gc_batch.GcBatch)
+
+    Returns:
+        Report dictionary
+    """
+    start = time.perf_counter()
+    if jobs != 1 or timeout:
+        with ParallelRunner(config, jobs or None, timeout=timeout, gc_batch=gc_batch) as runner:
+            results = runner.lint_files(files, progress_callback=progress)
+    else:
+        results = LinterRunner(config, gc_batch=gc_batch).lint_files(files, progress_callback=progress)
+    wall_seconds = time.perf_counter() - start
+
+    metrics = RunMetrics(results)
+    lines = 0
+    for path in files:
+        try:
+            lines += path.read_bytes().count(b'\n')
+        except OSError:
+            pass
+
+    antlr_failures = {}
+    for result in results:
+        errors = syntax_errors(result)
+        if errors:
+            antlr_failures[result['file']] = errors
+
+    cross = None
+    if cross_check:
+        cpython_seconds = 0.0
+        cpython_rejects = {}
+        for path in files:
+            accepted, seconds, error = cpython_accepts(path)
+            cpython_seconds += seconds
+            if not accepted:
+                cpython_rejects[str(path)] = error
+        cross = {
+            'cpython_seconds': cpython_seconds,
+            'cpython_rejects': cpython_rejects,
+            # The grammar should accept everything CPython accepts
+            'antlr_only_rejects': sorted(set(antlr_failures) - set(cpython_rejects)),
+            'cpython_only_rejects': sorted(set(cpython_rejects) - set(antlr_failures)),
+        }
+
+    return {
+        'python': sys.version.split()[0],
+        'files': len(files),
+        'lines': lines,
+        'wall_seconds': wall_seconds,
+        'files_per_second': len(files) / wall_seconds if wall_seconds else 0.0,
+        'lines_per_second': lines / wall_seconds if wall_seconds else 0.0,
+        'gc_batch': gc_batch,
+        'metrics': metrics.to_dict(),
+        'slowest': [{'file': file_path, 'seconds': seconds}
+                    for seconds, file_path in sorted(metrics.slowest, reverse=True)[:SLOWEST_FILES]],
+        'parse_errors': {'files': len(antlr_failures), 'errors': antlr_failures},
+        'cross_check': cross,
+    }
+
+
+def format_report(report):
+    """Human readable summary of a harness report"""
+    lines = [
+        f"{report['files']} file(s), {report['lines']} lines in {report['wall_seconds']:.1f} s: "
+        f"{report['files_per_second']:.2f} files/s, {report['lines_per_second']:.0f} lines/s",
+    ]
+    percentiles = report['metrics']['percentiles']['total']
+    gc_stats = report['metrics']['gc']
+    lines.append(f"Garbage collector{' (batch mode)' if report.get('gc_batch') else ''}: "
+                 f"{gc_stats['seconds']:.1f} s in {gc_stats['collections']} collection(s)")
+    lines.append("Per-file latency: " + ", ".join(
+        f"{key} {percentiles[key] * 1000:.0f} ms" for key in ('p50', 'p90', 'p99', 'max')))
+    lines.append(f"Slowest {len(report['slowest'])} file(s):")
+    for entry in report['slowest']:
+        lines.append(f"  {entry['seconds'] * 1000:>10.0f} ms  {entry['file']}")
+    lines.append(f"Files with lexer/parser errors: {report['parse_errors']['files']}")
+    cross = report['cross_check']
+    if cross is not None:
+        lines.append(f"CPython rejects {len(cross['cpython_rejects'])} file(s) "
+                     f"(ast.parse took {cross['cpython_seconds']:.1f} s in total)")
+        lines.append(f"Accepted by CPython but rejected by the ANTLR grammar: {len(cross['antlr_only_rejects'])}")
+        for file_path in cross['antlr_only_rejects']:
+            lines.append(f"  {file_path}: {report['parse_errors']['errors'][file_path][0]}")
+        if cross['cpython_only_rejects']:
+            lines.append(f"Rejected by CPython but accepted by the ANTLR grammar: "
+                         f"{len(cross['cpython_only_rejects'])}")
+            lines.extend(f"  {file_path}" for file_path in cross['cpython_only_rejects'])
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Harness entry point; returns 1 when the grammar rejects a file CPython accepts"""
+    parser = argparse.ArgumentParser(description="Lint the interpreter's standard library as a benchmark.")
+    parser.add_argument('--root', default=str(stdlib_path()),
+                        help="Directory to lint (default: this interpreter's Lib/, %(default)s)")
+    parser.add_argument('--limit', type=int, help="Lint an evenly spread sample of this many files")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--timeout', type=float, metavar='SECONDS', help="Skip files that take longer")
+    parser.add_argument('--gc-batch', action='store_true',
+                        help="Freeze long-lived objects and collect garbage between files only")
+    parser.add_argument('--no-cross-check', action='store_true',
+                        help="Do not compare acceptance with CPython's parser")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--output', '-o', help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    files = find_files(args.root, limit=args.limit)
+    if not files:
+        print(f"No Python files under {args.root}")
+        return 2
+    config = ConfigManager(args.config).get_config()
+
+    def progress(current, total, filename):
+        if current % 50 == 0 or current == total:
+            print(f"[{current}/{total}] {filename}", file=sys.stderr, flush=True)
+
+    report = run_harness(files, config, args.jobs, args.timeout, not args.no_cross_check, progress, args.gc_batch)
+    report['root'] = args.root
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Report written to {args.output}")
+    cross = report['cross_check']
+    return 1 if cross and cross['antlr_only_rejects'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
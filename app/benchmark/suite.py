@@ -0,0 +1,251 @@
+"""
+Benchmark suite
+Lints generated corpora and reports lexer, parser, listener and semantic
+visitor throughput and peak memory as JSON that can be compared across
+commits
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark.corpus import DEFAULT_PARAMS, generate_corpus
+from gui.config_manager import ConfigManager
+from gui.linter_runner import LinterRunner
+
+# Bumped whenever the layout of the JSON output changes
+SCHEMA_VERSION = 1
+
+# Phases measured separately, in execution order
+BENCH_PHASES = ('lex', 'parse', 'listener', 'semantic')
+
+# Corpus shapes run by default; each overrides DEFAULT_PARAMS
+SCENARIOS = {
+    'baseline': {},
+    'deep_nesting': {'nesting_depth': 8},
+    'fstrings': {'fstring_density': 0.8},
+    'comprehensions': {'comprehension_density': 0.8},
+    'long_expressions': {'expression_chain': 16},
+}
+
+DEFAULT_REPEAT = 3
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _measure(files, config, repeat):
+    """
+    Lint the files repeat times and collect per-phase seconds
+
+    Runs in a fresh process per scenario, so the first repetition starts
+    with an empty ANTLR DFA cache and the peak RSS belongs to the scenario.
+    """
+    runner = LinterRunner(config)
+    sources = [(str(path), path.read_text(encoding='utf-8')) for path in files]
+    rss_before = _peak_rss_bytes()
+    runs = []
+    tokens = nodes = 0
+    for _ in range(repeat):
+        seconds = dict.fromkeys(BENCH_PHASES, 0.0)
+        tokens = nodes = 0
+        for file_path, source in sources:
+            result = runner.lint_source(source, file_path)
+            if result['errors']:
+                raise RuntimeError(f"{file_path}: {result['errors'][0]}")
+            metrics = result['metrics']
+            for phase in BENCH_PHASES:
+                seconds[phase] += metrics['timings'][phase]
+            tokens += metrics['tokens']
+            nodes += metrics['nodes']
+        runs.append(seconds)
+    return {'runs': runs, 'tokens': tokens, 'nodes': nodes,
+            'rss_before_bytes': rss_before, 'peak_rss_bytes': _peak_rss_bytes()}
+
+
+def _measure_in_child(conn, files, config, repeat):
+    try:
+        conn.send(_measure(files, config, repeat))
+    except Exception as e:
+        conn.send({'error': str(e)})
+    finally:
+        conn.close()
+
+
+def run_scenario(name, params, config, directory, repeat=DEFAULT_REPEAT, seed=0):
+    """
+    Generate a scenario's corpus and benchmark it in a separate process
+
+    Args:
+        name: Scenario name
+        params: Corpus generation parameters
+        config: Linter configuration
+        directory: Directory the corpus is written to
+        repeat: Number of timed repetitions
+        seed: Corpus random seed
+
+    Returns:
+        Scenario dictionary as stored in the JSON report
+    """
+    params = dict(DEFAULT_PARAMS, **params)
+    corpus = generate_corpus(Path(directory) / name, params, seed)
+
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_in_child, args=(child_conn, corpus['files'], config, repeat))
+    process.start()
+    child_conn.close()
+    measured = parent_conn.recv()
+    process.join()
+    if 'error' in measured:
+        raise RuntimeError(f"Scenario {name} failed: {measured['error']}")
+
+    phases = {}
+    for phase in BENCH_PHASES:
+        samples = [run[phase] for run in measured['runs']]
+        # The first run fills the DFA cache; later runs show warm throughput
+        warm = samples[1:] or samples
+        median = statistics.median(warm)
+        phases[phase] = {
+            'seconds': samples,
+            'cold_seconds': samples[0],
+            'median_seconds': median,
+            'min_seconds': min(warm),
+            'tokens_per_second': measured['tokens'] / median if median else 0.0,
+            'lines_per_second': corpus['lines'] / median if median else 0.0,
+        }
+    return {
+        'name': name,
+        'params': params,
+        'seed': seed,
+        'corpus': {
+            'files': len(corpus['files']),
+            'lines': corpus['lines'],
+            'bytes': corpus['bytes'],
+            'tokens': measured['tokens'],
+            'nodes': measured['nodes'],
+            'sha256': corpus['sha256'],
+        },
+        'repeat': repeat,
+        'phases': phases,
+        'rss_before_bytes': measured['rss_before_bytes'],
+        'peak_rss_bytes': measured['peak_rss_bytes'],
+    }
+
+
+def _git_commit():
+    """Commit of the working tree, or None outside a git checkout"""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def environment():
+    """Machine and runtime details stored with every report"""
+    try:
+        from importlib.metadata import version
+        antlr_version = version('antlr4-python3-runtime')
+    except Exception:
+        antlr_version = None
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'antlr4_runtime': antlr_version,
+    }
+
+
+def run_suite(scenarios, config, repeat=DEFAULT_REPEAT, scale=1.0, seed=0, corpus_dir=None, progress=None):
+    """
+    Run benchmark scenarios
+
+    Args:
+        scenarios: Mapping of scenario name to corpus parameters
+        config: Linter configuration
+        repeat: Number of timed repetitions per scenario
+        scale: Multiplier for the lines per generated module
+        seed: Corpus random seed
+        corpus_dir: Keep the generated corpora here (default: temporary)
+        progress: Optional callback(scenario_dict) after each scenario
+
+    Returns:
+        Report dictionary (see SCHEMA_VERSION)
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix='pylinter-bench-') as temp_dir:
+        directory = corpus_dir or temp_dir
+        for name, params in scenarios.items():
+            params = dict(params)
+            params['lines'] = max(1, int(params.get('lines', DEFAULT_PARAMS['lines']) * scale))
+            scenario = run_scenario(name, params, config, directory, repeat, seed)
+            results.append(scenario)
+            if progress:
+                progress(scenario)
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'environment': environment(),
+        'scenarios': results,
+    }
+
+
+def format_scenario(scenario):
+    """One table row per phase of a scenario"""
+    corpus = scenario['corpus']
+    lines = [f"{scenario['name']}: {corpus['files']} file(s), {corpus['lines']} lines, {corpus['tokens']} tokens, "
+             f"peak RSS {scenario['peak_rss_bytes'] / (1024 * 1024):.0f} MB"]
+    for phase in BENCH_PHASES:
+        stats = scenario['phases'][phase]
+        lines.append(f"  {phase:<10}{stats['median_seconds']:>9.3f} s{stats['tokens_per_second']:>12.0f} tokens/s"
+                     f"{stats['lines_per_second']:>10.0f} lines/s   (cold {stats['cold_seconds']:.3f} s)")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the linter on synthetic corpora.")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable, default: all)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="Timed repetitions per scenario (default: %(default)s)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiply the lines per generated module (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0, help="Corpus random seed (default: %(default)s)")
+    parser.add_argument('--corpus-dir', help="Keep the generated corpora in this directory")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--output', '-o', help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    scenarios = {name: SCENARIOS[name] for name in (args.scenario or SCENARIOS)}
+    config = ConfigManager(args.config).get_config()
+    report = run_suite(scenarios, config, max(1, args.repeat), args.scale, args.seed, args.corpus_dir,
+                       progress=lambda scenario: print(format_scenario(scenario), flush=True))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""
+Python Clean Code Linter - Command Line Entry Point
+Headless runner for scripts, CI and watch mode
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from gui.config_manager import ConfigManager
+from gui.linter_runner import LinterRunner, BACKENDS
+from gui.incremental_linter import IncrementalLinter
+from gui.parallel_runner import ParallelRunner, DEFAULT_SPLIT_LINES, DEFAULT_RECYCLE_AFTER
+from gui.parse_cache import default_cache_dir
+from gui.scheduling import CostHistory, default_history_path
+from gui.run_metrics import RunMetrics
+from gui.trace_export import TraceRecorder
+from gui.decision_profiler import DecisionProfile
+from gui.result_store import ResultStore
+from gui.file_watcher import FileWatcher
+from gui.git_changes import GitChanges, GitError, SOURCES, SOURCE_WORKTREE, filter_result_to_lines
+
+
+def build_arg_parser():
+    """Create the command line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="Lint Python files for clean code and semantic issues."
+    )
+    parser.add_argument('paths', nargs='*', default=['.'],
+                        help="Python files or folders to lint (default: current directory)")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--no-listener', action='store_true',
+                        help="Skip the listener-based clean code linter")
+    parser.add_argument('--no-semantic', action='store_true',
+                        help="Skip the semantic visitor linter")
+    parser.add_argument('--backend', choices=BACKENDS,
+                        help="Parse with ANTLR or with CPython's ast module, which is much faster and "
+                             "falls back to ANTLR for files CPython rejects (default: from the config)")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Lint in this many worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--split-lines', type=int, default=DEFAULT_SPLIT_LINES,
+                        help="With --jobs: lint files longer than this many lines in parallel "
+                             "chunks split at top-level statements (0 disables, default: %(default)s)")
+    parser.add_argument('--no-history', action='store_true',
+                        help="With --jobs: schedule by file size only, ignoring and not "
+                             "recording the lint times of previous runs")
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help="Skip files that take longer than this to lint "
+                             "(runs in worker processes, also with --jobs 1)")
+    parser.add_argument('--max-memory', type=int, metavar='MB',
+                        help="Skip files that push a worker process above this resident memory")
+    parser.add_argument('--recycle-after', type=int, default=DEFAULT_RECYCLE_AFTER, metavar='N',
+                        help="Replace each worker process after N files (0 never, default: %(default)s)")
+    parser.add_argument('--gc-batch', action='store_true',
+                        help="Freeze long-lived objects after warm-up, suspend garbage collection while "
+                             "each file is linted and collect between files")
+    parser.add_argument('--parse-cache', metavar='DIR', nargs='?', const=default_cache_dir(),
+                        help="Keep token tables and parse trees in DIR (default: %(const)s) and reuse them "
+                             "for files whose contents did not change")
+    parser.add_argument('--timings', action='store_true',
+                        help="Print a per-phase timing table and the slowest files")
+    parser.add_argument('--profile-rules', action='store_true',
+                        help="Attribute time and calls to each rule check and print them per run and per file")
+    parser.add_argument('--timings-json', metavar='PATH',
+                        help="Write per-phase timing totals and percentiles to PATH as JSON")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="Write per-file, per-phase spans from every worker process to PATH as "
+                             "Chrome Trace Event JSON (open in Perfetto or chrome://tracing)")
+    parser.add_argument('--profile-decisions', metavar='JSON', nargs='?', const='',
+                        help="Instead of linting, parse the files with ANTLR decision profiling and report "
+                             "the costliest grammar decisions (optionally also written to JSON)")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and re-lint files as they change")
+    parser.add_argument('--poll', action='store_true',
+                        help="Watch by polling instead of inotify")
+    parser.add_argument('--changed-since', metavar='REF',
+                        help="Only lint files changed relative to the merge base with REF")
+    parser.add_argument('--source', choices=SOURCES, default=SOURCE_WORKTREE,
+                        help="With --changed-since: lint working tree, staged (index) "
+                             "or committed (head) contents (default: worktree)")
+    parser.add_argument('--changed-lines', action='store_true',
+                        help="With --changed-since: only report issues on changed lines")
+    return parser
+
+
+def collect_files(runner, paths, exclude_patterns):
+    """Expand files and folders into a de-duplicated list of Python files"""
+    files = []
+    seen = set()
+    for path in paths:
+        for file_path in runner.find_python_files(path, exclude_patterns):
+            if file_path not in seen:
+                seen.add(file_path)
+                files.append(file_path)
+    return files
+
+
+def lint_changed(runner, args, exclude_patterns, result_callback):
+    """
+    Lint only the files changed relative to args.changed_since
+
+    Args:
+        runner: LinterRunner used for linting
+        args: Parsed command line arguments
+        exclude_patterns: Exclude patterns from the config
+        result_callback: Called with each (possibly line-filtered) result
+
+    Returns:
+        List of results dictionaries
+    """
+    git = GitChanges()
+    roots = [Path(path).resolve() for path in args.paths]
+    changed_files = [
+        changed for changed in git.changed_files(args.changed_since, args.source)
+        if any(root == changed.path or root in changed.path.parents for root in roots)
+        and not runner._should_exclude(changed.path, exclude_patterns)
+    ]
+
+    contents = {}
+    if args.source != SOURCE_WORKTREE:
+        contents = git.read_blobs([changed.rel_path for changed in changed_files], args.source)
+
+    results = []
+    for changed in changed_files:
+        if args.source == SOURCE_WORKTREE:
+            result = runner.lint_file(changed.path, not args.no_listener, not args.no_semantic)
+        elif changed.rel_path in contents:
+            result = runner.lint_source(contents[changed.rel_path], changed.path,
+                                        not args.no_listener, not args.no_semantic)
+        else:
+            continue
+        if args.changed_lines:
+            result = filter_result_to_lines(result, changed)
+        results.append(result)
+        result_callback(result)
+    return results
+
+
+def summarize(store):
+    """One-line summary of the result store counters"""
+    return (f"{store.kind_count('violations')} violation(s), "
+            f"{store.kind_count('semantic')} semantic issue(s), "
+            f"{store.kind_count('errors')} error(s) in {store.file_count()} file(s)")
+
+
+def watch(runner, roots, exclude_patterns, store, args):
+    """
+    Re-lint changed files until interrupted
+
+    Args:
+        runner: LinterRunner used for linting
+        roots: Files and folders given on the command line
+        exclude_patterns: Exclude patterns from the config
+        store: ResultStore updated in place with new results
+        args: Parsed command line arguments
+    """
+    watcher = FileWatcher(
+        roots,
+        should_watch=lambda path: not runner._should_exclude(path, exclude_patterns),
+        use_inotify=not args.poll
+    )
+    incremental = IncrementalLinter(runner.config)
+    print(f"👀 Watching {len(roots)} path(s) using {watcher.backend}. Press Ctrl+C to stop.")
+    try:
+        while True:
+            changed, deleted = watcher.wait()
+            if not changed and not deleted:
+                continue
+
+            start = time.perf_counter()
+            results = []
+            for path in sorted(changed):
+                result = incremental.lint_file(path, not args.no_listener, not args.no_semantic)
+                store.add_result(result)
+                results.append(result)
+            for path in deleted:
+                incremental.forget(path)
+                store.remove_file(path)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            for result in results:
+                if result['listener_violations'] or result['semantic_output'] or result['errors']:
+                    print(runner.format_results([result]))
+                else:
+                    print(f"✅ {result['file']}: no issues")
+            for path in sorted(deleted):
+                print(f"🗑️ {path}: removed")
+            print(f"[watch] Re-linted {len(results)} file(s) in {elapsed_ms:.0f} ms — {summarize(store)}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+
+
+def report_timings(results, args):
+    """Print the phase timing summary and write the optional JSON report"""
+    metrics = RunMetrics(results)
+    if not metrics.files:
+        return
+    print(metrics.summary())
+    if args.timings:
+        print(metrics.format_table())
+    if args.profile_rules:
+        print(metrics.format_rule_table())
+    if args.timings_json:
+        try:
+            with open(args.timings_json, 'w', encoding='utf-8') as f:
+                json.dump(metrics.to_dict(), f, indent=2)
+        except OSError as e:
+            print(f"❌ Could not write timings: {e}", file=sys.stderr)
+
+
+def write_trace(trace, results, path):
+    """Add the run and its results to the trace and write it out"""
+    trace.add_span('run', trace.origin, time.perf_counter(), category='run')
+    trace.add_results(results)
+    try:
+        trace.write(path)
+        print(f"🧭 Trace written to {path}")
+    except OSError as e:
+        print(f"❌ Could not write trace: {e}", file=sys.stderr)
+
+
+def profile_decisions(files, json_path):
+    """Profile parser decisions over the files and print the report"""
+    profile = DecisionProfile()
+    for index, file_path in enumerate(files, 1):
+        print(f"[{index}/{len(files)}] {file_path}", file=sys.stderr)
+        profile.profile_file(file_path)
+    print(profile.format_report())
+    if json_path:
+        try:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(profile.to_dict(), f, indent=2)
+        except OSError as e:
+            print(f"❌ Could not write decision profile: {e}", file=sys.stderr)
+            return 2
+    return 0
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    args = build_arg_parser().parse_args(argv)
+    config_manager = ConfigManager(args.config)
+    config = config_manager.get_config()
+    if args.backend:
+        config['backend'] = args.backend
+    runner = LinterRunner(config, profile_rules=args.profile_rules, trace=bool(args.trace),
+                          gc_batch=args.gc_batch, parse_cache=args.parse_cache)
+    trace = TraceRecorder() if args.trace else None
+    exclude_patterns = config_manager.get_exclude_patterns()
+
+    store = ResultStore()
+    if args.changed_since:
+        try:
+            results = lint_changed(runner, args, exclude_patterns, store.add_result)
+        except GitError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 2
+        print(f"Linted {len(results)} changed file(s) since {args.changed_since}.")
+    else:
+        files = collect_files(runner, args.paths, exclude_patterns)
+        if not files and not args.watch:
+            print("No Python files found or all files are excluded.")
+            return 0
+        if args.profile_decisions is not None:
+            return profile_decisions(files, args.profile_decisions)
+
+        if args.jobs != 1 or args.timeout or args.max_memory:
+            history = None if args.no_history else CostHistory(default_history_path())
+            with ParallelRunner(
+                runner.config,
+                args.jobs or None,
+                args.split_lines,
+                history,
+                timeout=args.timeout,
+                max_memory=args.max_memory * 1024 * 1024 if args.max_memory else None,
+                recycle_after=args.recycle_after,
+                profile_rules=args.profile_rules,
+                trace=bool(args.trace),
+                gc_batch=args.gc_batch,
+                parse_cache=args.parse_cache
+            ) as parallel:
+                results = parallel.lint_files(
+                    files,
+                    not args.no_listener,
+                    not args.no_semantic,
+                    result_callback=store.add_result
+                )
+        else:
+            results = runner.lint_files(
+                files,
+                not args.no_listener,
+                not args.no_semantic,
+                result_callback=store.add_result
+            )
+    print(runner.format_results(results))
+    print(summarize(store))
+    skipped = [result for result in results if result.get('skipped')]
+    if skipped:
+        print(f"⏭️ Skipped {len(skipped)} file(s) that hit the time or memory limit.")
+    report_timings(results, args)
+    if trace is not None:
+        write_trace(trace, results, args.trace)
+
+    if args.watch:
+        watch(runner, [Path(path) for path in args.paths], exclude_patterns, store, args)
+        return 0
+
+    has_issues = any(store.kind_count(kind) for kind in ('violations', 'semantic', 'errors'))
+    return 1 if has_issues else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
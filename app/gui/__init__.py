@@ -1,9 +1,21 @@
 """
 GUI Package for Python Linter
 """
-from gui.main_window import MainWindow
-from gui.config_manager import ConfigManager
-from gui.linter_runner import LinterRunner
-from gui.config_dialog import ConfigDialog
-
 __all__ = ['MainWindow', 'ConfigManager', 'LinterRunner', 'ConfigDialog']
+
+
+def __getattr__(name):
+    # Imported lazily so headless tools can use LinterRunner without PyQt6
+    if name == 'MainWindow':
+        from gui.main_window import MainWindow
+        return MainWindow
+    if name == 'ConfigManager':
+        from gui.config_manager import ConfigManager
+        return ConfigManager
+    if name == 'LinterRunner':
+        from gui.linter_runner import LinterRunner
+        return LinterRunner
+    if name == 'ConfigDialog':
+        from gui.config_dialog import ConfigDialog
+        return ConfigDialog
+    raise AttributeError(f"module 'gui' has no attribute '{name}'")
@@ -95,6 +95,13 @@ class ConfigDialog(QDialog):
         self.max_lines_spin.setSuffix(" lines")
         metrics_layout.addRow("Max Function Lines:", self.max_lines_spin)
         
+        # Max line length (0 turns the check off)
+        self.max_line_length_spin = QSpinBox()
+        self.max_line_length_spin.setRange(0, 1000)
+        self.max_line_length_spin.setSuffix(" chars")
+        self.max_line_length_spin.setSpecialValueText("Off")
+        metrics_layout.addRow("Max Line Length:", self.max_line_length_spin)
+        
         # Max nesting depth
         self.max_depth_spin = QSpinBox()
         self.max_depth_spin.setRange(1, 20)
@@ -127,6 +134,18 @@ class ConfigDialog(QDialog):
         errors_group.setLayout(errors_layout)
         layout.addWidget(errors_group)
         
+        # Parser backend
+        backend_group = QGroupBox("Parser Backend")
+        backend_layout = QVBoxLayout()
+        self.ast_backend_checkbox = QCheckBox("Use CPython's ast parser for files it accepts")
+        backend_layout.addWidget(self.ast_backend_checkbox)
+        help_backend = QLabel("Much faster, with the same findings. Files CPython rejects are still linted with ANTLR.")
+        help_backend.setWordWrap(True)
+        help_backend.setStyleSheet("color: #7f8c8d; padding: 6px;")
+        backend_layout.addWidget(help_backend)
+        backend_group.setLayout(backend_layout)
+        layout.addWidget(backend_group)
+        
         # Help text
         help_text = QLabel(
             "These metrics help identify overly complex code:\n"
@@ -286,11 +305,13 @@ class ConfigDialog(QDialog):
         """Load current configuration values into UI"""
         # Metrics
         self.max_lines_spin.setValue(self.config.get('max_function_lines', 20))
+        self.max_line_length_spin.setValue(self.config.get('max_line_length', 0))
         self.max_depth_spin.setValue(self.config.get('max_nesting_depth', 5))
         self.max_args_spin.setValue(self.config.get('max_arguments', 3))
         self.max_complexity_spin.setValue(self.config.get('max_cyclomatic_complexity', 5))
         # Parser/Lexer Errors toggle
         self.parser_errors_checkbox.setChecked(self.config.get('parser_errors_enabled', True))
+        self.ast_backend_checkbox.setChecked(self.config.get('backend', 'antlr') == 'ast')
         
         # Naming conventions
         naming = self.config.get('naming_convention', {})
@@ -356,11 +377,13 @@ class ConfigDialog(QDialog):
         """Save configuration"""
         # Update config dictionary
         self.config['max_function_lines'] = self.max_lines_spin.value()
+        self.config['max_line_length'] = self.max_line_length_spin.value()
         self.config['max_nesting_depth'] = self.max_depth_spin.value()
         self.config['max_arguments'] = self.max_args_spin.value()
         self.config['max_cyclomatic_complexity'] = self.max_complexity_spin.value()
         # Parser/Lexer Errors toggle
         self.config['parser_errors_enabled'] = self.parser_errors_checkbox.isChecked()
+        self.config['backend'] = 'ast' if self.ast_backend_checkbox.isChecked() else 'antlr'
         
         # Update naming conventions
         self.config['naming_convention'] = {
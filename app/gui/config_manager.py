@@ -11,10 +11,13 @@ class ConfigManager:
     
     DEFAULT_CONFIG = {
         "max_function_lines": 20,
+        "max_line_length": 0,
         "max_nesting_depth": 5,
         "max_arguments": 3,
         "max_cyclomatic_complexity": 5,
         "parser_errors_enabled": True,
+        "backend": "antlr",
+        "disabled_rules": [],
         "naming_convention": {
             "function": "snake_case",
             "class": "PascalCase",
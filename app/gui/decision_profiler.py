@@ -0,0 +1,264 @@
+"""
+Decision Profiler Module
+Profiles ANTLR prediction per grammar decision, after the Java runtime's
+ProfilingATNSimulator, which the Python runtime does not ship
+"""
+import time
+
+from antlr4 import CommonTokenStream, FileStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+from generated.PythonLexer import PythonLexer
+from generated.PythonParser import PythonParser
+
+# Orderings offered by DecisionProfile.top()
+SORT_KEYS = {
+    'time': lambda info: info.seconds,
+    'lookahead': lambda info: info.max_look,
+    'ambiguities': lambda info: info.ambiguities,
+    'll_fallbacks': lambda info: info.ll_fallbacks,
+}
+
+
+class DecisionInfo:
+    """Counters for one grammar decision"""
+
+    __slots__ = ('decision', 'rule', 'invocations', 'seconds', 'lookahead', 'sll_lookahead', 'sll_max_look',
+                 'll_lookahead', 'll_max_look', 'dfa_transitions', 'atn_transitions',
+                 'll_atn_transitions', 'll_fallbacks', 'context_sensitivities', 'ambiguities',
+                 'predicate_evals', 'errors')
+
+    def __init__(self, decision, rule):
+        self.decision = decision
+        self.rule = rule
+        self.invocations = 0
+        self.seconds = 0.0
+        self.lookahead = 0  # total over calls of the deepest token looked at
+        self.sll_lookahead = 0  # total tokens examined by SLL prediction
+        self.sll_max_look = 0
+        self.ll_lookahead = 0  # total tokens examined after failing over to full LL
+        self.ll_max_look = 0
+        self.dfa_transitions = 0  # SLL steps answered by the DFA cache
+        self.atn_transitions = 0  # SLL steps that had to simulate the ATN
+        self.ll_atn_transitions = 0
+        self.ll_fallbacks = 0
+        self.context_sensitivities = 0
+        self.ambiguities = 0
+        self.predicate_evals = 0
+        self.errors = 0
+
+    @property
+    def max_look(self):
+        return max(self.sll_max_look, self.ll_max_look)
+
+    def merge(self, other):
+        """Add the counters of another DecisionInfo for the same decision"""
+        for name in self.__slots__[2:]:
+            if name.endswith('max_look'):
+                setattr(self, name, max(getattr(self, name), getattr(other, name)))
+            else:
+                setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class DecisionProfiler(ParserATNSimulator):
+    """
+    ParserATNSimulator that records time, lookahead depth, DFA cache use,
+    SLL-to-LL fallbacks, context sensitivities and ambiguities per decision
+
+    Install on a parser with DecisionProfiler.attach(parser).
+    """
+
+    def __init__(self, parser, atn, decisionToDFA, sharedContextCache):
+        super().__init__(parser, atn, decisionToDFA, sharedContextCache)
+        self.decisions = [
+            DecisionInfo(decision, parser.ruleNames[state.ruleIndex])
+            for decision, state in enumerate(atn.decisionToState)
+        ]
+        self._current = None
+        self._sll_stop = -1
+        self._ll_stop = -1
+
+    @classmethod
+    def attach(cls, parser):
+        """Replace a parser's simulator with a profiler sharing its DFA cache"""
+        interp = parser._interp
+        profiler = cls(parser, parser.atn, interp.decisionToDFA, interp.sharedContextCache)
+        parser._interp = profiler
+        return profiler
+
+    def adaptivePredict(self, input, decision, outerContext):
+        info = self.decisions[decision]
+        self._current = info
+        self._sll_stop = -1
+        self._ll_stop = -1
+        start_index = input.index
+        start = time.perf_counter()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        except Exception:
+            info.errors += 1
+            raise
+        finally:
+            info.seconds += time.perf_counter() - start
+            info.invocations += 1
+            sll_look = self._sll_stop - start_index + 1 if self._sll_stop >= 0 else 0
+            ll_look = self._ll_stop - start_index + 1 if self._ll_stop >= 0 else 0
+            info.lookahead += max(sll_look, ll_look)
+            info.sll_lookahead += sll_look
+            info.sll_max_look = max(info.sll_max_look, sll_look)
+            if ll_look:
+                info.ll_lookahead += ll_look
+                info.ll_max_look = max(info.ll_max_look, ll_look)
+            self._current = None
+
+    def getExistingTargetState(self, previousD, t):
+        # Every SLL step starts here; remember how far prediction looked
+        self._sll_stop = self._input.index
+        target = super().getExistingTargetState(previousD, t)
+        if target is not None and self._current is not None:
+            self._current.dfa_transitions += 1
+        return target
+
+    def computeTargetState(self, dfa, previousD, t):
+        if self._current is not None:
+            self._current.atn_transitions += 1
+        return super().computeTargetState(dfa, previousD, t)
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._ll_stop = self._input.index
+            if self._current is not None:
+                self._current.ll_atn_transitions += 1
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def evalSemanticContext(self, predPredictions, outerContext, complete):
+        if self._current is not None:
+            self._current.predicate_evals += 1
+        return super().evalSemanticContext(predPredictions, outerContext, complete)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+class DecisionProfile:
+    """Decision counters accumulated over a corpus"""
+
+    def __init__(self):
+        self.decisions = {}  # decision number -> DecisionInfo
+        self.files = 0
+        self.parse_seconds = 0.0
+        self.failed = []  # (file, error) of files that could not be profiled
+
+    def add(self, profiler):
+        """Add the counters of a DecisionProfiler after a parse"""
+        for info in profiler.decisions:
+            if not info.invocations:
+                continue
+            total = self.decisions.get(info.decision)
+            if total is None:
+                self.decisions[info.decision] = total = DecisionInfo(info.decision, info.rule)
+            total.merge(info)
+
+    def profile_file(self, file_path):
+        """
+        Lex and parse one file with a fresh DecisionProfiler
+
+        Lexing happens before profiling starts, so the time is prediction
+        and parsing only. The DFA cache is shared with every other parser
+        in the process, as in a normal run.
+        """
+        try:
+            lexer = PythonLexer(FileStream(str(file_path), encoding='utf-8'))
+            lexer.removeErrorListeners()
+            stream = CommonTokenStream(lexer)
+            stream.fill()
+            parser = PythonParser(stream)
+            parser.removeErrorListeners()
+            profiler = DecisionProfiler.attach(parser)
+            start = time.perf_counter()
+            parser.file_input()
+            self.parse_seconds += time.perf_counter() - start
+        except Exception as e:
+            self.failed.append((str(file_path), str(e)))
+            return
+        self.files += 1
+        self.add(profiler)
+
+    def top(self, key, limit=10):
+        """Decisions with the highest value of a SORT_KEYS ordering, skipping zeros"""
+        sort_key = SORT_KEYS[key]
+        ranked = sorted(self.decisions.values(), key=sort_key, reverse=True)
+        return [info for info in ranked if sort_key(info)][:limit]
+
+    def prediction_seconds(self):
+        return sum(info.seconds for info in self.decisions.values())
+
+    def format_report(self, limit=10):
+        """Tables of the top decisions by time, lookahead, ambiguities and LL fallbacks"""
+        prediction = self.prediction_seconds()
+        lines = [
+            f"{self.files} file(s) parsed in {self.parse_seconds:.2f} s, "
+            f"{prediction:.2f} s ({prediction / (self.parse_seconds or 1.0):.0%}) in adaptive prediction, "
+            f"{len(self.decisions)} decision(s) used"
+        ]
+        header = (f"  {'decision':>8}  {'rule':<28}{'calls':>9}{'ms':>10}{'max k':>7}{'avg k':>7}"
+                  f"{'ATN':>8}{'LL':>7}{'ambig':>7}")
+        titles = {
+            'time': "Top decisions by prediction time",
+            'lookahead': "Top decisions by lookahead depth",
+            'ambiguities': "Top decisions by ambiguities",
+            'll_fallbacks': "Top decisions by SLL to full-LL fallbacks",
+        }
+        for key, title in titles.items():
+            ranked = self.top(key, limit)
+            lines.append("")
+            lines.append(f"{title}:")
+            if not ranked:
+                lines.append("  (none)")
+                continue
+            lines.append(header)
+            for info in ranked:
+                average_look = info.lookahead / info.invocations
+                lines.append(
+                    f"  {info.decision:>8}  {info.rule:<28}{info.invocations:>9}{info.seconds * 1000:>10.1f}"
+                    f"{info.max_look:>7}{average_look:>7.1f}{info.atn_transitions + info.ll_atn_transitions:>8}"
+                    f"{info.ll_fallbacks:>7}{info.ambiguities:>7}"
+                )
+        if self.failed:
+            lines.append("")
+            lines.append(f"{len(self.failed)} file(s) could not be profiled:")
+            lines.extend(f"  {file_path}: {error}" for file_path, error in self.failed)
+        return '\n'.join(lines)
+
+    def by_rule(self):
+        """Decision counters summed per grammar rule"""
+        rules = {}
+        for info in self.decisions.values():
+            total = rules.get(info.rule)
+            if total is None:
+                rules[info.rule] = total = DecisionInfo(-1, info.rule)
+            total.merge(info)
+        return rules
+
+    def to_dict(self):
+        """JSON-serializable form of the profile"""
+        return {
+            'files': self.files,
+            'parse_seconds': self.parse_seconds,
+            'prediction_seconds': self.prediction_seconds(),
+            'decisions': [info.to_dict() for info in sorted(self.decisions.values(), key=lambda i: i.decision)],
+            'rules': {rule: info.to_dict() for rule, info in sorted(self.by_rule().items())},
+            'failed': [{'file': file_path, 'error': error} for file_path, error in self.failed],
+        }
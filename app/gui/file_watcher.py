@@ -0,0 +1,250 @@
+"""
+File Watcher Module
+Detects changed Python files under watched roots using inotify,
+with a polling fallback for platforms where it is unavailable
+"""
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Events arriving within this window after the first one are reported together
+DEBOUNCE_SECONDS = 0.05
+
+# inotify event masks (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """Return libc with inotify symbols, or None if unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """
+    Watches files and directories for changed or deleted .py files
+
+    Roots may be directories (watched recursively, new files included) or
+    single files (only that file is reported). Call wait() in a loop to
+    receive batches of changes.
+    """
+
+    def __init__(self, roots, should_watch=None, poll_interval=0.5, use_inotify=True):
+        """
+        Initialize file watcher
+
+        Args:
+            roots: Iterable of file or directory paths to watch
+            should_watch: Optional callable(Path) -> bool to filter paths (e.g. exclusions)
+            poll_interval: Seconds between scans when polling
+            use_inotify: Use inotify when available (Linux)
+        """
+        self.should_watch = should_watch or (lambda path: True)
+        self.poll_interval = poll_interval
+        self._dir_roots = []
+        self._file_roots = set()
+        for root in roots:
+            root = Path(root)
+            if root.is_dir():
+                self._dir_roots.append(root)
+            else:
+                self._file_roots.add(root)
+
+        self._libc = _load_inotify() if use_inotify else None
+        self._fd = None
+        self._watches = {}
+        self._snapshot = {}
+
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._fd < 0:
+                self._fd = None
+        if self._fd is not None:
+            for directory in self._dir_roots:
+                self._add_tree(directory)
+            for parent in {path.parent for path in self._file_roots}:
+                self._add_watch(parent)
+        else:
+            self._snapshot = self._scan()
+
+    @property
+    def backend(self):
+        """Name of the active backend ('inotify' or 'polling')"""
+        return 'inotify' if self._fd is not None else 'polling'
+
+    def close(self):
+        """Release the inotify file descriptor"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def is_relevant(self, path):
+        """Check if a path is a watched Python file"""
+        path = Path(path)
+        if path.suffix != '.py':
+            return False
+        if path in self._file_roots:
+            return True
+        for root in self._dir_roots:
+            if root == path or root in path.parents:
+                return self.should_watch(path)
+        return False
+
+    def wait(self, timeout=None):
+        """
+        Block until watched files change
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            Tuple (changed, deleted) of sets of Path objects; both empty on timeout
+        """
+        if self._fd is not None:
+            return self._wait_inotify(timeout)
+        return self._wait_polling(timeout)
+
+    # ----- inotify backend -----
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = Path(directory)
+
+    def _add_tree(self, directory):
+        """Watch a directory and its subdirectories; returns .py files found"""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [name for name in dirnames
+                           if self.should_watch(Path(dirpath, name))]
+            self._add_watch(dirpath)
+            found.extend(Path(dirpath, name) for name in filenames if name.endswith('.py'))
+        return found
+
+    def _wait_inotify(self, timeout):
+        changed, deleted = set(), set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if changed or deleted:
+                remaining = DEBOUNCE_SECONDS
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                break
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            self._handle_events(data, changed, deleted)
+        return changed, deleted
+
+    def _handle_events(self, data, changed, deleted):
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; treat every known file as changed
+                for root in self._dir_roots:
+                    changed.update(path for path in root.rglob('*.py') if self.is_relevant(path))
+                changed.update(path for path in self._file_roots if path.exists())
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and self._is_watched_dir(path):
+                    # Files may have been written before the watch was added
+                    changed.update(path for path in self._add_tree(path) if self.is_relevant(path))
+                continue
+            if not self.is_relevant(path):
+                continue
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                deleted.add(path)
+                changed.discard(path)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changed.add(path)
+                deleted.discard(path)
+
+    def _is_watched_dir(self, path):
+        """Check if a new directory lies under a recursively watched root"""
+        return any(root in path.parents for root in self._dir_roots) and self.should_watch(path)
+
+    # ----- polling backend -----
+
+    def _scan(self):
+        """Map every watched .py file to its (mtime_ns, size)"""
+        snapshot = {}
+        stack = list(self._dir_roots)
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                path = Path(directory, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.should_watch(path):
+                            stack.append(path)
+                    elif entry.name.endswith('.py') and self.should_watch(path):
+                        stat = entry.stat()
+                        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        for path in self._file_roots:
+            try:
+                stat = path.stat()
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _wait_polling(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path, stamp in snapshot.items() if self._snapshot.get(path) != stamp}
+            deleted = set(self._snapshot) - set(snapshot)
+            self._snapshot = snapshot
+            if changed or deleted:
+                return changed, deleted
+            if deadline is not None and time.monotonic() >= deadline:
+                return set(), set()
+            sleep_for = self.poll_interval
+            if deadline is not None:
+                sleep_for = min(sleep_for, max(0.0, deadline - time.monotonic()))
+            time.sleep(sleep_for)
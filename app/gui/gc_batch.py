@@ -0,0 +1,105 @@
+"""
+GC Batch Module
+Measures cyclic garbage collector pauses and runs lints with the collector
+tuned for the ANTLR runtime, which allocates huge numbers of short-lived
+contexts, tokens and ATN configs while the long-lived ATN and DFA cache
+would otherwise be rescanned by every full collection
+"""
+import gc
+import time
+from contextlib import contextmanager
+
+# Generation collected after each file in batch mode; the file's garbage
+# is all still in generation 0 because collection was suspended
+DEFAULT_GENERATION = 0
+
+
+class GcPauses:
+    """Running totals of collector pauses in this process, fed by gc.callbacks"""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.collections = 0
+        self._start = None
+
+    def _callback(self, phase, info):
+        if phase == 'start':
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.seconds += time.perf_counter() - self._start
+            self.collections += 1
+            self._start = None
+
+    def install(self):
+        """Start counting (idempotent)"""
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def snapshot(self):
+        """(seconds, collections) so far"""
+        return self.seconds, self.collections
+
+
+PAUSES = GcPauses()
+
+
+def record_gc(metrics, before):
+    """
+    Store the collector pauses since a PAUSES.snapshot() in a result's metrics
+
+    The pauses overlap the phase timings, so they are kept apart from them
+    as metrics['gc'] = {'seconds', 'collections'}.
+    """
+    seconds, collections = PAUSES.snapshot()
+    metrics['gc'] = {'seconds': seconds - before[0], 'collections': collections - before[1]}
+
+
+class GcBatch:
+    """
+    Collector settings for a batch of lints
+
+    The first lint runs with the collector as usual. Once it is done, a
+    full collection runs and every object still alive (modules, the
+    grammar's ATN and the DFA cache that lint filled) is frozen out of all
+    later collections. Each later lint suspends automatic collection and
+    collects its cyclic garbage (parse trees link parents and children)
+    right after it instead.
+    """
+
+    def __init__(self, generation=DEFAULT_GENERATION):
+        """
+        Initialize batch settings
+
+        Args:
+            generation: Generation collected after each lint (0-2)
+        """
+        self.generation = generation
+        # Objects frozen by freeze(), None before it ran
+        self.frozen = None
+
+    def freeze(self):
+        """Collect everything and freeze the survivors (only the first call does anything)"""
+        if self.frozen is not None:
+            return
+        gc.collect()
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+
+    @contextmanager
+    def lint(self):
+        """Context manager for one lint; the first one warms up, later ones suspend collection"""
+        if self.frozen is None:
+            try:
+                yield
+            finally:
+                # The DFA cache is only worth freezing once a lint has filled it
+                self.freeze()
+            return
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            gc.collect(self.generation)
+            if enabled:
+                gc.enable()
@@ -0,0 +1,181 @@
+"""
+Git Changes Module
+Finds Python files and line ranges changed relative to a base ref,
+and reads their staged or committed contents in bulk
+"""
+import re
+import subprocess
+from pathlib import Path
+
+from gui.result_store import issue_line
+
+# Where the linted contents of changed files come from
+SOURCE_WORKTREE = 'worktree'
+SOURCE_INDEX = 'index'
+SOURCE_HEAD = 'head'
+SOURCES = (SOURCE_WORKTREE, SOURCE_INDEX, SOURCE_HEAD)
+
+HUNK_HEADER = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+class GitError(Exception):
+    """Raised when a git command fails"""
+
+
+class ChangedFile:
+    """A changed Python file and the line ranges added or modified in it"""
+
+    __slots__ = ('path', 'rel_path', 'line_ranges')
+
+    def __init__(self, path, rel_path):
+        self.path = path
+        self.rel_path = rel_path
+        self.line_ranges = []
+
+    def touches(self, line):
+        """Check if a line number falls inside a changed range"""
+        return any(start <= line <= end for start, end in self.line_ranges)
+
+
+class GitChanges:
+    """Queries the local git repository for changed files"""
+
+    def __init__(self, repo_dir="."):
+        """
+        Initialize git changes helper
+
+        Args:
+            repo_dir: Any directory inside the repository
+        """
+        self.top_level = Path(self._git(['rev-parse', '--show-toplevel'], cwd=repo_dir).strip())
+
+    def _git(self, args, cwd=None, input_bytes=None, text=True):
+        """Run a git command and return its output"""
+        try:
+            completed = subprocess.run(
+                ['git', '-c', 'core.quotePath=false'] + args,
+                cwd=cwd or self.top_level,
+                input=input_bytes,
+                capture_output=True,
+                text=text and input_bytes is None,
+                check=False
+            )
+        except OSError as e:
+            raise GitError(f"Cannot run git: {e}")
+        if completed.returncode != 0:
+            stderr = completed.stderr if isinstance(completed.stderr, str) else completed.stderr.decode(errors='replace')
+            raise GitError(f"git {' '.join(args)} failed: {stderr.strip()}")
+        return completed.stdout
+
+    def changed_files(self, base_ref, source=SOURCE_WORKTREE):
+        """
+        List Python files changed relative to the merge base of base_ref
+
+        Args:
+            base_ref: Branch, tag or commit to compare against
+            source: SOURCE_WORKTREE, SOURCE_INDEX or SOURCE_HEAD
+
+        Returns:
+            List of ChangedFile objects with their changed line ranges
+        """
+        merge_base = self._git(['merge-base', base_ref, 'HEAD']).strip()
+        diff_args = ['diff', '-U0', '--no-color', '--no-ext-diff', '--diff-filter=ACMR']
+        if source == SOURCE_INDEX:
+            diff_args += ['--cached', merge_base]
+        elif source == SOURCE_HEAD:
+            diff_args += [merge_base, 'HEAD']
+        else:
+            diff_args += [merge_base]
+        diff_args += ['--', '*.py']
+
+        files = self._parse_diff(self._git(diff_args))
+
+        if source == SOURCE_WORKTREE:
+            # Untracked files are entirely new
+            untracked = self._git(['ls-files', '--others', '--exclude-standard', '-z', '--', '*.py'])
+            for rel_path in filter(None, untracked.split('\0')):
+                changed = ChangedFile(self.top_level / rel_path, rel_path)
+                changed.line_ranges.append((1, float('inf')))
+                files.append(changed)
+        return files
+
+    def _parse_diff(self, diff_text):
+        """Collect files and added line ranges from unified diff output"""
+        files = []
+        current = None
+        for line in diff_text.splitlines():
+            if line.startswith('+++ '):
+                target = line[4:].strip()
+                if target.startswith('"') and target.endswith('"'):
+                    target = target[1:-1].encode('latin-1', 'backslashreplace').decode('unicode_escape')
+                if target == '/dev/null':
+                    current = None
+                    continue
+                rel_path = target[2:] if target.startswith('b/') else target
+                current = ChangedFile(self.top_level / rel_path, rel_path)
+                files.append(current)
+            elif current is not None and line.startswith('@@'):
+                match = HUNK_HEADER.match(line)
+                if match:
+                    start = int(match.group(1))
+                    count = int(match.group(2)) if match.group(2) is not None else 1
+                    # Pure deletions (count 0) add no lines to the new version
+                    if count > 0:
+                        current.line_ranges.append((start, start + count - 1))
+        return files
+
+    def read_blobs(self, rel_paths, source):
+        """
+        Read staged or committed contents of files through a single
+        'git cat-file --batch' process
+
+        Args:
+            rel_paths: Paths relative to the repository top level
+            source: SOURCE_INDEX or SOURCE_HEAD
+
+        Returns:
+            Dict mapping relative path to decoded text (missing blobs are omitted)
+        """
+        if not rel_paths:
+            return {}
+        prefix = ':' if source == SOURCE_INDEX else 'HEAD:'
+        request = ''.join(f"{prefix}{rel_path}\n" for rel_path in rel_paths).encode('utf-8')
+        output = self._git(['cat-file', '--batch'], input_bytes=request, text=False)
+
+        contents = {}
+        offset = 0
+        for rel_path in rel_paths:
+            header_end = output.index(b'\n', offset)
+            header = output[offset:header_end].split()
+            offset = header_end + 1
+            if len(header) < 3 or header[-1] == b'missing':
+                continue
+            size = int(header[2])
+            contents[rel_path] = output[offset:offset + size].decode('utf-8', errors='replace')
+            # Blob content is followed by a newline
+            offset += size + 1
+        return contents
+
+
+def filter_result_to_lines(result, changed_file):
+    """
+    Keep only issues reported on changed lines
+
+    Issues without a line number (e.g. internal linter errors) are kept.
+
+    Args:
+        result: Result dictionary from LinterRunner
+        changed_file: ChangedFile with the line ranges to keep
+
+    Returns:
+        New result dictionary
+    """
+    def keep(kind, text):
+        line = issue_line(kind, text)
+        return line is None or changed_file.touches(line)
+
+    filtered = dict(result)
+    filtered['listener_violations'] = [v for v in result['listener_violations'] if keep('violations', v)]
+    filtered['semantic_output'] = [line for line in result['semantic_output'] if keep('semantic', line)]
+    filtered['errors'] = [e for e in result['errors'] if keep('errors', e)]
+    return filtered
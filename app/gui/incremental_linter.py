@@ -0,0 +1,612 @@
+"""
+Incremental Linter Module
+Re-lints edited sources by reparsing only the top-level statements that
+changed, reusing cached subtrees and per-statement results for the rest
+"""
+import hashlib
+import io
+import re
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from antlr4 import InputStream, CommonTokenStream, Token
+
+from gui.linter_runner import (BACKEND_AST, COMPACT_RULES, LinterRunner, LintCancelled, _CancelCheckListener,
+                               analysis_level)
+from gui.result_store import issue_line
+from generated.PythonLexer import PythonLexer
+from generated.PythonParser import PythonParser
+from linter.MyListener import AdvancedCleanCodeListener
+from linter.MySemanticVisitor import MySemanticVisitor, Scope
+from linter.compact_tree import CompactTree
+from linter.error_listener import CollectingErrorListener
+from linter.rule_levels import LEVEL_SCOPES, LEVEL_TREE, enabled_rules
+
+# Number of files whose statements are kept between lints
+DEFAULT_MAX_FILES = 256
+
+# Number of statements kept by token fingerprint, across all files
+DEFAULT_MAX_UNITS = 4096
+
+# Column-0 keywords that continue the statement above them
+_CONTINUATION_KEYWORDS = {'else', 'elif', 'except', 'finally'}
+_LAYOUT_TYPES = {PythonLexer.NEWLINE, PythonLexer.INDENT, PythonLexer.DEDENT, Token.EOF}
+
+# Rules kept in the compact trees of parsed regions: the linters' own
+# plus the top-level statements they are cut into
+_KEEP_RULES = COMPACT_RULES | {'statements', 'statement'}
+
+# Line numbers embedded in violation, semantic and error strings
+LINE_NUMBER = re.compile(r'\b(Baris |line )(\d+)')
+
+
+def _shift_lines(text, delta):
+    """Move every line number in a result string by delta lines"""
+    if not delta:
+        return text
+    return LINE_NUMBER.sub(lambda match: f"{match.group(1)}{int(match.group(2)) + delta}", text)
+
+
+def _first_code_line_indented(text):
+    """Check if the first non-blank, non-comment line of text is indented"""
+    for line in text.splitlines():
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith('#'):
+            return stripped != line
+    return False
+
+
+class _Statement:
+    """
+    A top-level statement and its cached results
+
+    The text runs from the start of the statement's first line up to the
+    next top-level statement, so trailing comments and blank lines belong
+    to the statement before them. Results are stored with the line numbers
+    of the parse that produced them (parse_line) and shifted on output.
+    The tree is the statement's node in a CompactTree of the region it was
+    parsed with, so cached statements keep no parser or token stream alive.
+    """
+
+    __slots__ = ('text', 'line_count', 'parse_line', 'tree', 'line_violations', 'violations', 'lexer_errors',
+                 'parser_errors', 'listener_error', 'semantic', 'semantic_error',
+                 'lookups', 'defines')
+
+    def __init__(self, text, parse_line, tree):
+        self.text = text
+        self.line_count = text.count('\n')
+        self.parse_line = parse_line
+        self.tree = tree
+        self.line_violations = []
+        self.violations = []
+        self.lexer_errors = []
+        self.parser_errors = []
+        self.listener_error = None
+        # Semantic output is recomputed when a global name it looked up changes
+        self.semantic = None
+        self.semantic_error = None
+        self.lookups = {}
+        self.defines = set()
+
+
+class _Unit:
+    """
+    A top-level statement found by lexing a region, before parsing
+
+    key fingerprints everything its results depend on: the type, text,
+    relative line and column of its tokens, and the lines its text spans
+    (a block's last token is the DEDENT at the next statement).
+    """
+
+    __slots__ = ('text', 'line', 'key')
+
+    def __init__(self, text, line, key):
+        self.text = text
+        self.line = line
+        self.key = key
+
+
+class _FileState:
+    """Statements and last result of one file"""
+
+    __slots__ = ('text', 'statements', 'use_listener', 'use_semantic', 'result')
+
+    def __init__(self, text, statements, use_listener, use_semantic, result):
+        self.text = text
+        self.statements = statements
+        self.use_listener = use_listener
+        self.use_semantic = use_semantic
+        self.result = result
+
+
+class _GlobalScope(Scope):
+    """Global scope that records the names each statement defines and looks up"""
+
+    def __init__(self, symbols):
+        super().__init__("Global")
+        self.symbols = set(symbols)
+        self.lookups = None
+        self.defines = None
+
+    def begin_statement(self):
+        self.lookups = {}
+        self.defines = set()
+
+    def define(self, name):
+        self.symbols.add(name)
+        if self.defines is not None:
+            self.defines.add(name)
+
+    def resolve(self, name):
+        found = name in self.symbols
+        # Names the statement defined itself don't depend on earlier statements
+        if self.lookups is not None and name not in self.defines:
+            self.lookups.setdefault(name, found)
+        return found
+
+
+class IncrementalLinter:
+    """
+    Lints sources incrementally, one cached parse per file
+
+    On each lint the new text is compared with the cached statements from
+    both ends. Statements that are unchanged are reused (line-shifted when
+    the edit moved them); only the text between them is lexed and parsed.
+    If that dirty region has lexer errors (e.g. an unterminated string that
+    swallows the rest of the file) the whole file is reparsed instead.
+    Parser errors stay local to the statement that contains them.
+
+    Listener results depend only on the statement itself. Semantic results
+    also depend on the global names defined before the statement, so they
+    are reused only while every global lookup they made still resolves
+    the same way; otherwise the visitor re-runs on the cached subtree.
+
+    Inside the dirty region (or a whole file linted without previous
+    state) statements are fingerprinted by their tokens before parsing.
+    A statement whose fingerprint was parsed before, anywhere in any file,
+    is reused too (a function moved, or left alone between two edits), so
+    only the runs of new statements are parsed.
+
+    With the ast backend configured, sources CPython accepts are linted
+    whole with it, which is faster than any reparse; only the others go
+    through the incremental ANTLR path above. Lints whose enabled rules
+    need no tree (linter.rule_levels) never parse at all.
+    """
+
+    def __init__(self, config, max_files=DEFAULT_MAX_FILES, max_units=DEFAULT_MAX_UNITS):
+        """
+        Initialize incremental linter
+
+        Args:
+            config: Configuration dictionary for linter rules
+            max_files: Number of files whose parse state is cached
+            max_units: Number of statements cached by token fingerprint
+        """
+        self.config = config
+        # Lints the incremental path cannot speed up
+        self.runner = LinterRunner(config)
+        self.max_files = max_files
+        self.max_units = max_units
+        self._files = OrderedDict()
+        self._units = OrderedDict()
+        self.reparsed_statements = 0
+        self.reused_statements = 0
+        self.fingerprint_hits = 0
+
+    def forget(self, file_path):
+        """Drop the cached state of a file"""
+        self._files.pop(str(file_path), None)
+
+    def clear(self):
+        """Drop all cached state"""
+        self._files.clear()
+        self._units.clear()
+
+    def lint_file(self, file_path, use_listener=True, use_semantic=True):
+        """
+        Lint a file from disk, reusing its previous parse
+
+        Args:
+            file_path: Path to Python file to lint
+            use_listener: Whether to use listener-based linter
+            use_semantic: Whether to use semantic visitor linter
+
+        Returns:
+            Dictionary with results from both linters
+        """
+        try:
+            source = Path(file_path).read_bytes().decode('utf-8')
+        except Exception as e:
+            self.forget(file_path)
+            return {
+                'file': str(file_path),
+                'listener_violations': [],
+                'semantic_output': [],
+                'errors': [f"Parse error: {str(e)}"]
+            }
+        return self.lint_source(source, file_path, use_listener, use_semantic)
+
+    def lint_source(self, source, file_path, use_listener=True, use_semantic=True, cancel_check=None):
+        """
+        Lint in-memory source code, reusing the previous parse of file_path
+
+        Args:
+            source: Python source code as a string
+            file_path: Path reported in the results and used as cache key
+            use_listener: Whether to use listener-based linter
+            use_semantic: Whether to use semantic visitor linter
+            cancel_check: Optional callable polled while linting; when it
+                returns True the lint stops and LintCancelled is raised
+
+        Returns:
+            Dictionary with results from both linters
+        """
+        level = analysis_level(self.config, use_listener, use_semantic)
+        if level < LEVEL_TREE:
+            # Lines and tokens only: nothing to reparse incrementally
+            return self.runner.lint_source(source, file_path, use_listener, use_semantic, cancel_check)
+        # Only the linters whose enabled rules need the tree run on it
+        use_listener = use_listener and bool(enabled_rules(AdvancedCleanCodeListener, self.config))
+        use_semantic = use_semantic and level == LEVEL_SCOPES
+
+        key = str(file_path)
+        state = self._files.get(key)
+        if state is not None and (state.use_listener, state.use_semantic) != (use_listener, use_semantic):
+            state = None
+
+        if state is not None and state.text == source:
+            self._files.move_to_end(key)
+            return self._copy_result(state.result)
+
+        if self.runner.backend == BACKEND_AST:
+            result = self.runner.lint_source_ast(source, file_path, use_listener, use_semantic, cancel_check)
+            if result is not None:
+                return result
+
+        try:
+            statements = self._update_statements(state, source, use_listener, cancel_check)
+            result = self._assemble(key, statements, use_listener, use_semantic, cancel_check)
+        except LintCancelled:
+            raise
+        except Exception as e:
+            self.forget(key)
+            return {
+                'file': key,
+                'listener_violations': [],
+                'semantic_output': [],
+                'errors': [f"Parse error: {str(e)}"]
+            }
+
+        self._files[key] = _FileState(source, statements, use_listener, use_semantic, result)
+        self._files.move_to_end(key)
+        while len(self._files) > self.max_files:
+            self._files.popitem(last=False)
+        return self._copy_result(result)
+
+    def _copy_result(self, result):
+        return {name: list(value) if isinstance(value, list) else value for name, value in result.items()}
+
+    def _update_statements(self, state, source, use_listener, cancel_check):
+        """Return the statements of source, reparsing only the dirty region"""
+        # Lone carriage returns end lines for the lexer but not for
+        # str.count('\n'); line bookkeeping would drift, so parse everything
+        if state is None or source.count('\r') != source.count('\r\n'):
+            return self._lint_region(source, 1, use_listener, cancel_check, whole_file=True)
+
+        old = state.statements
+        # Unchanged statements at the front (they must end with a newline,
+        # otherwise the edit may have extended their last line)
+        front = 0
+        start = 0
+        while (front < len(old) and old[front].text.endswith('\n')
+               and source.startswith(old[front].text, start)):
+            start += len(old[front].text)
+            front += 1
+
+        # Unchanged statements at the back, not overlapping the front
+        back = len(old)
+        end = len(source)
+        while back > front and source.endswith(old[back - 1].text, start, end):
+            end -= len(old[back - 1].text)
+            back -= 1
+
+        # The dirty region must end at a line break so the reused statements
+        # after it still start at column 0
+        while start < end and not source.endswith('\n', start, end) and back < len(old):
+            end += len(old[back].text)
+            back += 1
+        # An indented first line continues the block of the statement before it
+        while front > 0 and _first_code_line_indented(source[start:end]):
+            front -= 1
+            start -= len(old[front].text)
+
+        if front == 0 and back == len(old):
+            return self._lint_region(source, 1, use_listener, cancel_check, whole_file=True)
+
+        first_line = 1 + sum(statement.line_count for statement in old[:front])
+        region = []
+        if start < end:
+            region = self._lint_region(source[start:end], first_line, use_listener, cancel_check)
+            if region is None:
+                return self._lint_region(source, 1, use_listener, cancel_check, whole_file=True)
+
+        self.reused_statements += front + len(old) - back
+        return old[:front] + region + old[back:]
+
+    def _lint_region(self, text, first_line, use_listener, cancel_check, whole_file=False):
+        """
+        Statements of a run of top-level statements starting at first_line,
+        reusing those whose fingerprint is cached and parsing the rest
+
+        Returns:
+            List of _Statement objects, or None if the region has lexer
+            errors and the caller should reparse the whole file
+        """
+        # Line bookkeeping drifts with lone carriage returns (see _update_statements)
+        if text.count('\r') != text.count('\r\n'):
+            return self._parse_region(text, first_line, use_listener, cancel_check, whole_file)
+        units = self._split_units(text, first_line, use_listener)
+        if not units:
+            if units is None and not whole_file:
+                return None
+            return self._parse_region(text, first_line, use_listener, cancel_check, whole_file)
+
+        statements = []
+        run = []
+        for unit in units + [None]:
+            cached = self._units.get(unit.key) if unit is not None else None
+            if cached is None and unit is not None:
+                run.append(unit)
+                continue
+            if run:
+                statements.extend(self._parse_units(run, use_listener, cancel_check))
+                run = []
+            if cached is not None:
+                self._units.move_to_end(unit.key)
+                statements.append(self._reuse(cached, unit, use_listener))
+                self.fingerprint_hits += 1
+        return statements
+
+    def _split_units(self, text, first_line, use_listener):
+        """
+        Lex a region and cut it into top-level statements
+
+        Returns:
+            List of _Unit objects covering the whole text, or None if it
+            has lexer errors
+        """
+        lexer = PythonLexer(InputStream(text))
+        lexer.line = first_line
+        lexer.removeErrorListeners()
+        error_listener = CollectingErrorListener()
+        lexer.addErrorListener(error_listener)
+        stream = CommonTokenStream(lexer)
+        stream.fill()
+        if error_listener.errors:
+            return None
+
+        # Tokens of each statement, split where a line at indentation 0
+        # starts neither a continuation clause nor the definition a
+        # decorator line belongs to
+        groups = []
+        depth = 0
+        line_start = True
+        after_decorator = False
+        for token in stream.tokens:
+            if token.channel != Token.DEFAULT_CHANNEL:
+                continue
+            if token.type == PythonLexer.NEWLINE:
+                line_start = True
+            elif token.type == PythonLexer.INDENT:
+                depth += 1
+            elif token.type == PythonLexer.DEDENT:
+                depth -= 1
+            elif token.type != Token.EOF:
+                if line_start and not depth:
+                    if not groups or (token.text not in _CONTINUATION_KEYWORDS and not after_decorator):
+                        groups.append([])
+                    after_decorator = token.text == '@'
+                elif not groups:
+                    groups.append([])
+                line_start = False
+                groups[-1].append(token)
+
+        line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+        units = []
+        for index, tokens in enumerate(groups):
+            text_start = 0 if index == 0 else line_starts[tokens[0].line - first_line]
+            text_end = line_starts[groups[index + 1][0].line - first_line] if index + 1 < len(groups) else len(text)
+            unit_text = text[text_start:text_end]
+            unit_line = first_line + text.count('\n', 0, text_start)
+            fingerprint = hashlib.blake2b(repr((
+                use_listener, unit_text.count('\n'), unit_text.endswith('\n'),
+                [(token.type, token.text, token.line - unit_line, token.column) for token in tokens
+                 if token.type not in _LAYOUT_TYPES],
+            )).encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            units.append(_Unit(unit_text, unit_line, fingerprint))
+        return units
+
+    def _parse_units(self, units, use_listener, cancel_check):
+        """Parse a run of consecutive units and cache the statements that parsed cleanly"""
+        statements = self._parse_region(''.join(unit.text for unit in units), units[0].line, use_listener,
+                                        cancel_check, whole_file=True)
+        if len(statements) == len(units):
+            for unit, statement in zip(units, statements):
+                if (statement.tree is None or statement.lexer_errors or statement.parser_errors
+                        or statement.parse_line != unit.line or statement.text != unit.text):
+                    continue
+                self._units[unit.key] = statement
+                self._units.move_to_end(unit.key)
+            while len(self._units) > self.max_units:
+                self._units.popitem(last=False)
+        return statements
+
+    def _reuse(self, cached, unit, use_listener):
+        """
+        New statement for a unit with the results of a cached one
+
+        The cached statement's tree and results keep their line numbers
+        (its parse_line); only the line rules, which also see comments and
+        whitespace, are checked again on the unit's own text.
+        """
+        statement = _Statement(unit.text, cached.parse_line, cached.tree)
+        for name in ('violations', 'listener_error', 'semantic', 'semantic_error', 'lookups', 'defines'):
+            setattr(statement, name, getattr(cached, name))
+        if use_listener:
+            try:
+                listener = AdvancedCleanCodeListener(self.config)
+                listener.check_line_length(unit.text, cached.parse_line)
+                statement.line_violations = listener.violations
+            except Exception as e:
+                statement.listener_error = f"Listener error: {str(e)}"
+        return statement
+
+    def _parse_region(self, text, first_line, use_listener, cancel_check, whole_file=False):
+        """
+        Parse a run of top-level statements starting at first_line
+
+        Returns:
+            List of _Statement objects, or None if the region has lexer
+            errors and the caller should reparse the whole file
+        """
+        lexer = PythonLexer(InputStream(text))
+        lexer.line = first_line
+        lexer.removeErrorListeners()
+        lex_error_listener = CollectingErrorListener()
+        lexer.addErrorListener(lex_error_listener)
+        parser = PythonParser(CommonTokenStream(lexer))
+        parser.removeErrorListeners()
+        parse_error_listener = CollectingErrorListener()
+        parser.addErrorListener(parse_error_listener)
+        if cancel_check is not None:
+            parser.addParseListener(_CancelCheckListener(cancel_check))
+
+        tree = parser.file_input()
+        if lex_error_listener.errors and not whole_file:
+            return None
+        if cancel_check is not None and cancel_check():
+            raise LintCancelled()
+
+        # Keep a detached copy of the tree, cut at the top-level statements
+        compact = CompactTree.from_parse_tree(tree, parser.getTokenStream().tokens, _KEEP_RULES)
+        statement_nodes = []
+        for child in compact.children(0):
+            if compact.rule[child] == PythonParser.RULE_statements:
+                statement_nodes = [node for node in compact.children(child)
+                                   if compact.rule[node] == PythonParser.RULE_statement]
+        line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+
+        statements = []
+        for index, node in enumerate(statement_nodes):
+            text_start = 0 if index == 0 else line_starts[compact.lines[compact.first[node]] - first_line]
+            if index + 1 < len(statement_nodes):
+                text_end = line_starts[compact.lines[compact.first[statement_nodes[index + 1]]] - first_line]
+            else:
+                text_end = len(text)
+            start_line = first_line + text.count('\n', 0, text_start)
+            statements.append(_Statement(text[text_start:text_end], start_line, compact.view(node)))
+        if not statements:
+            statements.append(_Statement(text, first_line, None))
+
+        # Attribute syntax errors to the statement whose lines contain them
+        starts = [statement.parse_line for statement in statements]
+        for messages, attribute in ((lex_error_listener.errors, 'lexer_errors'),
+                                    (parse_error_listener.errors, 'parser_errors')):
+            for message in messages:
+                line = issue_line('errors', message) or first_line
+                index = max(0, sum(1 for start in starts if start <= line) - 1)
+                getattr(statements[index], attribute).append(message)
+
+        if use_listener:
+            for statement in statements:
+                try:
+                    listener = AdvancedCleanCodeListener(self.config)
+                    listener.check_line_length(statement.text, statement.parse_line)
+                    statement.line_violations = listener.violations
+                    listener.violations = []
+                    if statement.tree is not None:
+                        compact.walk(listener, statement.tree.node)
+                    statement.violations = listener.violations
+                except Exception as e:
+                    statement.listener_error = f"Listener error: {str(e)}"
+
+        self.reparsed_statements += len(statement_nodes)
+        return statements
+
+    def _assemble(self, file_path, statements, use_listener, use_semantic, cancel_check):
+        """Combine per-statement results into a LinterRunner-style result"""
+        results = {
+            'file': file_path,
+            'listener_violations': [],
+            'semantic_output': [],
+            'errors': []
+        }
+        visitor = None
+        scope = None
+        if use_semantic:
+            visitor = MySemanticVisitor(self.config)
+            scope = _GlobalScope(visitor.global_scope.symbols)
+            visitor.global_scope = scope
+
+        semantic_parts = []
+        line_violations = []
+        listener_errors, semantic_errors, lexer_errors, parser_errors = [], [], [], []
+        line = 1
+        for statement in statements:
+            delta = line - statement.parse_line
+            line += statement.line_count
+
+            if use_listener:
+                line_violations.extend(_shift_lines(v, delta) for v in statement.line_violations)
+                results['listener_violations'].extend(_shift_lines(v, delta) for v in statement.violations)
+                if statement.listener_error:
+                    listener_errors.append(statement.listener_error)
+            lexer_errors.extend(_shift_lines(e, delta) for e in statement.lexer_errors)
+            parser_errors.extend(_shift_lines(e, delta) for e in statement.parser_errors)
+
+            if not use_semantic or statement.tree is None:
+                continue
+            stale = statement.semantic is None or any(
+                (name in scope.symbols) != found for name, found in statement.lookups.items()
+            )
+            if stale:
+                if cancel_check is not None and cancel_check():
+                    raise LintCancelled()
+                self._visit_statement(visitor, scope, statement)
+            else:
+                scope.symbols |= statement.defines
+            semantic_parts.append(_shift_lines(statement.semantic, delta))
+            if statement.semantic_error:
+                semantic_errors.append(statement.semantic_error)
+
+        # Line rules are reported ahead of all tree rules, as in a whole-file lint
+        results['listener_violations'][:0] = line_violations
+
+        semantic_output = ''.join(semantic_parts)
+        if semantic_output:
+            results['semantic_output'] = semantic_output.strip().split('\n')
+
+        results['errors'].extend(listener_errors)
+        results['errors'].extend(semantic_errors)
+        if self.config.get('parser_errors_enabled', True):
+            results['errors'].extend(f"Lexer: {msg}" for msg in lexer_errors)
+            results['errors'].extend(f"Parser: {msg}" for msg in parser_errors)
+        return results
+
+    def _visit_statement(self, visitor, scope, statement):
+        """Run the semantic visitor on one cached statement subtree"""
+        scope.begin_statement()
+        visitor.current_scope = scope
+        output = io.StringIO()
+        statement.semantic_error = None
+        try:
+            with redirect_stdout(output):
+                visitor.visit(statement.tree)
+        except Exception as e:
+            statement.semantic_error = f"Semantic visitor error: {str(e)}"
+        statement.semantic = output.getvalue()
+        statement.lookups = scope.lookups
+        statement.defines = scope.defines
+        scope.lookups = None
+        scope.defines = None
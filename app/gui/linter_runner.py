@@ -2,8 +2,14 @@
 Linter Runner Module
 Handles running both listener and semantic visitor linters on Python files
 """
+import ast
+import io
 import sys
 import os
+import time
+import tokenize
+import warnings
+from contextlib import contextmanager, nullcontext, redirect_stdout
 from pathlib import Path
 from antlr4 import *
 
@@ -13,24 +19,214 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'linter'))
 
 from generated.PythonLexer import PythonLexer
 from generated.PythonParser import PythonParser
-from antlr4.tree.Tree import ParseTreeWalker
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.tree.Tree import ParseTreeListener
 from linter.MyListener import AdvancedCleanCodeListener
 from linter.MySemanticVisitor import MySemanticVisitor
+from linter.ast_backend import AST_BACKEND_SUPPORTED, AstCleanCodeListener, AstSemanticVisitor, SourceTokens
+from linter.compact_tree import CompactTree, handled_rules
+from linter.rule_levels import LEVEL_LINES, LEVEL_NAMES, LEVEL_SCOPES, LEVEL_TOKENS, enabled_rules, required_level
+from linter.token_rules import TokenCleanCodeListener, antlr_tokens, python_tokens
+
+from gui.gc_batch import PAUSES, GcBatch, record_gc
+from gui.parse_cache import ParseCache
 
 # Custom Error Listener to capture lexer/parser errors
 from linter.error_listener import CollectingErrorListener
+from linter.rule_profiler import profile_rules
+
+# Phases timed for every linted file, in execution order
+PHASES = ('read', 'lex', 'parse', 'listener', 'semantic')
+
+# Parse tree backends: ANTLR lints any input, ast (much faster) only what
+# CPython accepts and falls back to ANTLR for everything else
+BACKEND_ANTLR = 'antlr'
+BACKEND_AST = 'ast'
+BACKENDS = (BACKEND_ANTLR, BACKEND_AST)
+
+# Rules entered between two calls of a lint's cancel check
+CANCEL_CHECK_INTERVAL = 256
+
+# Rules the linters look at, kept when parse trees are compacted
+COMPACT_RULES = handled_rules(AdvancedCleanCodeListener, MySemanticVisitor)
+
+def record_phase(metrics, phase, start):
+    """
+    Record a phase that started at the given perf_counter() time
+
+    Adds its duration to the metrics' timings and, when the metrics carry
+    a 'spans' list (tracing), a (phase, start, end, pid) span.
+
+    Returns:
+        End time of the phase
+    """
+    end = time.perf_counter()
+    metrics['timings'][phase] = metrics['timings'].get(phase, 0.0) + end - start
+    spans = metrics.get('spans')
+    if spans is not None:
+        spans.append((phase, start, end, os.getpid()))
+    return end
+
+def analysis_level(config, use_listener=True, use_semantic=True):
+    """
+    Deepest analysis level (linter.rule_levels) needed by the rules the
+    config enables in the linters that will run
+    """
+    linters = [linter for linter, used in ((AdvancedCleanCodeListener, use_listener),
+                                           (MySemanticVisitor, use_semantic)) if used]
+    return required_level(linters, config)
+
+def count_parse_tree_nodes(tree):
+    """Count rule and terminal nodes in a parse tree"""
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        children = getattr(node, 'children', None)
+        if children:
+            stack.extend(children)
+    return count
+
+class LintCancelled(Exception):
+    """Raised inside a lint when its cancel check asks it to stop"""
+
+class _CancelCheckListener(ParseTreeListener):
+    """Parse listener that aborts parsing once a cancel check returns True"""
+    
+    def __init__(self, cancel_check):
+        self.cancel_check = cancel_check
+        self.rules_entered = 0
+    
+    def enterEveryRule(self, ctx):
+        self.rules_entered += 1
+        if self.rules_entered % CANCEL_CHECK_INTERVAL == 0 and self.cancel_check():
+            raise LintCancelled()
+
+class _ParserPair:
+    """
+    A PythonLexer, token stream and PythonParser wired together once and
+    pointed at a new input for every lint
+    
+    The parser is only built the first time a lint needs a tree, so
+    token- and line-level lints never construct one.
+    """
+    
+    def __init__(self):
+        self.lexer = PythonLexer(InputStream(''))
+        self.stream = CommonTokenStream(self.lexer)
+        self.parser = None
+        self.lex_errors = CollectingErrorListener()
+        self.parse_errors = CollectingErrorListener()
+        self.collecting = False
+    
+    def reset(self, input_stream, collect_errors):
+        """
+        Point the pair at an input, dropping all state left by the last one
+        
+        Args:
+            input_stream: ANTLR input stream to lex and parse
+            collect_errors: Collect syntax errors in lex_errors and
+                parse_errors instead of printing them to stderr
+        """
+        if collect_errors != self.collecting:
+            self.collecting = collect_errors
+            self._route_errors(self.lexer, self.lex_errors)
+            if self.parser is not None:
+                self._route_errors(self.parser, self.parse_errors)
+        self.lex_errors.errors = []
+        self.parse_errors.errors = []
+        # Resets the lexer, including the indentation and f-string state of PythonLexerBase
+        self.lexer.inputStream = input_stream
+        self.stream.setTokenSource(self.lexer)
+        if self.parser is not None:
+            # Resets the parser's context, error recovery and prediction state
+            self.parser.setInputStream(self.stream)
+    
+    def _route_errors(self, recognizer, listener):
+        """Send a recognizer's syntax errors to listener, or to stderr when not collecting"""
+        recognizer.removeErrorListeners()
+        recognizer.addErrorListener(listener if self.collecting else ConsoleErrorListener.INSTANCE)
+    
+    def get_parser(self):
+        """The pair's PythonParser over its token stream, built on first use"""
+        if self.parser is None:
+            self.parser = PythonParser(self.stream)
+            self._route_errors(self.parser, self.parse_errors)
+        return self.parser
+    
+    def release(self):
+        """Drop everything that refers to the last input's tokens and parse tree"""
+        self.stream.setTokenSource(self.lexer)
+        if self.parser is None:
+            return
+        self.parser.removeParseListeners()
+        # Contexts kept by the error strategy's and the prediction's sync
+        # state would otherwise hold the whole tree until the next lint
+        self.parser._errHandler.nextTokensContext = None
+        self.parser._interp._outerContext = None
+
+class ParserPool:
+    """
+    Lexer/parser pairs reused across the files a runner lints
+    
+    Each lint takes a pair and gives it back when done, so lints running
+    concurrently on one runner (daemon threads) never share one.
+    """
+    
+    def __init__(self):
+        self._free = []
+        self.created = 0
+    
+    @contextmanager
+    def pair(self, input_stream, collect_errors):
+        """Context manager yielding a _ParserPair reset for input_stream"""
+        try:
+            pair = self._free.pop()
+        except IndexError:
+            pair = _ParserPair()
+            self.created += 1
+        pair.reset(input_stream, collect_errors)
+        try:
+            yield pair
+        finally:
+            pair.release()
+            self._free.append(pair)
 
 class LinterRunner:
     """Runs linter checks on Python files"""
     
-    def __init__(self, config):
+    def __init__(self, config, profile_rules=False, trace=False, gc_batch=False, parse_cache=None):
         """
         Initialize linter runner
         
         Args:
             config: Configuration dictionary for linter rules
+            profile_rules: Attribute time and call counts to each rule check
+                in the 'rules' entry of every result's metrics
+            trace: Record (name, start, end, pid) spans of every phase in
+                the 'spans' entry of the metrics, for trace_export
+            gc_batch: Run lint_file with the collector tuned for batches
+                (see gc_batch.GcBatch)
+            parse_cache: Folder of an on-disk cache of the token tables and
+                compact trees of ANTLR lints (see parse_cache.ParseCache),
+                or None to lex and parse every time; used while parser
+                errors are collected
+        
+        The config's 'backend' (BACKENDS) picks the parser; the backend
+        that linted a file is stored in its metrics. The ast backend needs
+        Python 3.8+, older interpreters always use ANTLR.
         """
         self.config = config
+        self.backend = config.get('backend', BACKEND_ANTLR)
+        if not AST_BACKEND_SUPPORTED:
+            self.backend = BACKEND_ANTLR
+        self.profile_rules = profile_rules
+        self.trace = trace
+        self.parsers = ParserPool()
+        self.gc_batch = GcBatch() if gc_batch else None
+        self.parse_cache = ParseCache(parse_cache, COMPACT_RULES) if parse_cache else None
+        PAUSES.install()
     
     def find_python_files(self, path, exclude_patterns):
         """
@@ -93,76 +289,336 @@ class LinterRunner:
         Returns:
             Dictionary with results from both linters
         """
-        results = {
+        gc_before = PAUSES.snapshot()
+        with self.gc_batch.lint() if self.gc_batch is not None else nullcontext():
+            results = self._lint_file(file_path, use_listener, use_semantic)
+        if 'metrics' in results:
+            record_gc(results['metrics'], gc_before)
+        return results
+    
+    def _lint_file(self, file_path, use_listener, use_semantic):
+        """Read and lint a file (lint_file without the collector handling)"""
+        results = self._empty_result(file_path)
+        
+        start = time.perf_counter()
+        try:
+            if self.backend == BACKEND_AST:
+                # Decoded as FileStream does, without building its code point list
+                source = Path(file_path).read_bytes().decode('utf-8')
+            else:
+                input_stream = FileStream(str(file_path), encoding='utf-8')
+        except Exception as e:
+            results['errors'].append(f"Parse error: {str(e)}")
+            return results
+        
+        if self.backend == BACKEND_AST:
+            return self._lint_text(source, results, use_listener, use_semantic, read_start=start)
+        return self._lint_stream(input_stream, results, use_listener, use_semantic, read_start=start)
+    
+    def lint_source(self, source, file_path, use_listener=True, use_semantic=True, cancel_check=None):
+        """
+        Run linter on in-memory source code
+        
+        Args:
+            source: Python source code as a string
+            file_path: Path reported in the results
+            use_listener: Whether to use listener-based linter
+            use_semantic: Whether to use semantic visitor linter
+            cancel_check: Optional callable polled while linting; when it
+                returns True the lint stops and LintCancelled is raised
+            
+        Returns:
+            Dictionary with results from both linters
+        """
+        results = self._empty_result(file_path)
+        gc_before = PAUSES.snapshot()
+        if self.backend == BACKEND_AST:
+            self._lint_text(source, results, use_listener, use_semantic, cancel_check)
+        else:
+            self._lint_stream(InputStream(source), results, use_listener, use_semantic, cancel_check)
+        record_gc(results['metrics'], gc_before)
+        return results
+    
+    def lint_source_ast(self, source, file_path, use_listener=True, use_semantic=True, cancel_check=None):
+        """
+        Run linter on in-memory source code with the ast backend only
+        
+        Returns:
+            Dictionary with results from both linters, or None when CPython
+            rejects the source (see _lint_ast) and it has to be linted with
+            ANTLR some other way
+        """
+        results = self._empty_result(file_path)
+        gc_before = PAUSES.snapshot()
+        metrics = self._start_metrics(results, None)
+        if not self._lint_ast(source, results, metrics, use_listener, use_semantic, cancel_check):
+            return None
+        record_gc(metrics, gc_before)
+        return results
+    
+    def _empty_result(self, file_path):
+        """Create an empty results dictionary for a file"""
+        return {
             'file': str(file_path),
             'listener_violations': [],
             'semantic_output': [],
             'errors': []
         }
+    
+    def _start_metrics(self, results, read_start):
+        """
+        Add a 'metrics' entry to the results
         
+        It holds the seconds spent in each phase (read, lex, parse,
+        listener, semantic), the number of tokens and parse tree nodes, the
+        backend used and the analysis level reached (LEVEL_NAMES). ANTLR
+        lints add the compact tree's node count and, with a parse cache,
+        whether it had the source ('parse_cache': 'hit' or 'miss').
+        read_start is the perf_counter() time the input started being read,
+        if it was read from disk.
+        """
+        metrics = {'timings': dict.fromkeys(PHASES, 0.0), 'tokens': 0, 'nodes': 0, 'backend': BACKEND_ANTLR}
+        if self.profile_rules:
+            metrics['rules'] = {}
+        if self.trace:
+            metrics['spans'] = []
+        results['metrics'] = metrics
+        if read_start is not None:
+            record_phase(metrics, 'read', read_start)
+        return metrics
+    
+    def _lint_stream(self, input_stream, results, use_listener, use_semantic, cancel_check=None, read_start=None):
+        """Lex, parse and run the enabled linters on an input stream with ANTLR"""
+        lint_start = read_start if read_start is not None else time.perf_counter()
+        metrics = self._start_metrics(results, read_start)
+        self._lint_antlr(input_stream, results, metrics, use_listener, use_semantic, cancel_check)
+        if self.trace:
+            metrics['spans'].append(('file', lint_start, time.perf_counter(), os.getpid()))
+        return results
+    
+    def _lint_text(self, source, results, use_listener, use_semantic, cancel_check=None, read_start=None):
+        """Lint source code with the ast backend, falling back to ANTLR where CPython rejects it"""
+        lint_start = read_start if read_start is not None else time.perf_counter()
+        metrics = self._start_metrics(results, read_start)
+        if not self._lint_ast(source, results, metrics, use_listener, use_semantic, cancel_check):
+            self._lint_antlr(InputStream(source), results, metrics, use_listener, use_semantic, cancel_check)
+        if self.trace:
+            metrics['spans'].append(('file', lint_start, time.perf_counter(), os.getpid()))
+        return results
+    
+    def _run_listener(self, make_listener, source, walk, results, metrics):
+        """
+        Run a clean-code listener: its line rules on the source text, then
+        walk(listener) for the rules that need tokens or a tree
+        """
+        start = time.perf_counter()
         try:
-            # Parse the file
-            input_stream = FileStream(str(file_path), encoding='utf-8')
-            lexer = PythonLexer(input_stream)
-            # Conditionally attach custom error listener to lexer
-            lex_error_listener = None
-            if self.config.get('parser_errors_enabled', True):
-                lexer.removeErrorListeners()
-                lex_error_listener = CollectingErrorListener()
-                lexer.addErrorListener(lex_error_listener)
-            stream = CommonTokenStream(lexer)
-            parser = PythonParser(stream)
-            
-            # Conditionally attach custom error listener to parser
-            parse_error_listener = None
-            if self.config.get('parser_errors_enabled', True):
-                parser.removeErrorListeners()
-                parse_error_listener = CollectingErrorListener()
-                parser.addErrorListener(parse_error_listener)
+            listener = make_listener()
+            if self.profile_rules:
+                profile_rules(listener, metrics['rules'])
+            listener.check_line_length(source)
+            if walk is not None:
+                walk(listener)
+            results['listener_violations'] = listener.violations
+        except Exception as e:
+            results['errors'].append(f"Listener error: {str(e)}")
+        record_phase(metrics, 'listener', start)
+    
+    def _run_visitor(self, make_visitor, tree, results, metrics):
+        """Run a semantic visitor on a tree, collecting the issues it prints"""
+        start = time.perf_counter()
+        try:
+            # Capture print output from semantic visitor
+            f = io.StringIO()
+            with redirect_stdout(f):
+                visitor = make_visitor()
+                if self.profile_rules:
+                    profile_rules(visitor, metrics['rules'])
+                visitor.visit(tree)
             
-            # Parse the file
-            tree = parser.file_input()
+            semantic_output = f.getvalue()
+            if semantic_output:
+                results['semantic_output'] = semantic_output.strip().split('\n')
+        except Exception as e:
+            results['errors'].append(f"Semantic visitor error: {str(e)}")
+        record_phase(metrics, 'semantic', start)
+    
+    def _lint_ast(self, source, results, metrics, use_listener, use_semantic, cancel_check=None):
+        """
+        Parse with CPython's ast module and run the enabled linters on it
+        
+        Only goes as far as the enabled rules need: no tokenizing for
+        line rules alone, and no ast.parse for token rules.
+        
+        Returns:
+            False when CPython rejects the source, or when it has lone
+            carriage returns (which end lines for ast but not for the
+            ANTLR lexer); the results are then left for the ANTLR backend,
+            while the time spent trying stays in the timings
+        """
+        level = analysis_level(self.config, use_listener, use_semantic)
+        run_listener = use_listener and enabled_rules(AdvancedCleanCodeListener, self.config)
+        if level == LEVEL_LINES:
+            metrics['backend'] = BACKEND_AST
+            metrics['level'] = LEVEL_NAMES[level]
+            if run_listener:
+                self._run_listener(lambda: AdvancedCleanCodeListener(self.config), source, None, results, metrics)
+            return True
+        if source.count('\r') != source.count('\r\n'):
+            return False
+        
+        if level == LEVEL_TOKENS:
+            start = time.perf_counter()
+            try:
+                tokens = python_tokens(source)
+            except (SyntaxError, tokenize.TokenError):
+                record_phase(metrics, 'lex', start)
+                return False
+            record_phase(metrics, 'lex', start)
+            metrics['backend'] = BACKEND_AST
+            metrics['level'] = LEVEL_NAMES[level]
+            metrics['tokens'] = len(tokens)
+            self._run_listener(lambda: TokenCleanCodeListener(self.config), source,
+                               lambda listener: listener.walk_tokens(tokens), results, metrics)
+            return True
+        
+        start = time.perf_counter()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')  # invalid escape sequences and the like
+                tree = ast.parse(source)
+        except (SyntaxError, ValueError, RecursionError, MemoryError):
+            record_phase(metrics, 'parse', start)
+            return False
+        record_phase(metrics, 'parse', start)
+        start = time.perf_counter()
+        try:
+            source_tokens = SourceTokens(source)
+        except (SyntaxError, tokenize.TokenError):
+            record_phase(metrics, 'lex', start)
+            return False
+        record_phase(metrics, 'lex', start)
+        metrics['backend'] = BACKEND_AST
+        metrics['level'] = LEVEL_NAMES[level]
+        metrics['tokens'] = len(source_tokens)
+        metrics['nodes'] = sum(1 for _ in ast.walk(tree))
+        
+        if cancel_check is not None and cancel_check():
+            raise LintCancelled()
+        
+        if run_listener:
+            self._run_listener(lambda: AstCleanCodeListener(self.config, source_tokens), source,
+                               lambda listener: listener.walk(tree), results, metrics)
+        
+        if cancel_check is not None and cancel_check():
+            raise LintCancelled()
+        
+        if level == LEVEL_SCOPES:
+            self._run_visitor(lambda: AstSemanticVisitor(self.config, source_tokens), tree, results, metrics)
+        return True
+    
+    def _lint_antlr(self, input_stream, results, metrics, use_listener, use_semantic, cancel_check=None):
+        """
+        Lex and parse an input stream with ANTLR and run the enabled linters
+        
+        Stops at the level the enabled rules need: line rules alone are run
+        without lexing and token rules without parsing, so parser errors are
+        only reported when some enabled rule needs the tree.
+        """
+        level = analysis_level(self.config, use_listener, use_semantic)
+        metrics['level'] = LEVEL_NAMES[level]
+        run_listener = use_listener and enabled_rules(AdvancedCleanCodeListener, self.config)
+        source = input_stream.strdata
+        if level == LEVEL_LINES:
+            if run_listener:
+                self._run_listener(lambda: AdvancedCleanCodeListener(self.config), source, None, results, metrics)
+            return
+        collect_errors = self.config.get('parser_errors_enabled', True)
+        # Cached entries replay the collected syntax errors
+        cache = self.parse_cache if collect_errors else None
+        try:
+            entry = None
+            if cache is not None:
+                start = time.perf_counter()
+                key = cache.key(source)
+                entry = cache.load(key, need_tree=level > LEVEL_TOKENS)
+                record_phase(metrics, 'lex' if level == LEVEL_TOKENS else 'parse', start)
+                metrics['parse_cache'] = 'miss' if entry is None else 'hit'
+            if entry is None:
+                tree, errors = self._parse_antlr(input_stream, level, collect_errors, metrics, cancel_check)
+                if cache is not None:
+                    cache.store(key, tree, errors)
+            else:
+                tree, errors = entry
+            metrics['tokens'] = tree.stream_tokens
             
-            # Run listener-based linter
-            if use_listener:
-                try:
-                    listener = AdvancedCleanCodeListener(self.config)
-                    walker = ParseTreeWalker()
-                    walker.walk(listener, tree)
-                    results['listener_violations'] = listener.violations
-                except Exception as e:
-                    results['errors'].append(f"Listener error: {str(e)}")
+            if level == LEVEL_TOKENS:
+                self._run_listener(lambda: TokenCleanCodeListener(self.config), source,
+                                   lambda listener: listener.walk_tokens(antlr_tokens(tree.tokens())),
+                                   results, metrics)
+            else:
+                metrics['nodes'] = tree.parse_nodes
+                metrics['compact_nodes'] = len(tree)
+                
+                if cancel_check is not None and cancel_check():
+                    raise LintCancelled()
+                
+                # Run listener-based linter
+                if run_listener:
+                    self._run_listener(lambda: AdvancedCleanCodeListener(self.config), source,
+                                       lambda listener: tree.walk(listener),
+                                       results, metrics)
+                
+                if cancel_check is not None and cancel_check():
+                    raise LintCancelled()
+                
+                # Run semantic visitor linter
+                if level == LEVEL_SCOPES:
+                    self._run_visitor(lambda: MySemanticVisitor(self.config), tree.root(), results, metrics)
             
-            # Run semantic visitor linter
-            if use_semantic:
-                try:
-                    # Capture print output from semantic visitor
-                    import io
-                    from contextlib import redirect_stdout
-                    
-                    f = io.StringIO()
-                    with redirect_stdout(f):
-                        visitor = MySemanticVisitor(self.config)
-                        visitor.visit(tree)
-                    
-                    semantic_output = f.getvalue()
-                    if semantic_output:
-                        results['semantic_output'] = semantic_output.strip().split('\n')
-                except Exception as e:
-                    results['errors'].append(f"Semantic visitor error: {str(e)}")
-        
-            # Merge any lexer/parser syntax errors collected
-            if lex_error_listener and lex_error_listener.errors:
-                results['errors'].extend([f"Lexer: {msg}" for msg in lex_error_listener.errors])
-            if parse_error_listener and parse_error_listener.errors:
-                results['errors'].extend([f"Parser: {msg}" for msg in parse_error_listener.errors])
+            # Merge any lexer/parser syntax errors collected (a cached tree
+            # has parser errors that a token-level lint does not report)
+            if collect_errors:
+                results['errors'].extend([f"Lexer: {msg}" for msg in errors['lexer']])
+                if level > LEVEL_TOKENS:
+                    results['errors'].extend([f"Parser: {msg}" for msg in errors['parser']])
 
+        except LintCancelled:
+            raise
         except Exception as e:
             results['errors'].append(f"Parse error: {str(e)}")
+    
+    def _parse_antlr(self, input_stream, level, collect_errors, metrics, cancel_check=None):
+        """
+        Lex an input stream, and parse it when the level needs a tree
         
-        return results
+        Returns:
+            (CompactTree, errors): the tree has only the token table below
+            LEVEL_TREE, and errors are the collected syntax errors as
+            {'lexer': [...], 'parser': [...]}
+        """
+        with self.parsers.pair(input_stream, collect_errors) as pair:
+            stream = pair.stream
+            # Lex everything up front so lexing and parsing are timed separately
+            start = time.perf_counter()
+            stream.fill()
+            record_phase(metrics, 'lex', start)
+            
+            if level == LEVEL_TOKENS:
+                tree = CompactTree.from_tokens(stream.tokens)
+            else:
+                parser = pair.get_parser()
+                if cancel_check is not None:
+                    parser.addParseListener(_CancelCheckListener(cancel_check))
+                
+                # Parse the file and keep only a compact copy of the tree
+                start = time.perf_counter()
+                tree = CompactTree.from_parse_tree(parser.file_input(), stream.tokens, COMPACT_RULES)
+                record_phase(metrics, 'parse', start)
+            return tree, {'lexer': pair.lex_errors.errors, 'parser': pair.parse_errors.errors}
     
-    def lint_files(self, file_paths, use_listener=True, use_semantic=True, progress_callback=None):
+    def lint_files(self, file_paths, use_listener=True, use_semantic=True, progress_callback=None,
+                   result_callback=None):
         """
         Run linter on multiple files
         
@@ -171,6 +627,7 @@ class LinterRunner:
             use_listener: Whether to use listener-based linter
             use_semantic: Whether to use semantic visitor linter
             progress_callback: Optional callback function(current, total, filename)
+            result_callback: Optional callback function(result) called as each file finishes
             
         Returns:
             List of results dictionaries
@@ -184,6 +641,8 @@ class LinterRunner:
             
             result = self.lint_file(file_path, use_listener, use_semantic)
             all_results.append(result)
+            if result_callback:
+                result_callback(result)
         
         return all_results
     
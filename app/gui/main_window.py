@@ -4,22 +4,39 @@ Modern PyQt6 interface for code linting
 """
 import sys
 import os
+import time
+from bisect import bisect_right
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTextEdit, QLabel, QFileDialog, QProgressBar, QMessageBox,
     QGroupBox, QCheckBox, QListWidget, QListWidgetItem, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QFrame, QGridLayout
+    QTreeView, QFrame, QGridLayout, QLineEdit
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QSize
+from PyQt6.QtGui import QFont, QIcon, QPalette
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from gui.config_manager import ConfigManager
 from gui.linter_runner import LinterRunner
+from gui.incremental_linter import IncrementalLinter
+from gui.run_metrics import RunMetrics
 from gui.config_dialog import ConfigDialog
+from gui.file_watcher import FileWatcher
+from gui.result_store import ResultStore, RULE_CATEGORIES
+from gui.search_index import SearchIndex
+from gui.results_model import ResultsTreeModel, ResultsFilterProxyModel, CATEGORY_LABELS
+
+# Above this many files the results tree starts collapsed
+AUTO_EXPAND_FILE_LIMIT = 50
+
+# Delay between the last keystroke in the search box and running the query
+SEARCH_DEBOUNCE_MS = 200
+
+# How often the watch thread checks whether it was asked to stop
+WATCH_STOP_CHECK_SECONDS = 0.25
 
 class ClickableStatWidget(QGroupBox):
     """Custom QGroupBox that emits a signal when clicked"""
@@ -38,6 +55,7 @@ class LinterThread(QThread):
     """Thread for running linter without blocking UI"""
     
     progress = pyqtSignal(int, int, str)  # current, total, filename
+    result_ready = pyqtSignal(dict)  # result of a single file
     finished = pyqtSignal(str, list)  # results text, results data
     error = pyqtSignal(str)  # error message
     
@@ -55,13 +73,55 @@ class LinterThread(QThread):
                 self.file_paths,
                 self.use_listener,
                 self.use_semantic,
-                progress_callback=self.progress.emit
+                progress_callback=self.progress.emit,
+                result_callback=self.result_ready.emit
             )
             formatted = self.linter_runner.format_results(results)
             self.finished.emit(formatted, results)
         except Exception as e:
             self.error.emit(str(e))
 
+class WatchThread(QThread):
+    """Thread that re-lints watched files as they change on disk"""
+    
+    result_ready = pyqtSignal(dict)  # result of a re-linted file
+    file_removed = pyqtSignal(str)  # path of a deleted file
+    relinted = pyqtSignal(int, float)  # files re-linted, elapsed milliseconds
+    
+    def __init__(self, linter_runner, roots, exclude_patterns, use_listener, use_semantic):
+        super().__init__()
+        self.linter_runner = linter_runner
+        # Saved files usually differ in a few statements; reparse only those
+        self.incremental = IncrementalLinter(linter_runner.config)
+        self.roots = roots
+        self.exclude_patterns = exclude_patterns
+        self.use_listener = use_listener
+        self.use_semantic = use_semantic
+    
+    def run(self):
+        """Wait for changes and re-lint only the changed files"""
+        watcher = FileWatcher(
+            self.roots,
+            should_watch=lambda path: not self.linter_runner._should_exclude(path, self.exclude_patterns)
+        )
+        try:
+            while not self.isInterruptionRequested():
+                changed, deleted = watcher.wait(timeout=WATCH_STOP_CHECK_SECONDS)
+                if not changed and not deleted:
+                    continue
+                
+                start = time.perf_counter()
+                for path in sorted(changed):
+                    self.result_ready.emit(
+                        self.incremental.lint_file(path, self.use_listener, self.use_semantic)
+                    )
+                for path in deleted:
+                    self.incremental.forget(path)
+                    self.file_removed.emit(str(path))
+                self.relinted.emit(len(changed), (time.perf_counter() - start) * 1000)
+        finally:
+            watcher.close()
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -70,8 +130,10 @@ class MainWindow(QMainWindow):
         self.config_manager = ConfigManager()
         self.linter_runner = LinterRunner(self.config_manager.get_config())
         self.selected_paths = []
+        self.selected_roots = []  # Folders added recursively (watched for new files)
         self.linter_thread = None
-        self.current_results_data = []  # Store raw results for filtering
+        self.watch_thread = None
+        self.result_store = ResultStore(SearchIndex())  # Indexed results for statistics, filtering and search
         self.current_filter = "all"  # Track current filter
         
         self.init_ui()
@@ -149,6 +211,10 @@ class MainWindow(QMainWindow):
         self.semantic_check.setChecked(True)
         options_layout.addWidget(self.semantic_check)
         
+        self.watch_check = QCheckBox("Watch for changes (re-lint on save)")
+        self.watch_check.toggled.connect(self.toggle_watch)
+        options_layout.addWidget(self.watch_check)
+        
         options_group.setLayout(options_layout)
         left_layout.addWidget(options_group)
         
@@ -197,16 +263,48 @@ class MainWindow(QMainWindow):
         stats_layout.addWidget(self.stat_semantic, 0, 2)
         stats_layout.addWidget(self.stat_errors, 0, 3)
         
+        # Per-category breakdown of listener violations
+        category_layout = QHBoxLayout()
+        self.stat_categories = {}
+        for category in RULE_CATEGORIES:
+            if category == 'Other':
+                continue
+            icon, label = CATEGORY_LABELS[category].split(' ', 1)
+            widget = self.create_stat_widget(icon, label, "0", category)
+            self.stat_categories[category] = (widget, icon)
+            category_layout.addWidget(widget)
+        stats_layout.addLayout(category_layout, 1, 0, 1, 4)
+        
         right_layout.addWidget(stats_frame)
         
-        # Results tree
-        self.results_tree = QTreeWidget()
-        self.results_tree.setHeaderLabels(["Issue Type", "Location", "Description"])
+        # Search box (debounced, backed by the result store's search index)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("🔎 Search issues by function, module, file or message (use name* for prefixes)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        right_layout.addWidget(self.search_edit)
+        
+        # Results tree (model/view, issue rows are fetched lazily)
+        self.results_model = ResultsTreeModel(self.result_store, self)
+        self.results_proxy = ResultsFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        
+        self.results_tree = QTreeView()
+        self.results_tree.setModel(self.results_proxy)
+        self.results_tree.setUniformRowHeights(True)
         self.results_tree.setColumnWidth(0, 150)
         self.results_tree.setColumnWidth(1, 100)
         self.results_tree.setAlternatingRowColors(True)
         right_layout.addWidget(self.results_tree)
         
+        self.empty_label = QLabel()
+        self.empty_label.setVisible(False)
+        right_layout.addWidget(self.empty_label)
+        
         splitter.addWidget(right_panel)
         
         # Set splitter sizes (40% left, 60% right)
@@ -219,7 +317,9 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
         
-        # Status bar
+        # Status bar, with the phase timings of the last run kept on the right
+        self.timing_label = QLabel()
+        self.statusBar().addPermanentWidget(self.timing_label)
         self.statusBar().showMessage("Ready")
     
     def apply_modern_style(self):
@@ -273,20 +373,17 @@ class MainWindow(QMainWindow):
         
         return widget
     
-    def update_statistics(self, results_data):
-        """Update statistics panel with results data"""
-        total_files = len(results_data)
-        total_violations = sum(len(r['listener_violations']) for r in results_data)
-        total_semantic = sum(len([line for line in r['semantic_output'] 
-                                   if '❌' in line or 'ERROR' in line]) 
-                             for r in results_data)
-        total_errors = sum(len(r['errors']) for r in results_data)
+    def update_statistics(self):
+        """Update statistics panel from the result store counters"""
+        store = self.result_store
         
         # Update stat widgets
-        self.update_stat_value(self.stat_files, "📁", total_files)
-        self.update_stat_value(self.stat_violations, "⚠️", total_violations)
-        self.update_stat_value(self.stat_semantic, "🔍", total_semantic)
-        self.update_stat_value(self.stat_errors, "❌", total_errors)
+        self.update_stat_value(self.stat_files, "📁", store.file_count())
+        self.update_stat_value(self.stat_violations, "⚠️", store.kind_count('violations'))
+        self.update_stat_value(self.stat_semantic, "🔍", store.kind_count('semantic'))
+        self.update_stat_value(self.stat_errors, "❌", store.kind_count('errors'))
+        for category, (widget, icon) in self.stat_categories.items():
+            self.update_stat_value(widget, icon, store.category_count(category))
     
     def update_stat_value(self, widget, icon, value):
         """Update a single stat widget value"""
@@ -303,129 +400,56 @@ class MainWindow(QMainWindow):
                     child.setStyleSheet("color: #f7768e;")  # Red for many
                 break
     
-    def populate_results_tree(self, results_data, filter_type="all"):
-        """Populate the results tree with linting data"""
-        self.results_tree.clear()
-        
-        if not results_data:
+    def apply_search(self):
+        """Run the search box query against the index and filter the tree"""
+        query = self.search_edit.text().strip()
+        if not query:
+            self.results_proxy.set_search_matches(None)
+            self.update_empty_message(self.current_filter)
             return
         
-        for result in results_data:
-            file_path = Path(result['file'])
-            
-            # Skip files with no issues (considering filter)
-            has_violations = bool(result['listener_violations'])
-            has_semantic = bool([line for line in result['semantic_output'] 
-                                 if '❌' in line or 'ERROR' in line])
-            has_errors = bool(result['errors'])
-            
-            # Check if file should be shown based on filter
-            should_show = False
-            if filter_type == "all":
-                should_show = has_violations or has_semantic or has_errors
-            elif filter_type == "violations":
-                should_show = has_violations
-            elif filter_type == "semantic":
-                should_show = has_semantic
-            elif filter_type == "errors":
-                should_show = has_errors
-            
-            if not should_show:
-                continue
-            
-            # Create file item
-            file_item = QTreeWidgetItem(self.results_tree)
-            file_item.setText(0, f"📄 {file_path.name}")
-            file_item.setText(2, str(file_path))
-            file_item.setExpanded(True)
-            
-            # Add listener violations
-            if (filter_type == "all" or filter_type == "violations") and result['listener_violations']:
-                violations_item = QTreeWidgetItem(file_item)
-                violations_item.setText(0, "⚠️ Clean Code Violations")
-                violations_item.setText(1, f"{len(result['listener_violations'])} issues")
-                violations_item.setExpanded(True)
-                
-                for violation in result['listener_violations']:
-                    # Parse violation to extract line number and message
-                    violation_item = QTreeWidgetItem(violations_item)
-                    
-                    if '[Baris' in violation or 'Line' in violation:
-                        # Extract line number
-                        import re
-                        line_match = re.search(r'\[Baris (\d+)\]|Line (\d+)', violation)
-                        if line_match:
-                            line_num = line_match.group(1) or line_match.group(2)
-                            violation_item.setText(1, f"Line {line_num}")
-                        
-                        # Clean up message
-                        msg = violation.replace('⚠️', '').strip()
-                        msg = re.sub(r'\[Baris \d+\]', '', msg).strip()
-                        
-                        # Categorize
-                        if 'Naming' in msg or 'snake_case' in msg or 'PascalCase' in msg:
-                            violation_item.setText(0, "🏷️ Naming")
-                        elif 'Kompleksitas' in msg or 'complexity' in msg.lower():
-                            violation_item.setText(0, "🧩 Complexity")
-                        elif 'Panjang' in msg or 'length' in msg.lower():
-                            violation_item.setText(0, "📏 Length")
-                        elif 'Argumen' in msg or 'parameter' in msg.lower():
-                            violation_item.setText(0, "📝 Parameters")
-                        elif 'Nesting' in msg or 'dalam' in msg.lower():
-                            violation_item.setText(0, "📐 Nesting")
-                        else:
-                            violation_item.setText(0, "⚠️ Other")
-                        
-                        violation_item.setText(2, msg)
-                    else:
-                        violation_item.setText(0, "⚠️ Violation")
-                        violation_item.setText(2, violation)
-            
-            # Add semantic issues
-            if (filter_type == "all" or filter_type == "semantic") and result['semantic_output']:
-                semantic_issues = [line for line in result['semantic_output'] 
-                                   if line.strip() and ('❌' in line or 'ERROR' in line)]
-                
-                if semantic_issues:
-                    semantic_item = QTreeWidgetItem(file_item)
-                    semantic_item.setText(0, "🔍 Semantic Analysis")
-                    semantic_item.setText(1, f"{len(semantic_issues)} issues")
-                    semantic_item.setExpanded(True)
-                    
-                    for issue in semantic_issues:
-                        issue_item = QTreeWidgetItem(semantic_item)
-                        issue_item.setText(0, "❌ Error")
-                        
-                        # Extract line number if present
-                        import re
-                        line_match = re.search(r'\(line (\d+)\)', issue)
-                        if line_match:
-                            line_num = line_match.group(1)
-                            issue_item.setText(1, f"Line {line_num}")
-                        
-                        # Clean up message
-                        clean_issue = issue.replace('❌', '').replace('[ERROR]', '').strip()
-                        issue_item.setText(2, clean_issue)
-            
-            # Add parse errors
-            if (filter_type == "all" or filter_type == "errors") and result['errors']:
-                errors_item = QTreeWidgetItem(file_item)
-                errors_item.setText(0, "🚫 Parse Errors")
-                errors_item.setText(1, f"{len(result['errors'])} errors")
-                errors_item.setExpanded(True)
-                
-                for error in result['errors']:
-                    error_item = QTreeWidgetItem(errors_item)
-                    error_item.setText(0, "❌ Error")
-                    error_item.setText(2, error)
-        
-        # If no issues at all after filtering, show message
-        if self.results_tree.topLevelItemCount() == 0:
-            success_item = QTreeWidgetItem(self.results_tree)
-            success_item.setText(0, "✅ No Issues Found")
-            success_item.setText(2, f"No {filter_type} issues found in selected files")
-            success_item.setForeground(0, QColor("#9ece6a"))
-            success_item.setForeground(2, QColor("#9ece6a"))
+        matches = self.result_store.search(query)
+        
+        # Matches may sit in issue rows that have not been fetched yet
+        last_match = {}
+        for issue in matches:
+            last_match[(issue.file, issue.kind)] = issue.id
+        for (path, kind), issue_id in last_match.items():
+            issues = self.result_store.get_file(path).issues[kind]
+            # bisect's key argument needs Python 3.10
+            count = bisect_right([issue.id for issue in issues], issue_id)
+            self.results_model.ensure_fetched(path, kind, count)
+        
+        self.results_proxy.set_search_matches(matches)
+        if len(last_match) <= AUTO_EXPAND_FILE_LIMIT:
+            self.results_tree.expandToDepth(1)
+        self.update_empty_message(self.current_filter)
+        self.statusBar().showMessage(f"{len(matches)} issue(s) match '{query}'")
+    
+    def add_result(self, result):
+        """Index a single file result as it arrives from the linter thread"""
+        self.result_store.add_result(result)
+        self.results_model.refresh_file(result['file'])
+        self.update_statistics()
+    
+    def apply_results_filter(self, filter_type):
+        """Apply a filter to the results view without rebuilding the model"""
+        self.results_proxy.set_filter_type(filter_type)
+        
+        # Expand files and groups only while the tree is small enough to stay responsive
+        if self.results_model.file_count() <= AUTO_EXPAND_FILE_LIMIT:
+            self.results_tree.expandToDepth(1)
+        
+        self.update_empty_message(filter_type)
+    
+    def update_empty_message(self, filter_type):
+        """Show a message below the tree when the filter matches nothing"""
+        if self.results_proxy.rowCount() == 0 and self.result_store.file_count():
+            self.empty_label.setText(f"✅ No {filter_type} issues found in selected files")
+            self.empty_label.setStyleSheet("color: #9ece6a; padding: 6px;")
+            self.empty_label.setVisible(True)
+        else:
+            self.empty_label.setVisible(False)
     
     def add_file(self):
         """Add one or more Python files"""
@@ -453,6 +477,8 @@ class MainWindow(QMainWindow):
                 else:
                     excluded_count += 1
             
+            self.restart_watching()
+            
             # Show status message
             if added_count > 0:
                 self.statusBar().showMessage(f"Added {added_count} file(s)")
@@ -478,6 +504,9 @@ class MainWindow(QMainWindow):
                 exclude_patterns
             )
             
+            if Path(folder_path) not in self.selected_roots:
+                self.selected_roots.append(Path(folder_path))
+            
             added_count = 0
             for file_path in python_files:
                 if file_path not in self.selected_paths:
@@ -485,6 +514,7 @@ class MainWindow(QMainWindow):
                     self.file_list.addItem(str(file_path))
                     added_count += 1
             
+            self.restart_watching()
             self.statusBar().showMessage(
                 f"Added {added_count} Python file(s) from {Path(folder_path).name}"
             )
@@ -498,7 +528,9 @@ class MainWindow(QMainWindow):
     
     def clear_files(self):
         """Clear all selected files"""
+        self.watch_check.setChecked(False)
         self.selected_paths.clear()
+        self.selected_roots.clear()
         self.file_list.clear()
         self.statusBar().showMessage("Cleared all files")
     
@@ -528,6 +560,9 @@ class MainWindow(QMainWindow):
             )
             return
         
+        # A full run replaces the watch results; watching resumes afterwards
+        self.stop_watching()
+        
         # Disable buttons during linting
         self.run_btn.setEnabled(False)
         self.add_file_btn.setEnabled(False)
@@ -539,7 +574,13 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         
         # Clear results
-        self.results_tree.clear()
+        self.result_store.clear()
+        self.results_model.reset()
+        self.update_statistics()
+        self.current_filter = "all"
+        self.results_proxy.set_filter_type("all")
+        self.results_proxy.set_search_matches(None)
+        self.empty_label.setVisible(False)
         
         # Start linter thread
         self.linter_thread = LinterThread(
@@ -550,6 +591,7 @@ class MainWindow(QMainWindow):
         )
         
         self.linter_thread.progress.connect(self.update_progress)
+        self.linter_thread.result_ready.connect(self.add_result)
         self.linter_thread.finished.connect(self.linter_finished)
         self.linter_thread.error.connect(self.linter_error)
         
@@ -570,20 +612,16 @@ class MainWindow(QMainWindow):
         else:
             self.current_filter = filter_type
         
-        # Repopulate tree with filter
-        self.populate_results_tree(self.current_results_data, filter_type=self.current_filter)
+        # Re-filter the existing model instead of rebuilding it
+        self.apply_results_filter(self.current_filter)
     
     def linter_finished(self, results_text, results_data):
         """Handle linter completion"""
-        # Store raw results for filtering
-        self.current_results_data = results_data
+        # Results were indexed as they arrived; only the view needs refreshing
         self.current_filter = "all"
-        
-        # Update statistics
-        self.update_statistics(results_data)
-        
-        # Populate results tree with all issues
-        self.populate_results_tree(results_data, filter_type="all")
+        self.update_statistics()
+        self.apply_results_filter("all")
+        self.apply_search()
         
         # Re-enable buttons
         self.run_btn.setEnabled(True)
@@ -595,6 +633,11 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         
         self.statusBar().showMessage("Linting completed")
+        metrics = RunMetrics(results_data)
+        self.timing_label.setText(metrics.summary() if metrics.files else "")
+        self.timing_label.setToolTip(metrics.format_table() if metrics.files else "")
+        if self.watch_check.isChecked():
+            self.start_watching()
         
         # Show completion message
         QMessageBox.information(
@@ -605,10 +648,11 @@ class MainWindow(QMainWindow):
     
     def linter_error(self, error_msg):
         """Handle linter error"""
-        self.results_tree.clear()
-        error_item = QTreeWidgetItem(self.results_tree)
-        error_item.setText(0, "❌ Error")
-        error_item.setText(2, error_msg)
+        self.result_store.clear()
+        self.results_model.reset()
+        self.empty_label.setText(f"❌ Error: {error_msg}")
+        self.empty_label.setStyleSheet("color: #f7768e; padding: 6px;")
+        self.empty_label.setVisible(True)
         
         # Re-enable buttons
         self.run_btn.setEnabled(True)
@@ -626,3 +670,82 @@ class MainWindow(QMainWindow):
             "Error",
             f"An error occurred during linting:\n{error_msg}"
         )
+    
+    # ----- Watch mode -----
+    
+    def watch_roots(self):
+        """Folders added recursively plus individually added files outside them"""
+        roots = list(self.selected_roots)
+        for path in self.selected_paths:
+            if not any(root in path.parents for root in self.selected_roots):
+                roots.append(path)
+        return roots
+    
+    def toggle_watch(self, checked):
+        """Start or stop watch mode from the options checkbox"""
+        if checked:
+            self.start_watching()
+        else:
+            self.stop_watching()
+            self.statusBar().showMessage("Stopped watching for changes")
+    
+    def start_watching(self):
+        """Start re-linting selected files as they change"""
+        self.stop_watching()
+        if not self.selected_paths and not self.selected_roots:
+            self.statusBar().showMessage("Add files or folders to watch")
+            return
+        
+        self.watch_thread = WatchThread(
+            self.linter_runner,
+            self.watch_roots(),
+            self.config_manager.get_exclude_patterns(),
+            self.listener_check.isChecked(),
+            self.semantic_check.isChecked()
+        )
+        self.watch_thread.result_ready.connect(self.watch_result)
+        self.watch_thread.file_removed.connect(self.watch_file_removed)
+        self.watch_thread.relinted.connect(self.watch_relinted)
+        self.watch_thread.start()
+        self.statusBar().showMessage("👀 Watching for changes...")
+    
+    def stop_watching(self):
+        """Stop the watch thread if it is running"""
+        if self.watch_thread is not None:
+            self.watch_thread.requestInterruption()
+            self.watch_thread.wait()
+            self.watch_thread = None
+    
+    def restart_watching(self):
+        """Pick up a changed file selection while watching"""
+        if self.watch_thread is not None:
+            self.start_watching()
+    
+    def watch_result(self, result):
+        """Update the store in place with a re-linted file"""
+        path = Path(result['file'])
+        if path not in self.selected_paths:
+            # New file created under a watched folder
+            self.selected_paths.append(path)
+            self.file_list.addItem(str(path))
+        self.add_result(result)
+    
+    def watch_file_removed(self, path):
+        """Drop a deleted file from the selection and the results"""
+        self.result_store.remove_file(path)
+        self.results_model.refresh_file(path)
+        self.update_statistics()
+        if Path(path) in self.selected_paths:
+            self.selected_paths.remove(Path(path))
+            for item in self.file_list.findItems(path, Qt.MatchFlag.MatchExactly):
+                self.file_list.takeItem(self.file_list.row(item))
+    
+    def watch_relinted(self, count, elapsed_ms):
+        """Report a finished watch re-lint in the status bar"""
+        self.update_empty_message(self.current_filter)
+        self.statusBar().showMessage(f"👀 Re-linted {count} file(s) in {elapsed_ms:.0f} ms")
+    
+    def closeEvent(self, event):
+        """Stop background watching before closing"""
+        self.stop_watching()
+        super().closeEvent(event)
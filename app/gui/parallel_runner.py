@@ -0,0 +1,665 @@
+"""
+Parallel Runner Module
+Lints files in isolated worker processes with per-file time and memory
+limits; very large files are split at top-level statements so that one
+file does not keep a single core busy while the others sit idle
+"""
+import io
+import multiprocessing
+import os
+import re
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext, redirect_stdout
+from multiprocessing.connection import wait as connection_wait
+from pathlib import Path
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.tree.Tree import ParseTreeWalker
+
+from gui.gc_batch import PAUSES, record_gc
+from gui.linter_runner import (BACKEND_AST, LinterRunner, PHASES, analysis_level, count_parse_tree_nodes,
+                               record_phase)
+from gui.scheduling import CostHistory, schedule
+from generated.PythonLexer import PythonLexer
+from generated.PythonParser import PythonParser
+from linter.MyListener import AdvancedCleanCodeListener
+from linter.ast_backend import AST_BACKEND_SUPPORTED
+from linter.MySemanticVisitor import MySemanticVisitor
+from linter.error_listener import CollectingErrorListener
+from linter.rule_levels import LEVEL_TREE
+from linter.rule_profiler import profile_rules
+
+# Files longer than this are split into chunks of about this many lines
+DEFAULT_SPLIT_LINES = 2000
+
+# Files smaller than split_lines * this many bytes are never read to count lines
+MIN_BYTES_PER_LINE = 16
+
+# Workers are replaced after linting this many files or chunks
+DEFAULT_RECYCLE_AFTER = 500
+
+# How often running jobs are checked against the time and memory limits
+LIMIT_CHECK_SECONDS = 0.1
+
+# Reasons a file was skipped instead of linted
+SKIPPED_TIMEOUT = 'timeout'
+SKIPPED_MEMORY = 'memory'
+SKIPPED_CRASH = 'crash'
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# Strings, comments, brackets and line breaks, enough to tell whether a
+# line starts at top level (strings are matched whole so that their
+# line breaks and brackets are skipped)
+_SCAN = re.compile(r'''
+      (?P<string>[rRbBuUfF]{0,2}(?:\'\'\'(?:\\.|[^\\])*?\'\'\'|"""(?:\\.|[^\\])*?"""
+                                |'(?:\\.|[^\\'\n])*'|"(?:\\.|[^\\"\n])*"))
+    | (?P<comment>\#[^\n]*)
+    | (?P<continuation>\\\r?\n)
+    | (?P<open>[(\[{])
+    | (?P<close>[)\]}])
+    | (?P<newline>\n)
+''', re.VERBOSE | re.DOTALL)
+
+# Column-0 keywords that continue the statement above them
+_CONTINUATION_KEYWORDS = re.compile(r'(?:else|elif|except|finally)\b')
+_DECORATED = re.compile(r'(?:def|class|async)\b')
+
+_UNDEFINED_NAME = re.compile(r"Undefined variable: '([^']*)'")
+
+
+def statement_starts(text):
+    """
+    Find lines that start a top-level statement
+
+    The scan is a cheap approximation of the lexer; a wrong guess shows up
+    as a syntax error in a chunk and the file is then linted whole.
+
+    Args:
+        text: Python source code
+
+    Returns:
+        List of (offset, line) tuples for candidate statement starts
+    """
+    starts = []
+    depth = 0
+    line = 1
+    after_decorator = False
+    for match in _SCAN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'string':
+            line += match.group().count('\n')
+        elif kind == 'continuation':
+            line += 1
+        elif kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth = max(depth - 1, 0)
+        elif kind == 'newline':
+            line += 1
+            offset = match.end()
+            if depth or offset >= len(text) or text[offset] in ' \t\r\n#':
+                continue
+            if _CONTINUATION_KEYWORDS.match(text, offset):
+                continue
+            if after_decorator and _DECORATED.match(text, offset):
+                after_decorator = False
+                continue
+            after_decorator = text[offset] == '@'
+            starts.append((offset, line))
+    return starts
+
+
+def split_source(text, chunk_lines):
+    """
+    Split source code into chunks of about chunk_lines lines
+
+    Args:
+        text: Python source code
+        chunk_lines: Target number of lines per chunk
+
+    Returns:
+        List of (chunk_text, first_line) tuples covering the whole text
+    """
+    total_lines = text.count('\n') + 1
+    chunk_count = total_lines // chunk_lines
+    if chunk_count < 2:
+        return [(text, 1)]
+
+    starts = statement_starts(text)
+    start_lines = [line for _, line in starts]
+    cuts = []
+    for index in range(1, chunk_count):
+        position = bisect_left(start_lines, index * total_lines // chunk_count)
+        if position < len(starts) and (not cuts or starts[position][0] > cuts[-1][0]):
+            cuts.append(starts[position])
+
+    chunks = []
+    previous_offset, previous_line = 0, 1
+    for offset, line in cuts:
+        chunks.append((text[previous_offset:offset], previous_line))
+        previous_offset, previous_line = offset, line
+    chunks.append((text[previous_offset:], previous_line))
+    return chunks
+
+
+def lint_chunk(config, text, first_line, use_listener=True, use_semantic=True, rules=False, trace=False):
+    """
+    Lint a run of top-level statements starting at first_line
+
+    Semantic output is reported as if the chunk were a whole module;
+    merge_chunks() drops undefined names that earlier chunks define.
+
+    Returns:
+        Dictionary with 'line_violations' (line rules), 'violations'
+        (tree rules), 'semantic' (raw output), 'defines'
+        (global names defined), 'errors' (linter errors),
+        'syntax_errors' (lexer/parser errors) and 'metrics' (phase
+        timings, token and node counts as in LinterRunner results, plus
+        per-rule [calls, seconds] when rules is true and phase spans
+        when trace is true)
+    """
+    chunk_start = time.perf_counter()
+    metrics = {'timings': dict.fromkeys(PHASES, 0.0), 'tokens': 0, 'nodes': 0}
+    if rules:
+        metrics['rules'] = {}
+    if trace:
+        metrics['spans'] = []
+    chunk = {'line_violations': [], 'violations': [], 'semantic': '', 'defines': set(), 'errors': [],
+             'syntax_errors': [], 'metrics': metrics}
+
+    lexer = PythonLexer(InputStream(text))
+    lexer.line = first_line
+    lexer.removeErrorListeners()
+    error_listener = CollectingErrorListener()
+    lexer.addErrorListener(error_listener)
+    stream = CommonTokenStream(lexer)
+    start = time.perf_counter()
+    stream.fill()
+    record_phase(metrics, 'lex', start)
+    metrics['tokens'] = len(stream.tokens)
+    parser = PythonParser(stream)
+    parser.removeErrorListeners()
+    parser.addErrorListener(error_listener)
+    start = time.perf_counter()
+    tree = parser.file_input()
+    record_phase(metrics, 'parse', start)
+    if error_listener.errors:
+        chunk['syntax_errors'] = error_listener.errors
+        return chunk
+    metrics['nodes'] = count_parse_tree_nodes(tree)
+
+    if use_listener:
+        start = time.perf_counter()
+        try:
+            listener = AdvancedCleanCodeListener(config)
+            if rules:
+                profile_rules(listener, metrics['rules'])
+            # Line rules are reported ahead of all tree rules, as in a whole-file lint
+            listener.check_line_length(text, first_line)
+            chunk['line_violations'] = listener.violations
+            listener.violations = []
+            ParseTreeWalker().walk(listener, tree)
+            chunk['violations'] = listener.violations
+        except Exception as e:
+            chunk['errors'].append(f"Listener error: {str(e)}")
+        record_phase(metrics, 'listener', start)
+
+    if use_semantic:
+        start = time.perf_counter()
+        try:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                visitor = MySemanticVisitor(config)
+                if rules:
+                    profile_rules(visitor, metrics['rules'])
+                builtins = set(visitor.global_scope.symbols)
+                visitor.visit(tree)
+            chunk['semantic'] = output.getvalue()
+            chunk['defines'] = visitor.global_scope.symbols - builtins
+        except Exception as e:
+            chunk['errors'].append(f"Semantic visitor error: {str(e)}")
+        record_phase(metrics, 'semantic', start)
+    if trace:
+        metrics['spans'].append(('chunk', chunk_start, time.perf_counter(), os.getpid()))
+    return chunk
+
+
+def merge_chunks(file_path, chunks):
+    """
+    Stitch chunk results into a LinterRunner-style result
+
+    Line numbers are already absolute. The semantic visitor of a later
+    chunk did not see the module-level names defined by earlier chunks,
+    so its reports for those names are dropped here.
+
+    Args:
+        file_path: Path reported in the result
+        chunks: lint_chunk() results in source order
+
+    Returns:
+        Results dictionary, with chunk metrics (and collector pauses) summed
+    """
+    timings = dict.fromkeys(PHASES, 0.0)
+    gc_pauses = {'seconds': 0.0, 'collections': 0}
+    metrics = {'timings': timings, 'tokens': 0, 'nodes': 0, 'gc': gc_pauses}
+    results = {
+        'file': str(file_path),
+        'listener_violations': [],
+        'semantic_output': [],
+        'errors': [],
+        'metrics': metrics
+    }
+    defined_earlier = set()
+    semantic_lines = []
+    for chunk in chunks:
+        results['listener_violations'].extend(chunk['line_violations'])
+    for chunk in chunks:
+        chunk_metrics = chunk.get('metrics')
+        if chunk_metrics:
+            for phase, seconds in chunk_metrics['timings'].items():
+                timings[phase] += seconds
+            metrics['tokens'] += chunk_metrics['tokens']
+            metrics['nodes'] += chunk_metrics['nodes']
+            if 'gc' in chunk_metrics:
+                gc_pauses['seconds'] += chunk_metrics['gc']['seconds']
+                gc_pauses['collections'] += chunk_metrics['gc']['collections']
+            if 'spans' in chunk_metrics:
+                metrics.setdefault('spans', []).extend(chunk_metrics['spans'])
+            for rule, (calls, seconds) in chunk_metrics.get('rules', {}).items():
+                counters = metrics.setdefault('rules', {}).setdefault(rule, [0, 0.0])
+                counters[0] += calls
+                counters[1] += seconds
+        results['listener_violations'].extend(chunk['violations'])
+        for line in chunk['semantic'].splitlines(keepends=True):
+            name_match = _UNDEFINED_NAME.search(line)
+            if name_match is None or name_match.group(1) not in defined_earlier:
+                semantic_lines.append(line)
+        defined_earlier |= chunk['defines']
+        results['errors'].extend(chunk['errors'])
+
+    semantic_output = ''.join(semantic_lines)
+    if semantic_output:
+        results['semantic_output'] = semantic_output.strip().split('\n')
+    return results
+
+
+def skipped_result(file_path, reason, detail):
+    """
+    Result for a file that was not linted because it hit a limit
+
+    Args:
+        file_path: Path of the file
+        reason: SKIPPED_TIMEOUT, SKIPPED_MEMORY or SKIPPED_CRASH
+        detail: Human readable limit, e.g. "30s"
+
+    Returns:
+        Results dictionary with a 'skipped' field
+    """
+    return {
+        'file': str(file_path),
+        'listener_violations': [],
+        'semantic_output': [],
+        'errors': [f"Skipped: {reason} ({detail})"],
+        'skipped': reason
+    }
+
+
+def _rss_bytes(pid):
+    """Resident set size of a process, or None where /proc is unavailable"""
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _worker_main(conn, config, recycle_after, rules=False, trace=False, gc_batch=False, parse_cache=None):
+    """
+    Worker process loop
+
+    Receives (jobs, use_listener, use_semantic) tasks and reports each job
+    as ('start', position) and ('done', position, output, seconds, sent),
+    sent being the perf_counter() time the result went to the pipe, then
+    ('idle',) when the task is finished. After recycle_after jobs it
+    answers ('retire',) instead and exits so the parent starts a fresh
+    process, releasing whatever the ANTLR runtime has accumulated.
+    """
+    runner = LinterRunner(config, profile_rules=rules, trace=trace, gc_batch=gc_batch, parse_cache=parse_cache)
+    jobs_done = 0
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        jobs, use_listener, use_semantic = task
+        for position, job in enumerate(jobs):
+            conn.send(('start', position))
+            start = time.perf_counter()
+            if job[0] == 'chunk':
+                gc_before = PAUSES.snapshot()
+                try:
+                    # Chunks get the same collector handling as whole files
+                    with runner.gc_batch.lint() if runner.gc_batch is not None else nullcontext():
+                        output = lint_chunk(config, job[1], job[2], use_listener, use_semantic, rules, trace)
+                    record_gc(output['metrics'], gc_before)
+                except Exception as e:
+                    # Treated like a syntax error: the file is linted whole
+                    output = {'syntax_errors': [str(e)]}
+            else:
+                output = runner.lint_file(job[1], use_listener, use_semantic)
+            end = time.perf_counter()
+            conn.send(('done', position, output, end - start, end))
+            jobs_done += 1
+        if recycle_after and jobs_done >= recycle_after:
+            conn.send(('retire',))
+            return
+        conn.send(('idle',))
+
+
+class _Worker:
+    """A worker process and the task it is running"""
+
+    __slots__ = ('process', 'conn', 'jobs', 'position', 'job_started')
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.jobs = None
+        self.position = None
+        self.job_started = None
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.conn.close()
+
+
+class _PendingFile:
+    """A file whose chunks are still being linted"""
+
+    __slots__ = ('chunks', 'remaining')
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.remaining = len(chunks)
+
+
+class ParallelRunner:
+    """
+    Runs linter checks on many files in isolated worker processes
+
+    Work is submitted longest-first by estimated cost (file size scaled by
+    the times measured in previous runs), and cheap files are batched so
+    that a worker is not paying IPC overhead per tiny file.
+
+    A file that runs past the timeout or pushes its worker over the memory
+    cap is reported with skipped_result() and its worker is replaced; the
+    rest of the run carries on. Workers are also recycled after a number
+    of files to contain the ANTLR runtime's memory growth.
+
+    Use as a context manager so the worker processes are shut down:
+
+        with ParallelRunner(config, jobs=4) as runner:
+            results = runner.lint_files(paths)
+    """
+
+    def __init__(self, config, jobs=None, split_lines=DEFAULT_SPLIT_LINES, history=None,
+                 timeout=None, max_memory=None, recycle_after=DEFAULT_RECYCLE_AFTER, profile_rules=False,
+                 trace=False, gc_batch=False, parse_cache=None):
+        """
+        Initialize parallel runner
+
+        Args:
+            config: Configuration dictionary for linter rules
+            jobs: Number of worker processes (default: CPU count)
+            split_lines: Split files longer than this many lines into
+                chunks linted in parallel (0 disables splitting)
+            history: Optional CostHistory used for estimates and updated
+                with the measured times
+            timeout: Optional wall-clock limit in seconds per file or chunk
+            max_memory: Optional resident memory limit per worker in bytes
+                (needs /proc; ignored elsewhere)
+            recycle_after: Replace a worker after it linted this many
+                files or chunks (0 never recycles)
+            profile_rules: Attribute time and call counts to each rule
+                check in the results' metrics
+            trace: Record phase spans in the results' metrics, including a
+                'serialize' span for sending each result back from its worker
+            gc_batch: Lint files and chunks with the collector tuned for batches
+                in every worker (see gc_batch.GcBatch)
+            parse_cache: Folder of the parse cache the workers share for
+                whole files (see parse_cache.ParseCache), None for none
+        """
+        self.config = config
+        self.jobs = jobs or os.cpu_count() or 1
+        self.split_lines = split_lines
+        self.history = history
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.recycle_after = recycle_after
+        self.profile_rules = profile_rules
+        self.trace = trace
+        self.gc_batch = gc_batch
+        self.parse_cache = parse_cache
+        self._workers = []
+        # Forked workers start without re-importing the generated parser
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start_worker(self):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.config, self.recycle_after, self.profile_rules, self.trace, self.gc_batch,
+                  self.parse_cache),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.append(worker)
+        return worker
+
+    def _remove_worker(self, worker, kill=False):
+        self._workers.remove(worker)
+        worker.stop(kill)
+
+    def close(self):
+        """Shut down the worker processes"""
+        for worker in list(self._workers):
+            self._remove_worker(worker, kill=worker.jobs is not None)
+
+    def _read_for_split(self, file_path, size, level):
+        """Return the file's text if it is long enough to split, else None"""
+        if not self.split_lines or size < self.split_lines * MIN_BYTES_PER_LINE:
+            return None
+        # Only parsing is worth splitting for
+        if level < LEVEL_TREE:
+            return None
+        # Chunks are linted with ANTLR; the ast backend is fast enough whole
+        if self.config.get('backend') == BACKEND_AST and AST_BACKEND_SUPPORTED:
+            return None
+        try:
+            text = Path(file_path).read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+        # Lone carriage returns end lines for the lexer but not for the splitter
+        if text.count('\r') != text.count('\r\n'):
+            return None
+        return text
+
+    def _limit_exceeded(self, worker, now):
+        """Return (reason, detail) if the worker's current job broke a limit"""
+        if worker.job_started is None:
+            return None
+        if self.timeout is not None and now - worker.job_started > self.timeout:
+            return SKIPPED_TIMEOUT, f"{self.timeout:g}s"
+        if self.max_memory is not None:
+            rss = _rss_bytes(worker.process.pid)
+            if rss is not None and rss > self.max_memory:
+                return SKIPPED_MEMORY, f"{self.max_memory // (1024 * 1024)} MB"
+        return None
+
+    def lint_files(self, file_paths, use_listener=True, use_semantic=True, progress_callback=None,
+                   result_callback=None):
+        """
+        Run linter on multiple files in parallel
+
+        Args:
+            file_paths: List of file paths to lint
+            use_listener: Whether to use listener-based linter
+            use_semantic: Whether to use semantic visitor linter
+            progress_callback: Optional callback function(current, total, filename)
+                called as each file finishes
+            result_callback: Optional callback function(result) called as each file finishes
+
+        Returns:
+            List of results dictionaries in the order of file_paths
+        """
+        history = self.history if self.history is not None else CostHistory()
+        seconds_per_byte = history.seconds_per_byte()
+        total = len(file_paths)
+        results = [None] * total
+        sizes = [0] * total
+        seconds = [0.0] * total
+        split_files = {}
+        payloads = {}
+
+        # Jobs are (file index, chunk index); whole files have chunk index None
+        planned = []
+        level = analysis_level(self.config, use_listener, use_semantic)
+        for index, file_path in enumerate(file_paths):
+            try:
+                sizes[index] = os.path.getsize(file_path)
+            except OSError:
+                pass
+            cost = history.estimate(file_path, sizes[index], seconds_per_byte)
+            text = self._read_for_split(file_path, sizes[index], level)
+            chunks = split_source(text, self.split_lines) if text is not None else []
+            if len(chunks) < 2:
+                payloads[(index, None)] = ('file', str(file_path))
+                planned.append((cost, (index, None)))
+                continue
+            split_files[index] = _PendingFile([None] * len(chunks))
+            for chunk_index, (chunk_text, first_line) in enumerate(chunks):
+                payloads[(index, chunk_index)] = ('chunk', chunk_text, first_line)
+                planned.append((cost * len(chunk_text) / len(text), (index, chunk_index)))
+
+        queue = deque(jobs for _, jobs in schedule(planned, self.jobs))
+        completed = 0
+
+        def finish(index, result):
+            nonlocal completed
+            results[index] = result
+            history.record(file_paths[index], sizes[index], seconds[index])
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, result['file'])
+            if result_callback:
+                result_callback(result)
+
+        def job_done(job, output, elapsed):
+            index, chunk_index = job
+            seconds[index] += elapsed
+            if results[index] is not None:
+                return  # another chunk of this file was skipped
+            if chunk_index is None:
+                finish(index, output)
+                return
+            split_file = split_files[index]
+            split_file.chunks[chunk_index] = output
+            split_file.remaining -= 1
+            if split_file.remaining:
+                return
+            if any(chunk['syntax_errors'] for chunk in split_file.chunks):
+                # Report syntax errors exactly as a whole-file lint would
+                payloads[(index, None)] = ('file', str(file_paths[index]))
+                queue.appendleft([(index, None)])
+                return
+            finish(index, merge_chunks(file_paths[index], split_file.chunks))
+
+        def abandon(worker, reason, detail):
+            """Kill a worker, skip its current job and requeue the rest of its task"""
+            job = worker.jobs[worker.position]
+            remaining = worker.jobs[worker.position + 1:]
+            if worker.job_started is not None:
+                seconds[job[0]] += time.monotonic() - worker.job_started
+            self._remove_worker(worker, kill=True)
+            if results[job[0]] is None:
+                finish(job[0], skipped_result(file_paths[job[0]], reason, detail))
+            if remaining:
+                queue.appendleft(remaining)
+
+        try:
+            while queue or any(worker.jobs is not None for worker in self._workers):
+                # Hand queued tasks to idle workers, starting workers as needed
+                while queue:
+                    worker = next((w for w in self._workers if w.jobs is None), None)
+                    if worker is None:
+                        if len(self._workers) >= self.jobs:
+                            break
+                        worker = self._start_worker()
+                    jobs = [job for job in queue.popleft() if results[job[0]] is None]
+                    if not jobs:
+                        continue
+                    worker.jobs = jobs
+                    worker.position = 0
+                    worker.job_started = None
+                    worker.conn.send(([payloads[job] for job in jobs], use_listener, use_semantic))
+
+                busy = {worker.conn: worker for worker in self._workers if worker.jobs is not None}
+                for conn in connection_wait(list(busy), timeout=LIMIT_CHECK_SECONDS):
+                    worker = busy[conn]
+                    try:
+                        message = conn.recv()
+                    except (EOFError, OSError):
+                        # The worker died on its own (e.g. killed by the OOM killer)
+                        abandon(worker, SKIPPED_CRASH, f"exit code {worker.process.exitcode}")
+                        continue
+                    kind = message[0]
+                    if kind == 'start':
+                        worker.position = message[1]
+                        worker.job_started = time.monotonic()
+                    elif kind == 'done':
+                        worker.job_started = None
+                        output = message[2]
+                        if self.trace and 'metrics' in output:
+                            # Pickling, the pipe and unpickling, as seen from the worker's side
+                            output['metrics']['spans'].append(
+                                ('serialize', message[4], time.perf_counter(), worker.process.pid))
+                        job_done(worker.jobs[message[1]], output, message[3])
+                    elif kind == 'idle':
+                        worker.jobs = None
+                    elif kind == 'retire':
+                        worker.jobs = None
+                        self._remove_worker(worker)
+
+                now = time.monotonic()
+                for worker in [w for w in self._workers if w.jobs is not None]:
+                    exceeded = self._limit_exceeded(worker, now)
+                    if exceeded is not None:
+                        abandon(worker, *exceeded)
+        except BaseException:
+            # Don't leave workers running half a task (e.g. on Ctrl+C)
+            self.close()
+            raise
+
+        history.save()
+        return results
@@ -0,0 +1,213 @@
+"""
+Parse Cache Module
+Keeps the token tables and compact parse trees of linted sources on disk,
+so that linting unchanged sources again after a rule or config change
+skips lexing and parsing
+
+Entries are keyed by a hash of the source, in a folder named after a
+fingerprint of the grammar, the lexer and the rules compact trees keep.
+Each entry is one file laid out to be memory-mapped: a fixed header, the
+tree and token table arrays in native byte order, the token texts as one
+UTF-8 blob with offsets, and the syntax errors as JSON. Loading an entry
+maps that one file and wraps its arrays in memoryviews, and token texts
+are only decoded when read.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+from linter.compact_tree import CompactTree
+
+# Bump when the entry layout or the meaning of its fields changes
+FORMAT_VERSION = 1
+
+_MAGIC = b'PLCT'
+# magic, version, nodes (0 for a token table alone), table entries,
+# lexed entries, stream tokens, parse tree nodes, text bytes, error bytes
+_HEADER = struct.Struct('=4s8I')
+
+# Generated sources that decide the tokens and trees of a source
+_GRAMMAR_FILES = ('PythonLexer.py', 'PythonLexerBase.py', 'PythonParser.py')
+_GENERATED_DIR = Path(__file__).resolve().parent.parent / 'generated'
+
+# Token texts can hold lone surrogates when linting editor buffers
+_TEXT_ERRORS = 'surrogatepass'
+
+
+def default_cache_dir():
+    """Per-user parse cache folder, preferring XDG_CACHE_HOME when available"""
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'pylinter', 'parse')
+
+
+def grammar_fingerprint(keep):
+    """
+    Hash of everything besides the source that a cached entry depends on
+
+    Args:
+        keep: Rule names compact trees keep (see compact_tree.handled_rules)
+    """
+    digest = hashlib.sha256(f"{FORMAT_VERSION} {sys.byteorder} {sorted(keep)}".encode())
+    for name in _GRAMMAR_FILES:
+        digest.update((_GENERATED_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+class _Texts:
+    """Token texts of a mapped entry, decoded one at a time when read"""
+
+    __slots__ = ('blob', 'offsets')
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]]).decode('utf-8', _TEXT_ERRORS)
+
+
+def _padding(size):
+    return -size % 4
+
+
+class ParseCache:
+    """On-disk cache of CompactTrees and the syntax errors of their sources"""
+
+    def __init__(self, directory, keep):
+        """
+        Initialize parse cache
+
+        Args:
+            directory: Cache folder; entries go in a subfolder per grammar
+                fingerprint, so older ones are never read
+            keep: Rule names compact trees keep (see compact_tree.handled_rules)
+        """
+        self.directory = Path(directory) / grammar_fingerprint(keep)[:16]
+        self.hits = 0
+        self.misses = 0
+        # Entries that could not be written (the lint goes on without them)
+        self.store_failures = 0
+
+    def key(self, source):
+        """Cache key of a source text"""
+        return hashlib.sha256(source.encode('utf-8', _TEXT_ERRORS)).hexdigest()
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.bin"
+
+    def load(self, key, need_tree=True):
+        """
+        Map a cached entry
+
+        Args:
+            key: key() of the source
+            need_tree: Only accept entries that have a parse tree, not just
+                the token table
+
+        Returns:
+            (CompactTree, errors) with errors as {'lexer': [...],
+            'parser': [...]}, or None when there is no usable entry
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            entry = self._read(memoryview(buffer), need_tree)
+        except (OSError, ValueError, struct.error):
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _read(self, view, need_tree):
+        """Wrap a mapped entry's sections, or None if it is unusable"""
+        magic, version, nodes, entries, lexed, stream_tokens, parse_nodes, text_bytes, error_bytes = \
+            _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != FORMAT_VERSION or (need_tree and not nodes):
+            return None
+        node_bytes = 2 * nodes + _padding(2 * nodes) + 5 * 4 * nodes
+        table_bytes = 2 * entries + _padding(2 * entries) + 4 * entries + 4 * (entries + 1)
+        if len(view) != _HEADER.size + node_bytes + table_bytes + text_bytes + error_bytes:
+            return None
+
+        offset = _HEADER.size
+
+        def section(typecode, count):
+            nonlocal offset
+            size = array(typecode).itemsize * count
+            data = view[offset:offset + size].cast(typecode)
+            offset += size + _padding(size)
+            return data
+
+        tree = CompactTree()
+        tree.rule = section('h', nodes)
+        tree.first = section('i', nodes)
+        tree.last = section('i', nodes)
+        tree.parent = section('i', nodes)
+        tree.first_child = section('i', nodes)
+        tree.next_sibling = section('i', nodes)
+        tree.types = section('h', entries)
+        tree.lines = section('i', entries)
+        offsets = section('i', entries + 1)
+        tree.texts = _Texts(view[offset:offset + text_bytes], offsets)
+        offset += text_bytes
+        tree.lexed = lexed
+        tree.stream_tokens = stream_tokens
+        tree.parse_nodes = parse_nodes
+        errors = json.loads(bytes(view[offset:offset + error_bytes]))
+        return tree, errors
+
+    def store(self, key, tree, errors):
+        """
+        Write an entry (failures only lose the entry and are counted)
+
+        Args:
+            key: key() of the source
+            tree: CompactTree of the source, with or without nodes
+            errors: {'lexer': [...], 'parser': [...]} syntax errors
+        """
+        texts = [text.encode('utf-8', _TEXT_ERRORS) for text in tree.texts]
+        offsets = array('i', [0])
+        for text in texts:
+            offsets.append(offsets[-1] + len(text))
+        text_blob = b''.join(texts)
+        error_blob = json.dumps(errors).encode('utf-8', _TEXT_ERRORS)
+        nodes = len(tree)
+        entries = len(texts)
+        header = _HEADER.pack(_MAGIC, FORMAT_VERSION, nodes, entries, tree.lexed, tree.stream_tokens,
+                              tree.parse_nodes, len(text_blob), len(error_blob))
+        parts = [header]
+        for data in (tree.rule, tree.first, tree.last, tree.parent, tree.first_child, tree.next_sibling,
+                     tree.types, tree.lines, offsets):
+            data = data.tobytes()
+            parts += [data, b'\0' * _padding(len(data))]
+        parts += [text_blob, error_blob]
+
+        path = self._path(key)
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A temp file of its own per writer, also between threads of one process
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{key}.", suffix='.tmp')
+            with open(fd, 'wb') as f:
+                f.writelines(parts)
+            os.replace(temp_path, path)
+        except OSError:
+            self.store_failures += 1
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
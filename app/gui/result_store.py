@@ -0,0 +1,289 @@
+"""
+Result Store Module
+In-memory store that indexes linter results as they arrive
+"""
+import re
+from collections import defaultdict
+
+# Issue kinds, in the order they are shown for each file
+ISSUE_KINDS = ('violations', 'semantic', 'errors')
+
+# Rule categories of listener violations
+RULE_CATEGORIES = ('Naming', 'Complexity', 'Length', 'Parameters', 'Nesting', 'Other')
+
+SEVERITY_WARNING = 'warning'
+SEVERITY_ERROR = 'error'
+
+
+def is_semantic_issue(line):
+    """Check if a semantic visitor output line reports an error"""
+    return bool(line.strip()) and ('❌' in line or 'ERROR' in line)
+
+
+def issue_line(kind, text):
+    """
+    Extract the reported line number from a raw issue string
+
+    Args:
+        kind: Issue kind ('violations', 'semantic' or 'errors')
+        text: Raw violation, semantic output line or error string
+
+    Returns:
+        Line number as int, or None if the issue has no location
+    """
+    if kind == 'violations':
+        line_match = re.search(r'\[Baris (\d+)\]|Line (\d+)', text)
+        return int(line_match.group(1) or line_match.group(2)) if line_match else None
+    if kind == 'semantic':
+        line_match = re.search(r'\(line (\d+)\)', text)
+    else:
+        line_match = re.search(r'line (\d+)', text)
+    return int(line_match.group(1)) if line_match else None
+
+
+def classify_violation(msg):
+    """
+    Map a listener violation message to its rule category
+
+    Args:
+        msg: Violation message without the line prefix
+
+    Returns:
+        One of RULE_CATEGORIES
+    """
+    lowered = msg.lower()
+    if 'Naming' in msg or 'snake_case' in msg or 'PascalCase' in msg:
+        return 'Naming'
+    if 'Kompleksitas' in msg or 'complexity' in lowered:
+        return 'Complexity'
+    if 'Panjang' in msg or 'length' in lowered:
+        return 'Length'
+    if 'Argumen' in msg or 'parameter' in lowered:
+        return 'Parameters'
+    if 'Nesting' in msg or 'dalam' in lowered:
+        return 'Nesting'
+    return 'Other'
+
+
+class Issue:
+    """A single parsed finding from one of the linters"""
+
+    __slots__ = ('id', 'file', 'kind', 'category', 'severity', 'line', 'message', 'raw')
+
+    def __init__(self, issue_id, file, kind, category, severity, line, message, raw):
+        self.id = issue_id
+        self.file = file
+        self.kind = kind
+        self.category = category
+        self.severity = severity
+        self.line = line
+        self.message = message
+        self.raw = raw
+
+
+class FileRecord:
+    """Parsed issues of one linted file"""
+
+    __slots__ = ('path', 'result', 'issues', 'counts')
+
+    def __init__(self, path, result):
+        self.path = path
+        self.result = result
+        self.issues = {kind: [] for kind in ISSUE_KINDS}
+        # Per-file counters keyed by kind and by rule category
+        self.counts = defaultdict(int)
+
+    def count(self, key):
+        """Number of issues of a kind or rule category in this file"""
+        return self.counts.get(key, 0)
+
+    def has_issues(self):
+        """True if the file has at least one issue of any kind"""
+        return any(self.issues.values())
+
+
+class ResultStore:
+    """
+    Indexes linter results by file, kind, rule category and severity
+
+    Results are parsed once when added. Counters are kept up to date on
+    every add/remove so statistics are O(1), and the indexes let filters
+    iterate only the issues that match.
+    """
+
+    def __init__(self, search_index=None):
+        """
+        Initialize result store
+
+        Args:
+            search_index: Optional SearchIndex kept in sync with the store
+        """
+        self.search_index = search_index
+        self.clear()
+
+    def clear(self):
+        """Drop all stored results"""
+        if self.search_index is not None:
+            self.search_index.clear()
+        self._files = {}
+        self._next_id = 0
+        # Ordered id -> Issue maps, used as ordered sets
+        self._by_kind = {kind: {} for kind in ISSUE_KINDS}
+        self._by_category = {category: {} for category in RULE_CATEGORIES}
+        self._by_severity = {SEVERITY_WARNING: {}, SEVERITY_ERROR: {}}
+
+    # ----- Updates -----
+
+    def add_result(self, result):
+        """
+        Add or replace the result of one file
+
+        Args:
+            result: Result dictionary from LinterRunner.lint_file
+
+        Returns:
+            The FileRecord now stored for the file
+        """
+        path = result['file']
+        if path in self._files:
+            self._unindex(self._files[path])
+
+        record = FileRecord(path, result)
+        for violation in result.get('listener_violations', []):
+            line, msg = self._parse_violation(violation)
+            self._index(record, 'violations', classify_violation(msg), SEVERITY_WARNING, line, msg, violation)
+        for output_line in result.get('semantic_output', []):
+            if is_semantic_issue(output_line):
+                msg = output_line.replace('❌', '').replace('[ERROR]', '').strip()
+                self._index(record, 'semantic', None, SEVERITY_ERROR,
+                            issue_line('semantic', output_line), msg, output_line)
+        for error in result.get('errors', []):
+            self._index(record, 'errors', None, SEVERITY_ERROR, issue_line('errors', error), error, error)
+
+        # Re-assigning an existing key keeps the file's original position
+        self._files[path] = record
+        return record
+
+    def remove_file(self, path):
+        """Remove a file and all of its issues; returns False if unknown"""
+        record = self._files.pop(str(path), None)
+        if record is None:
+            return False
+        self._unindex(record)
+        return True
+
+    def _parse_violation(self, violation):
+        """Extract line number and clean message from a listener violation"""
+        line = issue_line('violations', violation)
+        msg = violation.replace('⚠️', '').strip()
+        msg = re.sub(r'\[Baris \d+\]', '', msg).strip()
+        return line, msg
+
+    def _index(self, record, kind, category, severity, line, message, raw):
+        issue = Issue(self._next_id, record.path, kind, category, severity, line, message, raw)
+        self._next_id += 1
+
+        record.issues[kind].append(issue)
+        record.counts[kind] += 1
+        self._by_kind[kind][issue.id] = issue
+        self._by_severity[severity][issue.id] = issue
+        if category is not None:
+            record.counts[category] += 1
+            self._by_category[category][issue.id] = issue
+        if self.search_index is not None:
+            self.search_index.add(issue)
+
+    def _unindex(self, record):
+        for issues in record.issues.values():
+            for issue in issues:
+                del self._by_kind[issue.kind][issue.id]
+                del self._by_severity[issue.severity][issue.id]
+                if issue.category is not None:
+                    del self._by_category[issue.category][issue.id]
+                if self.search_index is not None:
+                    self.search_index.remove(issue)
+
+    # ----- Queries -----
+
+    def file_count(self):
+        """Number of files stored (with or without issues)"""
+        return len(self._files)
+
+    def kind_count(self, kind):
+        """Total number of issues of a kind ('violations', 'semantic', 'errors')"""
+        return len(self._by_kind[kind])
+
+    def category_count(self, category):
+        """Total number of listener violations in a rule category"""
+        return len(self._by_category[category])
+
+    def severity_count(self, severity):
+        """Total number of issues with a severity"""
+        return len(self._by_severity[severity])
+
+    def get_file(self, path):
+        """Get the FileRecord of a file, or None"""
+        return self._files.get(str(path))
+
+    def files(self):
+        """All file records in insertion order"""
+        return list(self._files.values())
+
+    def results(self):
+        """Raw result dictionaries in insertion order"""
+        return [record.result for record in self._files.values()]
+
+    def issues(self, kind=None, category=None, severity=None, file=None):
+        """
+        Iterate issues matching every given filter
+
+        Iteration starts from the most selective index, so the cost is
+        proportional to the number of candidate matches.
+
+        Args:
+            kind: Issue kind to match
+            category: Rule category to match
+            severity: Severity to match
+            file: File path to match
+
+        Yields:
+            Issue objects
+        """
+        candidates = []
+        if file is not None:
+            record = self._files.get(str(file))
+            if record is None:
+                return
+            candidates.append([issue for issues in record.issues.values() for issue in issues])
+        if kind is not None:
+            candidates.append(self._by_kind[kind].values())
+        if category is not None:
+            candidates.append(self._by_category[category].values())
+        if severity is not None:
+            candidates.append(self._by_severity[severity].values())
+        if not candidates:
+            candidates.append(self._all_issues())
+            source = candidates[0]
+        else:
+            source = min(candidates, key=len)
+
+        for issue in source:
+            if kind is not None and issue.kind != kind:
+                continue
+            if category is not None and issue.category != category:
+                continue
+            if severity is not None and issue.severity != severity:
+                continue
+            if file is not None and issue.file != str(file):
+                continue
+            yield issue
+
+    def search(self, query):
+        """Full-text search over issues (requires a search index)"""
+        if self.search_index is None:
+            return []
+        return self.search_index.search(query)
+
+    def _all_issues(self):
+        return [issue for record in self._files.values()
+                for issues in record.issues.values() for issue in issues]
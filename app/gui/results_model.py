@@ -0,0 +1,349 @@
+"""
+Results Model Module
+Model/view classes backing the results panel of the main window
+"""
+from pathlib import Path
+from PyQt6.QtCore import (
+    Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+)
+
+from gui.result_store import ISSUE_KINDS, RULE_CATEGORIES
+
+# Number of issue rows materialized per fetchMore() call
+FETCH_BATCH_SIZE = 500
+
+COLUMN_HEADERS = ["Issue Type", "Location", "Description"]
+
+GROUP_LABELS = {
+    'violations': ("⚠️ Clean Code Violations", "issues"),
+    'semantic': ("🔍 Semantic Analysis", "issues"),
+    'errors': ("🚫 Parse Errors", "errors"),
+}
+
+CATEGORY_LABELS = {
+    'Naming': "🏷️ Naming",
+    'Complexity': "🧩 Complexity",
+    'Length': "📏 Length",
+    'Parameters': "📝 Parameters",
+    'Nesting': "📐 Nesting",
+    'Other': "⚠️ Other",
+}
+
+
+def describe_issue(issue):
+    """
+    Split a stored issue into display columns
+
+    Args:
+        issue: Issue from the ResultStore
+
+    Returns:
+        Tuple of (issue type, location, description)
+    """
+    location = f"Line {issue.line}" if issue.line is not None else ""
+    if issue.kind == 'violations':
+        if issue.line is None:
+            return "⚠️ Violation", location, issue.raw
+        return CATEGORY_LABELS[issue.category], location, issue.message
+    return "❌ Error", location, issue.message
+
+
+class _GroupNode:
+    """Issue group under a file (violations, semantic or errors)"""
+
+    __slots__ = ('parent', 'row', 'kind', 'items', 'fetched')
+
+    def __init__(self, parent, row, kind, items):
+        self.parent = parent
+        self.row = row
+        self.kind = kind
+        self.items = items
+        self.fetched = 0
+
+    def display(self, column):
+        label, unit = GROUP_LABELS[self.kind]
+        if column == 0:
+            return label
+        if column == 1:
+            return f"{len(self.items)} {unit}"
+        return None
+
+
+class _FileNode:
+    """Top-level row for a single linted file"""
+
+    __slots__ = ('parent', 'row', 'record', 'groups')
+
+    def __init__(self, parent, row, record):
+        self.parent = parent
+        self.row = row
+        self.record = record
+        self.groups = []
+        for kind in ISSUE_KINDS:
+            if record.issues[kind]:
+                self.groups.append(_GroupNode(self, len(self.groups), kind, record.issues[kind]))
+
+    def display(self, column):
+        if column == 0:
+            return f"📄 {Path(self.record.path).name}"
+        if column == 2:
+            return str(self.record.path)
+        return None
+
+
+class _RootNode:
+    """Invisible root holding the file rows"""
+
+    __slots__ = ('files', 'rows_by_path')
+
+    def __init__(self):
+        self.files = []
+        self.rows_by_path = {}
+
+
+class ResultsTreeModel(QAbstractItemModel):
+    """
+    Tree model over a ResultStore: file -> issue group -> issue
+
+    Only file and group rows are materialized up front. Issue rows are
+    exposed in batches through canFetchMore()/fetchMore() as the view
+    expands a group, and their column text is computed on demand.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._root = _RootNode()
+
+    def reset(self):
+        """Rebuild all rows from the store"""
+        self.beginResetModel()
+        self._root = _RootNode()
+        for record in self.store.files():
+            if record.has_issues():
+                row = len(self._root.files)
+                self._root.files.append(_FileNode(self._root, row, record))
+                self._root.rows_by_path[record.path] = row
+        self.endResetModel()
+
+    def refresh_file(self, path):
+        """
+        Sync the row of one file with the store after it was added,
+        replaced or removed
+
+        Args:
+            path: File path as stored in the result dictionary
+        """
+        path = str(path)
+        record = self.store.get_file(path)
+        row = self._root.rows_by_path.pop(path, None)
+
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._root.files[row]
+            self._renumber(row)
+            self.endRemoveRows()
+
+        if record is None or not record.has_issues():
+            return
+
+        # Replaced files keep their position, new files are appended
+        if row is None:
+            row = len(self._root.files)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._root.files.insert(row, _FileNode(self._root, row, record))
+        self._renumber(row)
+        self.endInsertRows()
+
+    def _renumber(self, start):
+        """Fix row numbers of file nodes from a given row onwards"""
+        for row in range(start, len(self._root.files)):
+            node = self._root.files[row]
+            node.row = row
+            self._root.rows_by_path[node.record.path] = row
+
+    def ensure_fetched(self, path, kind, count):
+        """
+        Make sure at least the first count issue rows of a group are fetched
+
+        Args:
+            path: File path of the group
+            kind: Issue kind of the group
+            count: Number of leading rows that must be available
+        """
+        row = self._root.rows_by_path.get(str(path))
+        if row is None:
+            return
+        file_node = self._root.files[row]
+        for group in file_node.groups:
+            if group.kind == kind and group.fetched < count:
+                count = min(count, len(group.items))
+                parent = self.createIndex(group.row, 0, file_node)
+                self.beginInsertRows(parent, group.fetched, count - 1)
+                group.fetched = count
+                self.endInsertRows()
+
+    def file_count(self):
+        """Number of file rows (files with at least one issue)"""
+        return len(self._root.files)
+
+    def file_record(self, row):
+        """FileRecord of the file at the given top-level row"""
+        return self._root.files[row].record
+
+    def group_kind(self, parent, row):
+        """Kind of the group row under the given file index"""
+        return self._node(parent).groups[row].kind
+
+    def issue(self, parent, row):
+        """Issue at the given row under a group index"""
+        return self._node(parent).items[row]
+
+    def _node(self, index):
+        """Resolve the file or group node behind an index (None for issue rows)"""
+        owner = index.internalPointer()
+        row = index.row()
+        if isinstance(owner, _RootNode):
+            return owner.files[row]
+        if isinstance(owner, _FileNode):
+            return owner.groups[row]
+        return None
+
+    # ----- QAbstractItemModel interface -----
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self._root)
+        return self.createIndex(row, column, self._node(parent))
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        owner = index.internalPointer()
+        if isinstance(owner, _RootNode):
+            return QModelIndex()
+        return self.createIndex(owner.row, 0, owner.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self._root.files)
+        node = self._node(parent)
+        if isinstance(node, _FileNode):
+            return len(node.groups)
+        if isinstance(node, _GroupNode):
+            return node.fetched
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMN_HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._root.files)
+        return self._node(parent) is not None
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or not isinstance(parent.internalPointer(), _FileNode):
+            return False
+        group = self._node(parent)
+        return group.fetched < len(group.items)
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        group = self._node(parent)
+        count = min(FETCH_BATCH_SIZE, len(group.items) - group.fetched)
+        self.beginInsertRows(parent, group.fetched, group.fetched + count - 1)
+        group.fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            owner = index.internalPointer()
+            if isinstance(owner, _GroupNode):
+                # Issue rows are not materialized; describe the issue on demand
+                return describe_issue(owner.items[index.row()])[index.column()] or None
+            return self._node(index).display(index.column())
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 2:
+            return self.data(index, Qt.ItemDataRole.DisplayRole)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMN_HEADERS[section]
+        return None
+
+
+class ResultsFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters the results tree by issue kind or rule category, and
+    optionally by a set of search matches, without rebuilding it
+
+    File rows are accepted from the per-file counters of the store (or the
+    match keys of the active search), so a filter switch never scans the
+    issues of files that do not match.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_type = "all"
+        self.search_ids = None
+        self.search_keys = None
+
+    def set_search_matches(self, issues):
+        """
+        Restrict rows to the given search matches
+
+        Args:
+            issues: List of matching Issue objects, or None to clear the search
+        """
+        if issues is None:
+            self.search_ids = None
+            self.search_keys = None
+        else:
+            self.search_ids = {issue.id for issue in issues}
+            self.search_keys = set()
+            for issue in issues:
+                self.search_keys.add((issue.file, "all"))
+                self.search_keys.add((issue.file, issue.kind))
+                if issue.category is not None:
+                    self.search_keys.add((issue.file, issue.category))
+        self.invalidateFilter()
+
+    def set_filter_type(self, filter_type):
+        """Set active filter: 'all', an issue kind or a rule category"""
+        if filter_type == self.filter_type:
+            return
+        self.filter_type = filter_type
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.filter_type == "all" and self.search_ids is None:
+            return True
+        model = self.sourceModel()
+        is_category = self.filter_type in RULE_CATEGORIES
+
+        if not source_parent.isValid():
+            record = model.file_record(source_row)
+            if self.search_keys is not None:
+                return (record.path, self.filter_type) in self.search_keys
+            return record.count(self.filter_type) > 0
+
+        if not source_parent.parent().isValid():
+            kind = model.group_kind(source_parent, source_row)
+            if self.filter_type != "all" and kind != ('violations' if is_category else self.filter_type):
+                return False
+            if self.search_keys is not None:
+                return (model.file_record(source_parent.row()).path, kind) in self.search_keys
+            return True
+
+        issue = model.issue(source_parent, source_row)
+        if is_category and issue.category != self.filter_type:
+            return False
+        return self.search_ids is None or issue.id in self.search_ids
@@ -0,0 +1,194 @@
+"""
+Run Metrics Module
+Aggregates the per-phase timings carried by lint results into run
+totals and percentiles
+"""
+from gui.linter_runner import PHASES
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list (0.0 for an empty list)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), int(fraction * len(sorted_values) + 0.999999)))
+    return sorted_values[rank - 1]
+
+
+class RunMetrics:
+    """Totals and percentiles of phase timings over the files of a run"""
+
+    def __init__(self, results=None):
+        """
+        Initialize run metrics
+
+        Args:
+            results: Optional results dictionaries to add right away
+        """
+        self.files = 0
+        self.tokens = 0
+        self.nodes = 0
+        # Files loaded from the parse cache, and the tokens and lex + parse
+        # time of the others (a hit's lex/parse time is only the cache load)
+        self.cache_hits = 0
+        self.parsed_tokens = 0
+        self.parse_seconds = 0.0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        # Collector pauses, which overlap the phases
+        self.gc_seconds = 0.0
+        self.gc_collections = 0
+        self._samples = {phase: [] for phase in PHASES + ('total',)}
+        self._sorted = True
+        self.slowest = []  # (seconds, file) of every file, sorted on demand
+        self.rules = {}  # rule -> [calls, seconds] over the run, when profiled
+        self.file_rules = {}  # file -> {rule: [calls, seconds]}
+        for result in results or []:
+            self.add(result)
+
+    def add(self, result):
+        """Add one result; results without metrics (e.g. skipped files) are ignored"""
+        metrics = result.get('metrics')
+        if not metrics:
+            return
+        self.files += 1
+        self.tokens += metrics.get('tokens', 0)
+        self.nodes += metrics.get('nodes', 0)
+        if metrics.get('parse_cache') == 'hit':
+            self.cache_hits += 1
+        else:
+            self.parsed_tokens += metrics.get('tokens', 0)
+            self.parse_seconds += metrics['timings'].get('lex', 0.0) + metrics['timings'].get('parse', 0.0)
+        if 'gc' in metrics:
+            self.gc_seconds += metrics['gc']['seconds']
+            self.gc_collections += metrics['gc']['collections']
+        file_total = 0.0
+        for phase in PHASES:
+            seconds = metrics['timings'].get(phase, 0.0)
+            self.totals[phase] += seconds
+            self._samples[phase].append(seconds)
+            file_total += seconds
+        self._samples['total'].append(file_total)
+        self.slowest.append((file_total, result['file']))
+        self._sorted = False
+        if 'rules' in metrics:
+            self.file_rules[result['file']] = metrics['rules']
+            for rule, (calls, seconds) in metrics['rules'].items():
+                counters = self.rules.setdefault(rule, [0, 0.0])
+                counters[0] += calls
+                counters[1] += seconds
+
+    def _sort(self):
+        if not self._sorted:
+            for samples in self._samples.values():
+                samples.sort()
+            self.slowest.sort(reverse=True)
+            self._sorted = True
+
+    def total_seconds(self):
+        """Sum of all phases over all files (CPU time across workers)"""
+        return sum(self.totals.values())
+
+    def percentiles(self, phase='total'):
+        """
+        Per-file percentiles of a phase
+
+        Args:
+            phase: One of PHASES, or 'total' for whole-file time
+
+        Returns:
+            Dict mapping 'p50', 'p90', 'p99' and 'max' to seconds
+        """
+        self._sort()
+        samples = self._samples[phase]
+        values = {f"p{int(fraction * 100)}": percentile(samples, fraction) for fraction in PERCENTILES}
+        values['max'] = samples[-1] if samples else 0.0
+        return values
+
+    def summary(self):
+        """One-line summary: phase shares and per-file percentiles"""
+        if not self.files:
+            return "No timing data"
+        total = self.total_seconds() or 1.0
+        shares = " · ".join(f"{phase} {self.totals[phase] / total:.0%}" for phase in PHASES)
+        file_percentiles = self.percentiles()
+        return (f"⏱️ {self.files} file(s), {self.total_seconds():.2f} s — {shares} — per file "
+                f"p50 {file_percentiles['p50'] * 1000:.0f} ms, p90 {file_percentiles['p90'] * 1000:.0f} ms, "
+                f"p99 {file_percentiles['p99'] * 1000:.0f} ms — gc {self.gc_seconds * 1000:.0f} ms "
+                f"in {self.gc_collections} collection(s)")
+
+    def format_table(self, slowest=10):
+        """
+        Multi-line report with totals and percentiles per phase
+
+        Args:
+            slowest: Number of slowest files to list
+        """
+        lines = [f"{'phase':<10}{'total s':>10}{'share':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        total = self.total_seconds() or 1.0
+        for phase in PHASES + ('total',):
+            seconds = self.total_seconds() if phase == 'total' else self.totals[phase]
+            values = self.percentiles(phase)
+            lines.append(
+                f"{phase:<10}{seconds:>10.3f}{seconds / total:>8.0%}"
+                f"{values['p50'] * 1000:>10.1f}{values['p90'] * 1000:>10.1f}"
+                f"{values['p99'] * 1000:>10.1f}{values['max'] * 1000:>10.1f}"
+            )
+        lines.append(f"{self.files} file(s), {self.tokens} token(s), {self.nodes} parse tree node(s)")
+        lines.append(f"Garbage collector paused {self.gc_seconds:.3f} s in {self.gc_collections} collection(s) "
+                     f"({self.gc_seconds / total:.0%} of the phase time)")
+        if self.cache_hits:
+            lines.append(f"{self.cache_hits} of {self.files} file(s) loaded from the parse cache")
+        if self.parsed_tokens and self.parse_seconds > 0:
+            lines.append(f"{self.parsed_tokens / self.parse_seconds:.0f} tokens/s lexed and parsed"
+                         f"{' (cache hits left out)' if self.cache_hits else ''}")
+        if slowest and self.slowest:
+            lines.append("Slowest files:")
+            for seconds, file_path in self.slowest[:slowest]:
+                lines.append(f"  {seconds * 1000:>10.1f} ms  {file_path}")
+        return '\n'.join(lines)
+
+    def format_rule_table(self, files=5):
+        """
+        Report of the time and calls attributed to each rule
+
+        Rules are listed most expensive first, with the share of the
+        listener and semantic phases they account for; the rest of those
+        phases is tree walking and scope tracking. The files where rules
+        cost the most follow with their three costliest rules.
+
+        Args:
+            files: Number of files to break down per rule
+        """
+        if not self.rules:
+            return "No rule profile (run with rule profiling enabled)"
+        checked = (self.totals['listener'] + self.totals['semantic']) or 1.0
+        lines = [f"{'rule':<20}{'calls':>10}{'total ms':>12}{'us/call':>10}{'share':>8}"]
+        for rule, (calls, seconds) in sorted(self.rules.items(), key=lambda item: item[1][1], reverse=True):
+            per_call = seconds / calls * 1e6 if calls else 0.0
+            lines.append(f"{rule:<20}{calls:>10}{seconds * 1000:>12.1f}{per_call:>10.1f}{seconds / checked:>8.0%}")
+        if files:
+            ranked = sorted(self.file_rules.items(),
+                            key=lambda item: sum(seconds for _, seconds in item[1].values()), reverse=True)
+            for file_path, rules in ranked[:files]:
+                costliest = sorted(rules.items(), key=lambda item: item[1][1], reverse=True)[:3]
+                breakdown = ", ".join(f"{rule} {seconds * 1000:.1f} ms" for rule, (_, seconds) in costliest)
+                lines.append(f"  {file_path}: {breakdown}")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        """JSON-serializable form of the aggregated metrics"""
+        return {
+            'files': self.files,
+            'tokens': self.tokens,
+            'nodes': self.nodes,
+            'parse_cache_hits': self.cache_hits,
+            'totals': dict(self.totals),
+            'gc': {'seconds': self.gc_seconds, 'collections': self.gc_collections},
+            'percentiles': {phase: self.percentiles(phase) for phase in PHASES + ('total',)},
+            'rules': {rule: {'calls': calls, 'seconds': seconds} for rule, (calls, seconds) in self.rules.items()},
+            'file_rules': {
+                file_path: {rule: {'calls': calls, 'seconds': seconds} for rule, (calls, seconds) in rules.items()}
+                for file_path, rules in self.file_rules.items()
+            },
+        }
@@ -0,0 +1,142 @@
+"""
+Scheduling Module
+Estimates the lint cost of files from their size and previous runs and
+orders work longest-first, with small files batched together
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Assumed lint cost before any history exists
+DEFAULT_SECONDS_PER_BYTE = 2e-5
+
+# Files cheaper than this are grouped into batches of about this much work
+BATCH_TARGET_SECONDS = 0.25
+MAX_BATCH_FILES = 64
+
+# Keep batches small enough that every worker gets several tasks
+MIN_TASKS_PER_WORKER = 4
+
+
+def default_history_path():
+    """Per-user history file, preferring XDG_CACHE_HOME when available"""
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'pylinter', 'cost_history.json')
+
+
+class CostHistory:
+    """Measured lint times of files from previous runs, persisted as JSON"""
+
+    def __init__(self, path=None):
+        """
+        Initialize cost history
+
+        Args:
+            path: JSON file to load from and save to (None keeps it in memory)
+        """
+        self.path = Path(path) if path else None
+        self.entries = {}  # file path -> [size in bytes, seconds]
+        self._changed = False
+        self.save_failures = 0
+        self.load()
+
+    def load(self):
+        """Load history from disk; a missing or corrupt file starts empty"""
+        if self.path is None:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            self.entries = {key: value for key, value in entries.items()
+                            if isinstance(value, list) and len(value) == 2}
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def save(self):
+        """Write history to disk if it changed; failures are counted in save_failures"""
+        if self.path is None or not self._changed:
+            return
+        temp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A temp file of its own per writer, so concurrent runs never share one
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix='.tmp')
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(temp_path, self.path)
+            self._changed = False
+        except OSError:
+            self.save_failures += 1
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def record(self, file_path, size, seconds):
+        """Remember how long a file of the given size took to lint"""
+        self.entries[str(file_path)] = [size, seconds]
+        self._changed = True
+
+    def seconds_per_byte(self):
+        """Average lint cost per byte over all recorded files"""
+        total_bytes = sum(size for size, _ in self.entries.values())
+        if total_bytes <= 0:
+            return DEFAULT_SECONDS_PER_BYTE
+        return sum(seconds for _, seconds in self.entries.values()) / total_bytes
+
+    def estimate(self, file_path, size, seconds_per_byte=None):
+        """
+        Estimate the lint time of a file
+
+        Args:
+            file_path: Path of the file
+            size: Current size in bytes
+            seconds_per_byte: Fallback rate for files without history
+
+        Returns:
+            Estimated seconds
+        """
+        entry = self.entries.get(str(file_path))
+        if entry is not None and entry[0] > 0:
+            # Scale the last measurement by how much the file grew or shrank
+            return entry[1] * size / entry[0]
+        if seconds_per_byte is None:
+            seconds_per_byte = self.seconds_per_byte()
+        return size * seconds_per_byte
+
+
+def schedule(jobs, workers, batch_target=BATCH_TARGET_SECONDS, max_batch=MAX_BATCH_FILES):
+    """
+    Order work longest-processing-time first, batching cheap jobs
+
+    Args:
+        jobs: List of (estimated_seconds, job) tuples
+        workers: Number of worker processes
+        batch_target: Cost below which jobs are batched, and the cost a
+            batch is filled up to
+        max_batch: Maximum number of jobs in one batch
+
+    Returns:
+        List of (estimated_seconds, [job, ...]) tasks in submission order
+    """
+    total = sum(cost for cost, _ in jobs)
+    batch_target = min(batch_target, total / (max(workers, 1) * MIN_TASKS_PER_WORKER))
+
+    tasks = []
+    batch, batch_cost = [], 0.0
+    for cost, job in sorted(jobs, key=lambda item: item[0], reverse=True):
+        if cost >= batch_target:
+            tasks.append((cost, [job]))
+            continue
+        batch.append(job)
+        batch_cost += cost
+        if batch_cost >= batch_target or len(batch) >= max_batch:
+            tasks.append((batch_cost, batch))
+            batch, batch_cost = [], 0.0
+    if batch:
+        tasks.append((batch_cost, batch))
+
+    tasks.sort(key=lambda task: task[0], reverse=True)
+    return tasks
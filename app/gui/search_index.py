@@ -0,0 +1,134 @@
+"""
+Search Index Module
+Inverted index for full-text search over linter results
+"""
+import re
+from bisect import bisect_left
+from functools import lru_cache
+
+TOKEN_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*|\d+')
+WORD_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search tokens
+
+    Identifiers are kept whole (so 'complex_logic' is one token) and are
+    also split into their snake_case and camelCase words, so searching
+    for 'logic' or 'undefined' finds 'complex_logic' and
+    'complexUndefinedVariables'.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of tokens
+    """
+    tokens = set()
+    for match in TOKEN_PATTERN.findall(text):
+        tokens.add(match.lower())
+        words = WORD_PATTERN.findall(match)
+        if len(words) > 1:
+            tokens.update(word.lower() for word in words)
+    return tokens
+
+
+# File paths repeat for every issue of a file, so their tokens are cached
+_path_tokens = lru_cache(maxsize=4096)(tokenize)
+
+
+class SearchIndex:
+    """
+    Inverted index from tokens to issue ids
+
+    Every issue is indexed by the tokens of its message (which include
+    the function, class and variable names quoted by the linters) and of
+    its file path. Query words are matched as whole tokens (or as token
+    prefixes when they end with '*') and combined with AND, so the cost of
+    a query depends on the size of the matching posting lists rather than
+    on the number of issues.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop all indexed issues"""
+        self._postings = {}
+        self._issues = {}
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+
+    def __len__(self):
+        return len(self._issues)
+
+    def _issue_tokens(self, issue):
+        return tokenize(issue.message) | _path_tokens(issue.file)
+
+    def add(self, issue):
+        """Index a single issue"""
+        self._issues[issue.id] = issue
+        for token in self._issue_tokens(issue):
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = posting = set()
+                self._vocabulary_dirty = True
+            posting.add(issue.id)
+
+    def remove(self, issue):
+        """Remove a previously indexed issue"""
+        if self._issues.pop(issue.id, None) is None:
+            return
+        for token in self._issue_tokens(issue):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(issue.id)
+            if not posting:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+
+    def _prefix_ids(self, prefix):
+        """Union of posting lists of every token starting with prefix"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        ids = set()
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary):
+            token = self._vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            ids |= self._postings[token]
+            position += 1
+        return ids
+
+    def search(self, query):
+        """
+        Find issues matching every word of a query
+
+        Args:
+            query: Free text; words ending with '*' are matched as prefixes
+
+        Returns:
+            List of matching Issue objects in the order they were added
+        """
+        postings = []
+        for word in query.split():
+            if word.endswith('*') and word.rstrip('*'):
+                postings.append(self._prefix_ids(word.rstrip('*').lower()))
+            else:
+                postings.extend(self._postings.get(token, set()) for token in tokenize(word))
+        if not postings:
+            return []
+
+        # Intersect starting from the smallest posting list
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return [self._issues[issue_id] for issue_id in sorted(result)]
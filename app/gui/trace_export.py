@@ -0,0 +1,101 @@
+"""
+Trace Export Module
+Writes the phase spans recorded by traced lint runs as a Chrome Trace
+Event JSON file, which loads in Perfetto (ui.perfetto.dev) and
+chrome://tracing
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+# Span names that enclose the phases of one lint
+ENCLOSING_SPANS = ('file', 'chunk')
+
+# Spans that overlap the next lint of their worker go on a separate track
+IPC_SPANS = ('serialize',)
+
+# Thread ids of the tracks shown for every process
+LINT_TRACK = 1
+IPC_TRACK = 2
+TRACK_NAMES = {LINT_TRACK: 'lint', IPC_TRACK: 'ipc'}
+
+
+class TraceRecorder:
+    """Collects spans from lint results and the coordinating process"""
+
+    def __init__(self):
+        """Initialize an empty trace; timestamps are relative to its creation"""
+        self.origin = time.perf_counter()
+        self.events = []
+        self._tracks = set()
+        self.main_pid = os.getpid()
+
+    def add_span(self, name, start, end, pid=None, category='lint', args=None, track=LINT_TRACK):
+        """
+        Add one complete ('X') event
+
+        Args:
+            name: Event name shown on the timeline
+            start: perf_counter() time the span started
+            end: perf_counter() time the span ended
+            pid: Process the span ran in (default: this process)
+            category: Trace event category
+            args: Optional dict shown when the event is selected
+            track: LINT_TRACK or IPC_TRACK
+        """
+        pid = self.main_pid if pid is None else pid
+        self._tracks.add((pid, track))
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - self.origin) * 1e6,
+            'dur': max(end - start, 0.0) * 1e6,
+            'pid': pid,
+            'tid': track,
+        }
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def add_result(self, result):
+        """Add the spans of a traced result; untraced results are ignored"""
+        spans = result.get('metrics', {}).get('spans')
+        if not spans:
+            return
+        file_path = result['file']
+        for name, start, end, pid in spans:
+            if name in ENCLOSING_SPANS:
+                self.add_span(Path(file_path).name, start, end, pid, category=name, args={'file': file_path})
+            elif name in IPC_SPANS:
+                self.add_span(name, start, end, pid, category='ipc', args={'file': file_path}, track=IPC_TRACK)
+            else:
+                self.add_span(name, start, end, pid, category='phase', args={'file': file_path})
+
+    def add_results(self, results):
+        """Add the spans of several results"""
+        for result in results:
+            self.add_result(result)
+
+    def to_dict(self):
+        """Trace Event Format document with process and track names"""
+        metadata = []
+        for pid in sorted({pid for pid, _ in self._tracks}):
+            label = 'main' if pid == self.main_pid else f'worker {pid}'
+            metadata.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': LINT_TRACK, 'args': {'name': label}})
+        for pid, track in sorted(self._tracks):
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': track,
+                             'args': {'name': TRACK_NAMES[track]}})
+        events = sorted(self.events, key=lambda event: (event['ts'], -event['dur']))
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path):
+        """
+        Write the trace to a JSON file
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
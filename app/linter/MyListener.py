@@ -7,10 +7,37 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated'))
 
 from PythonParserListener import PythonParserListener
 from PythonParser import PythonParser
+from linter.rule_profiler import disable_rules
+from linter.rule_levels import LEVEL_LINES, LEVEL_TOKENS, LEVEL_TREE
 import re
 
+# Pemisah baris yang juga dipakai lexer (CR saja juga mengakhiri baris)
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
 class AdvancedCleanCodeListener(PythonParserListener):
 
+    # Rule -> method yang menjalankan pengecekannya (untuk profiling & disabled_rules)
+    RULES = {
+        'naming': ('check_function_naming', 'check_variable_naming'),
+        'length': ('check_function_length',),
+        'complexity': ('increment_complexity', 'check_complexity'),
+        'arguments': ('check_arguments',),
+        'nesting': ('check_nesting',),
+        'builtin_shadowing': ('check_builtin_shadowing',),
+        'line_length': ('check_line_length',),
+    }
+
+    # Rule -> level analisis minimum (lihat linter/rule_levels.py)
+    RULE_LEVELS = {
+        'naming': LEVEL_TOKENS,
+        'length': LEVEL_TREE,
+        'complexity': LEVEL_TREE,
+        'arguments': LEVEL_TREE,
+        'nesting': LEVEL_TREE,
+        'builtin_shadowing': LEVEL_TOKENS,
+        'line_length': LEVEL_LINES,
+    }
+
     def __init__(self, config):
         self.config = config
         self.violations = [] 
@@ -21,6 +48,9 @@ class AdvancedCleanCodeListener(PythonParserListener):
         # Keyword yang diabaikan saat mencari nama variabel/fungsi
         self.keywords = {'def', 'class', 'return', 'if', 'elif', 'else', 'while', 'for', 'in', 'pass', 'break', 'continue', 'lambda', 'await', 'async'}
 
+        # Rule yang dimatikan lewat config diganti dengan no-op
+        disable_rules(self, config.get('disabled_rules', ()))
+
     # -------------------------------
     # HELPER: FLATTEN TREE TO TOKENS
     # (Logika "Senjata Pamungkas" agar data selalu ketemu)
@@ -60,19 +90,8 @@ class AdvancedCleanCodeListener(PythonParserListener):
         line = ctx.start.line
         self.scopes.append(set())
 
-        # Cek Snake Case (skip if naming convention is 'none')
         if func_name != "unknown" and func_name not in self.keywords:
-            convention = self.config['naming_convention']['function']
-            if convention != 'none':
-                if convention == 'snake_case':
-                    if not re.match(r"^[a-z_][a-z0-9_]*$", func_name):
-                        self.log(line, f"Naming: Fungsi '{func_name}' harus snake_case.")
-                elif convention == 'camelCase':
-                    if not re.match(r"^[a-z][a-zA-Z0-9]*$", func_name):
-                        self.log(line, f"Naming: Fungsi '{func_name}' harus camelCase.")
-                elif convention == 'PascalCase':
-                    if not re.match(r"^[A-Z][a-zA-Z0-9]*$", func_name):
-                        self.log(line, f"Naming: Fungsi '{func_name}' harus PascalCase.")
+            self.check_function_naming(func_name, line)
 
         # Simpan metrik
         self.func_stack.append({
@@ -86,11 +105,30 @@ class AdvancedCleanCodeListener(PythonParserListener):
         func = self.func_stack.pop()
         self.scopes.pop()
 
+        self.check_function_length(func, ctx)
+        self.check_complexity(func)
+
+    def check_function_naming(self, func_name, line):
+        # Cek Snake Case (skip if naming convention is 'none')
+        convention = self.config['naming_convention']['function']
+        if convention != 'none':
+            if convention == 'snake_case':
+                if not re.match(r"^[a-z_][a-z0-9_]*$", func_name):
+                    self.log(line, f"Naming: Fungsi '{func_name}' harus snake_case.")
+            elif convention == 'camelCase':
+                if not re.match(r"^[a-z][a-zA-Z0-9]*$", func_name):
+                    self.log(line, f"Naming: Fungsi '{func_name}' harus camelCase.")
+            elif convention == 'PascalCase':
+                if not re.match(r"^[A-Z][a-zA-Z0-9]*$", func_name):
+                    self.log(line, f"Naming: Fungsi '{func_name}' harus PascalCase.")
+
+    def check_function_length(self, func, ctx):
         # Cek Panjang
         length = ctx.stop.line - func["start_line"] + 1
         if length > self.config.get('max_function_lines', 20):
              self.log(func['start_line'], f"Panjang: Fungsi '{func['name']}' ({length} baris) melebihi batas.")
 
+    def check_complexity(self, func):
         # Cek Kompleksitas
         if func["complexity"] > self.config.get('max_cyclomatic_complexity', 5):
              self.log(func['start_line'], f"Kompleksitas: Fungsi '{func['name']}' terlalu rumit (Score: {func['complexity']}).")
@@ -103,36 +141,54 @@ class AdvancedCleanCodeListener(PythonParserListener):
         if not tokens: return
         
         # Asumsi token pertama adalah target variabel
-        var_name = tokens[0]
-        line = ctx.start.line
+        self.check_assignment_target(tokens[0], ctx.start.line)
 
+    def check_assignment_target(self, var_name, line):
         # Filter: identifier valid & bukan keyword (seperti self)
         if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", var_name) and var_name != 'self':
-            
-            # Cek Shadowing Built-in
-            builtins = {'print', 'list', 'str', 'int', 'dict', 'set', 'len', 'range', 'type', 'id'}
-            if var_name in builtins:
-                self.log(line, f"Shadowing Built-in: Variable '{var_name}' merusak fungsi bawaan Python.")
-            
-            # Cek Naming (skip if naming convention is 'none')
-            else:
-                convention = self.config['naming_convention']['variable']
-                if convention != 'none':
-                    if convention == 'snake_case':
-                        # Izinkan huruf besar semua (CONSTANT)
-                        if not re.match(r"^[a-z_][a-z0-9_]*$", var_name) and not var_name.isupper():
-                            self.log(line, f"Naming: Variable '{var_name}' harus snake_case.")
-                    elif convention == 'camelCase':
-                        if not re.match(r"^[a-z][a-zA-Z0-9]*$", var_name):
-                            self.log(line, f"Naming: Variable '{var_name}' harus camelCase.")
-                    elif convention == 'PascalCase':
-                        if not re.match(r"^[A-Z][a-zA-Z0-9]*$", var_name):
-                            self.log(line, f"Naming: Variable '{var_name}' harus PascalCase.")
+            # Nama built-in hanya dilaporkan sebagai shadowing, bukan naming
+            if not self.check_builtin_shadowing(var_name, line):
+                self.check_variable_naming(var_name, line)
+
+    def check_line_length(self, source, first_line=1):
+        # Cek Panjang Baris (0 / tidak diset = mati)
+        limit = self.config.get('max_line_length')
+        if not limit:
+            return
+        for line, text in enumerate(LINE_BREAK.split(source), first_line):
+            if len(text) > limit:
+                self.log(line, f"Panjang Baris: {len(text)} karakter melebihi batas ({limit}).")
+
+    def check_builtin_shadowing(self, var_name, line):
+        # Cek Shadowing Built-in
+        builtins = {'print', 'list', 'str', 'int', 'dict', 'set', 'len', 'range', 'type', 'id'}
+        if var_name in builtins:
+            self.log(line, f"Shadowing Built-in: Variable '{var_name}' merusak fungsi bawaan Python.")
+            return True
+        return False
+
+    def check_variable_naming(self, var_name, line):
+        # Cek Naming (skip if naming convention is 'none')
+        convention = self.config['naming_convention']['variable']
+        if convention != 'none':
+            if convention == 'snake_case':
+                # Izinkan huruf besar semua (CONSTANT)
+                if not re.match(r"^[a-z_][a-z0-9_]*$", var_name) and not var_name.isupper():
+                    self.log(line, f"Naming: Variable '{var_name}' harus snake_case.")
+            elif convention == 'camelCase':
+                if not re.match(r"^[a-z][a-zA-Z0-9]*$", var_name):
+                    self.log(line, f"Naming: Variable '{var_name}' harus camelCase.")
+            elif convention == 'PascalCase':
+                if not re.match(r"^[A-Z][a-zA-Z0-9]*$", var_name):
+                    self.log(line, f"Naming: Variable '{var_name}' harus PascalCase.")
 
     # -------------------------------
     # 3. PARAMETERS
     # -------------------------------
     def enterParameters(self, ctx):
+        self.check_arguments(ctx)
+
+    def check_arguments(self, ctx):
         # Ambil text mentah "(a,b,c)"
         raw = ctx.getText().replace("(", "").replace(")", "")
         if not raw.strip(): count = 0
@@ -156,6 +212,9 @@ class AdvancedCleanCodeListener(PythonParserListener):
     # Nama method 'enterBlock' ini standar jika rule di grammar namanya 'block'
     def enterBlock(self, ctx):
         self.current_depth += 1
+        self.check_nesting(ctx)
+
+    def check_nesting(self, ctx):
         if self.current_depth > self.config.get('max_nesting_depth', 3):
             self.log(ctx.start.line, f"Nesting: Terlalu dalam ({self.current_depth}).")
 
@@ -6,6 +6,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated'))
 
 from PythonParserVisitor import PythonParserVisitor
 from PythonParser import PythonParser
+from linter.rule_profiler import disable_rules
+from linter.rule_levels import LEVEL_SCOPES
 
 class Scope:
     """Represents a scope (global or function-local)."""
@@ -38,6 +40,20 @@ class MySemanticVisitor(PythonParserVisitor):
     - Report undefined variable access
     """
     
+    # Rule -> methods that implement its check (for profiling and disabled_rules)
+    RULES = {
+        'undefined_names': ('check_undefined_name',),
+    }
+    
+    # Rule -> analysis level it needs (see linter/rule_levels.py)
+    RULE_LEVELS = {
+        'undefined_names': LEVEL_SCOPES,
+    }
+    
+    # Rules whose contexts are recognised by class name below; compact
+    # trees (linter/compact_tree.py) never collapse them
+    INSPECTED_RULES = ('with_item', 'for_if_clauses', 'for_if_clause')
+    
     def __init__(self, config=None):
         self.current_scope = Scope("Global")
         self.global_scope = self.current_scope
@@ -55,6 +71,9 @@ class MySemanticVisitor(PythonParserVisitor):
             self.strict_import_tracking = True
         
         self._init_builtins()
+        
+        if config:
+            disable_rules(self, config.get('disabled_rules', ()))
     
     def _init_builtins(self):
         """Add built-in functions and keywords to global scope."""
@@ -569,10 +588,15 @@ class MySemanticVisitor(PythonParserVisitor):
         Check NAME tokens in atoms (simple variable references).
         Report undefined variables based on configuration.
         """
-        text = ctx.getText()
-        
         # Don't process comprehensions here - they're handled by their own visit methods
         # Just check variable usage in simple atoms
+        self.check_undefined_name(ctx)
+        
+        return self.visitChildren(ctx)
+    
+    def check_undefined_name(self, ctx):
+        """Report an atom that names a variable not defined in any enclosing scope."""
+        text = ctx.getText()
         try:
             # Only check if it's a simple identifier
             if text.isidentifier() and not text[0].isdigit():
@@ -597,8 +621,6 @@ class MySemanticVisitor(PythonParserVisitor):
                             print(f"  ❌ [ERROR] Undefined variable: '{text}' ({location}) in scope '{self.current_scope.name}'")
         except:
             pass
-        
-        return self.visitChildren(ctx)
     
     # ===== FUNCTION DEFINITIONS =====
     
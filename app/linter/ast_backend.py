@@ -0,0 +1,601 @@
+"""
+AST backend for the clean-code rules and the semantic checks
+
+Runs AdvancedCleanCodeListener and MySemanticVisitor on CPython's built-in
+ast module instead of an ANTLR parse tree. The rule methods themselves are
+shared: the walkers below call the listener's enter/exit methods and the
+visitor's visit methods with small stand-ins for ANTLR rule contexts, built
+from the module's tokens, so both backends report the same findings in the
+same order and with the same wording.
+
+Only sources that CPython accepts can be linted this way; LinterRunner
+falls back to the ANTLR backend for everything else.
+"""
+import ast
+import io
+import re
+import sys
+import tokenize
+import unicodedata
+from bisect import bisect_left
+
+from linter.MyListener import AdvancedCleanCodeListener
+from linter.MySemanticVisitor import MySemanticVisitor, Scope
+
+# Texts the ANTLR lexer gives the layout tokens
+_LAYOUT_TEXTS = {tokenize.INDENT: '<INDENT>', tokenize.DEDENT: '<DEDENT>', tokenize.ENDMARKER: '<EOF>'}
+_LAYOUT_TYPES = (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT)
+_OPENING = {'(', '[', '{'}
+_CLOSING = {')', ']', '}'}
+_IDENTIFIER = re.compile(r'\w+')
+
+# The walkers need the end positions ast nodes have from Python 3.8 on
+AST_BACKEND_SUPPORTED = sys.version_info >= (3, 8)
+
+
+class SourceTokens:
+    """
+    Tokens of a module with the texts and line numbers the ANTLR lexer
+    would give them, looked up by ast node positions
+    """
+
+    def __init__(self, source):
+        self.lines = source.split('\n')
+        self.tokens = [token for token in tokenize.generate_tokens(io.StringIO(source).readline)
+                       if token.type not in (tokenize.COMMENT, tokenize.NL)]
+        self.starts = [token.start for token in self.tokens]
+        # A NEWLINE added at the end of the file has no text; ANTLR's is '<NEWLINE>'
+        self.texts = [_LAYOUT_TEXTS.get(token.type, token.string) or '<NEWLINE>'
+                      for token in self.tokens]
+        self.eof_line = source.count('\n') + 1
+        self.ends_with_newline = source.endswith('\n')
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def column(self, line, offset):
+        """Character column of an ast UTF-8 byte offset"""
+        text = self.lines[line - 1]
+        if text.isascii():
+            return offset
+        return len(text.encode('utf-8')[:offset].decode('utf-8', 'replace'))
+
+    def index(self, line, offset):
+        """Index of the first token at or after an ast (line, byte offset)"""
+        index = bisect_left(self.starts, (line, self.column(line, offset)))
+        # DEDENTs start where the statement after them does
+        while self.tokens[index].type == tokenize.DEDENT:
+            index += 1
+        return index
+
+    def token_at(self, node):
+        """
+        Index of the token a node starts with, or -1 if it starts inside a
+        token (in an f-string, which tokenize keeps as one token before
+        Python 3.12)
+        """
+        position = (node.lineno, self.column(node.lineno, node.col_offset))
+        index = self.index(node.lineno, node.col_offset)
+        return index if self.starts[index] == position else -1
+
+    def name(self, node):
+        """
+        Text of an ast.Name as written in the source
+
+        ast normalizes identifiers (NFKC), even to ASCII ('width' for its
+        full-width spelling). Names inside f-strings are read from the
+        line itself.
+        """
+        index = self.token_at(node)
+        if index >= 0:
+            return self.texts[index]
+        match = _IDENTIFIER.match(self.lines[node.lineno - 1], self.column(node.lineno, node.col_offset))
+        if match and unicodedata.normalize('NFKC', match.group()) == node.id:
+            return match.group()
+        return node.id
+
+    def start(self, node):
+        """Index of a node's first token, the '@' of its first decorator if it has any"""
+        decorators = getattr(node, 'decorator_list', None)
+        if decorators:
+            index = self.start(decorators[0])
+            while self.texts[index] != '@':
+                index -= 1
+            return index
+        return self.index(node.lineno, node.col_offset)
+
+    def end(self, node):
+        """Index just past a node's last token"""
+        return self.index(node.end_lineno, node.end_col_offset)
+
+    def line(self, index):
+        return self.tokens[index].start[0]
+
+    def text(self, first, last):
+        """ANTLR getText() of tokens[first:last]"""
+        return ''.join(self.texts[first:last])
+
+    def closing(self, index):
+        """Index of the bracket that closes the one at index"""
+        depth = 0
+        for position in range(index, len(self.texts)):
+            text = self.texts[position]
+            if text in _OPENING:
+                depth += 1
+            elif text in _CLOSING:
+                depth -= 1
+                if not depth:
+                    return position
+        return len(self.texts)
+
+    def find(self, text, first, last=None):
+        """Index of the first token in [first, last) with this text outside brackets"""
+        depth = 0
+        for position in range(first, len(self.texts) if last is None else last):
+            token = self.texts[position]
+            if token in _OPENING:
+                depth += 1
+            elif token in _CLOSING:
+                depth -= 1
+            elif token == text and not depth:
+                return position
+        return -1
+
+    def next_line(self, index):
+        """Line of the first token at or after index that is not NEWLINE, INDENT, DEDENT or a trailing ';'"""
+        while self.tokens[index].type in _LAYOUT_TYPES or self.texts[index] == ';':
+            index += 1
+        if self.tokens[index].type == tokenize.ENDMARKER:
+            return self.eof_line
+        return self.line(index)
+
+    def dedent_line(self, index):
+        """Line ANTLR gives the DEDENTs that close the blocks ending before index"""
+        return self.next_line(index)
+
+    def newline_line(self, index):
+        """
+        Line ANTLR gives the NEWLINE that ends the statement before index
+
+        The lexer folds following blank and comment lines into it, so it
+        sits on the line before the next token (or on the last line at the
+        end of the file).
+        """
+        line = self.next_line(index)
+        if line == self.eof_line and not self.ends_with_newline:
+            return line
+        return line - 1
+
+    def block_line(self, body):
+        """Line of the first token of a block (its NEWLINE, unless it is on the header's line)"""
+        first = self.start(body[0])
+        if self.tokens[first - 1].type == tokenize.INDENT:
+            return self.line(first) - 1
+        return self.line(first)
+
+    def block_end_line(self, body):
+        """Line of the last token of a block (a DEDENT, unless it is on the header's line)"""
+        first = self.start(body[0])
+        end = self.end(body[-1])
+        if self.tokens[first - 1].type == tokenize.INDENT:
+            return self.dedent_line(end)
+        return self.newline_line(end)
+
+    def target(self, node, keyword):
+        """
+        Token range of an assignment target written after keyword ('for'
+        or 'as'), including parentheses the ast node does not cover
+
+        Returns:
+            (first, last) token indexes
+        """
+        first = self.start(node)
+        opened = 0
+        while self.texts[first - 1] != keyword:
+            first -= 1
+            opened += 1
+        last = self.end(node)
+        if keyword == 'for':
+            # Up to 'in', past closing parentheses and a trailing comma
+            while self.texts[last] != 'in':
+                last += 1
+        else:
+            last += opened
+        return first, last
+
+
+class _Token:
+    """Line of a token, the only thing the linters read from ctx.start/ctx.stop"""
+
+    __slots__ = ('line',)
+
+    def __init__(self, line):
+        self.line = line
+
+
+class _Context:
+    """
+    Stand-in for the ANTLR rule context of an ast node
+
+    Offers what the linters read from a context: the start and stop token
+    lines, getText() and the token texts (for the listener's get_tokens),
+    plus the ast nodes the semantic visitor should visit as its children.
+    """
+
+    __slots__ = ('source', 'first', 'last', 'start', 'stop', 'children')
+
+    def __init__(self, source, first, last, start_line=None, stop_line=None, children=()):
+        self.source = source
+        self.first = first
+        self.last = last
+        self.start = _Token(source.line(first) if start_line is None else start_line)
+        self.stop = _Token(source.line(last - 1) if stop_line is None else stop_line)
+        self.children = children
+
+    def getText(self):
+        return self.source.text(self.first, self.last)
+
+    @property
+    def tokens(self):
+        return self.source.texts[self.first:self.last]
+
+
+class _Leaf:
+    """Stand-in for the context of a single-token atom"""
+
+    __slots__ = ('text', 'start')
+
+    children = ()
+
+    def __init__(self, text, line):
+        self.text = text
+        self.start = _Token(line)
+
+    def getText(self):
+        return self.text
+
+
+class AstCleanCodeListener(AdvancedCleanCodeListener):
+    """
+    AdvancedCleanCodeListener driven by a walk over an ast module
+
+    The walk fires the listener events a ParseTreeWalker would fire for
+    the same code and in the same order: function_def, parameters,
+    assignment, block, if_stmt (not elif), while_stmt and for_stmt.
+    """
+
+    def __init__(self, config, source):
+        """
+        Args:
+            config: Configuration dictionary for linter rules
+            source: SourceTokens of the module
+        """
+        super().__init__(config)
+        self.source = source
+
+    def get_tokens(self, ctx):
+        return ctx.tokens
+
+    def walk(self, tree):
+        """Run the rules over an ast.Module"""
+        self._statements(tree.body)
+
+    def _statements(self, body):
+        for node in body:
+            method = self._STATEMENTS.get(type(node))
+            if method is not None:
+                method(self, node)
+
+    def _block(self, body):
+        ctx = _Context(self.source, self.source.start(body[0]), self.source.end(body[-1]),
+                       start_line=self.source.block_line(body))
+        self.enterBlock(ctx)
+        self._statements(body)
+        self.exitBlock(ctx)
+
+    def _function(self, node):
+        source = self.source
+        first = source.start(node)
+        keyword = source.index(node.lineno, node.col_offset)
+        name = keyword + 2 if source.texts[keyword] == 'async' else keyword + 1
+        # The listener only looks at the tokens up to the name
+        self.enterFunction_def(_Context(source, first, name + 1))
+        opening = name + 1
+        closing = source.closing(opening)
+        if closing > opening + 1:
+            self.enterParameters(_Context(source, opening + 1, closing))
+        self._block(node.body)
+        self.exitFunction_def(_Context(source, first, source.end(node),
+                                       stop_line=source.block_end_line(node.body)))
+
+    def _class(self, node):
+        self._block(node.body)
+
+    def _assignment(self, node):
+        self.enterAssignment(_Context(self.source, self.source.start(node), self.source.end(node)))
+
+    def _is_elif(self, node):
+        orelse = node.orelse
+        return (len(orelse) == 1 and isinstance(orelse[0], ast.If)
+                and self.source.texts[self.source.start(orelse[0])] == 'elif')
+
+    def _if(self, node):
+        self.enterIf_stmt(None)
+        self._if_branches(node)
+
+    def _if_branches(self, node):
+        # elif branches are elif_stmt in the grammar: nested like if, but not counted
+        self._block(node.body)
+        if self._is_elif(node):
+            self._if_branches(node.orelse[0])
+        elif node.orelse:
+            self._block(node.orelse)
+
+    def _for(self, node):
+        self.enterFor_stmt(None)
+        self._loop_blocks(node)
+
+    def _while(self, node):
+        self.enterWhile_stmt(None)
+        self._loop_blocks(node)
+
+    def _loop_blocks(self, node):
+        self._block(node.body)
+        if node.orelse:
+            self._block(node.orelse)
+
+    def _with(self, node):
+        self._block(node.body)
+
+    def _try(self, node):
+        self._block(node.body)
+        for handler in node.handlers:
+            self._block(handler.body)
+        if node.orelse:
+            self._block(node.orelse)
+        if node.finalbody:
+            self._block(node.finalbody)
+
+    def _match(self, node):
+        # match_stmt has no block of its own, only its case blocks
+        for case in node.cases:
+            self._block(case.body)
+
+    _STATEMENTS = {
+        ast.FunctionDef: _function,
+        ast.AsyncFunctionDef: _function,
+        ast.ClassDef: _class,
+        ast.Assign: _assignment,
+        ast.AugAssign: _assignment,
+        ast.AnnAssign: _assignment,
+        ast.If: _if,
+        ast.For: _for,
+        ast.AsyncFor: _for,
+        ast.While: _while,
+        ast.With: _with,
+        ast.AsyncWith: _with,
+        ast.Try: _try,
+    }
+    if hasattr(ast, 'Match'):
+        _STATEMENTS[ast.Match] = _match
+    if hasattr(ast, 'TryStar'):
+        _STATEMENTS[ast.TryStar] = _try
+
+
+class AstSemanticVisitor(MySemanticVisitor):
+    """
+    MySemanticVisitor driven by a walk over an ast module
+
+    Names are checked where the ANTLR visitor sees an atom: Name nodes that
+    are read, outside the first target of an assignment and outside match
+    patterns. Scopes, definitions and their string-based extraction are the
+    visitor's own, fed with the same token texts.
+    """
+
+    def __init__(self, config, source):
+        """
+        Args:
+            config: Configuration dictionary (may be None)
+            source: SourceTokens of the module
+        """
+        super().__init__(config)
+        self.source = source
+
+    def visit(self, node):
+        """Visit an ast node (an ast.Module to check a whole file)"""
+        method = self._NODES.get(type(node))
+        if method is not None:
+            method(self, node)
+        else:
+            for child in self._children(node):
+                self.visit(child)
+
+    def visitChildren(self, ctx):
+        for child in ctx.children:
+            self.visit(child)
+
+    def _children(self, node):
+        """Child nodes in source order"""
+        if isinstance(node, ast.expr):
+            children = [child for child in ast.iter_child_nodes(node) if hasattr(child, 'lineno')]
+            children.sort(key=_position)
+            return children
+        return ast.iter_child_nodes(node)
+
+    def _context(self, node, children=()):
+        return _Context(self.source, self.source.start(node), self.source.end(node), children=children)
+
+    def _name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self.visitAtom(_Leaf(self.source.name(node), node.lineno))
+
+    def _import(self, node):
+        self.visitImport_stmt(self._context(node))
+
+    def _assign(self, node):
+        # Names of the first target are defined and the target is not visited
+        first = self.source.start(node)
+        equals = self.source.find('=', first)
+        for name in self._extract_names_from_target(self.source.text(first, equals)):
+            self.current_scope.define(name)
+        for child in node.targets[1:]:
+            self.visit(child)
+        self.visit(node.value)
+
+    def _annotated_assign(self, node):
+        if node.value is None:
+            self.visit(node.target)
+            self.visit(node.annotation)
+            return
+        first = self.source.start(node)
+        if self.source.texts[first] == '(':
+            text = '('
+        else:
+            text = self.source.text(first, self.source.end(node.target))
+        for name in self._extract_names_from_target(text):
+            self.current_scope.define(name)
+        self.visit(node.value)
+
+    def _function(self, node):
+        args = node.args
+        parameters = [arg.annotation for arg in args.posonlyargs + args.args + args.kwonlyargs
+                      if arg.annotation is not None]
+        for arg in (args.vararg, args.kwarg):
+            if arg is not None and arg.annotation is not None:
+                parameters.append(arg.annotation)
+        parameters.extend(args.defaults)
+        parameters.extend(default for default in args.kw_defaults if default is not None)
+        parameters.sort(key=_position)
+        children = node.decorator_list + parameters + ([node.returns] if node.returns else []) + node.body
+        # The extraction helpers only look at the header, up to the body
+        header = _Context(self.source, self.source.start(node), self.source.start(node.body[0]),
+                          children=children)
+        self.visitFunction_def(header)
+
+    def _class(self, node):
+        bases = sorted(node.bases + node.keywords, key=_position)
+        header = _Context(self.source, self.source.start(node), self.source.start(node.body[0]),
+                          children=node.decorator_list + bases + node.body)
+        self.visitClass_def(header)
+
+    def _for(self, node):
+        if isinstance(node, ast.AsyncFor):
+            # visitFor_stmt reads the targets from the second child, 'for' after 'async'
+            text = 'for'
+        else:
+            text = self.source.text(*self.source.target(node.target, 'for'))
+        for name in self._extract_names_from_target(text):
+            self.current_scope.define(name)
+        for child in (node.target, node.iter, *node.body, *node.orelse):
+            self.visit(child)
+
+    def _with(self, node):
+        for item in node.items:
+            if item.optional_vars is None:
+                continue
+            var_text = self.source.text(*self.source.target(item.optional_vars, 'as'))
+            if var_text.isidentifier():
+                self.current_scope.define(var_text)
+            elif ',' in var_text:
+                for name in var_text.split(','):
+                    name = name.strip('()')
+                    if name and name.isidentifier():
+                        self.current_scope.define(name)
+        for item in node.items:
+            self.visit(item.context_expr)
+            if item.optional_vars is not None:
+                self.visit(item.optional_vars)
+        for statement in node.body:
+            self.visit(statement)
+
+    def _except_handler(self, node):
+        source = self.source
+        last = source.end(node)
+        if source.tokens[last].type == tokenize.NEWLINE:
+            last += 1
+        children = ([node.type] if node.type is not None else []) + node.body
+        self.visitExcept_block(_Context(source, source.start(node), last, children=children))
+
+    def _try_star(self, node):
+        # except* blocks are except_star_block, which the visitor does not handle
+        for statement in node.body:
+            self.visit(statement)
+        for handler in node.handlers:
+            if handler.type is not None:
+                self.visit(handler.type)
+            for statement in handler.body:
+                self.visit(statement)
+        for statement in node.orelse + node.finalbody:
+            self.visit(statement)
+
+    def _match(self, node):
+        # Patterns hold no atoms
+        self.visit(node.subject)
+        for case in node.cases:
+            if case.guard is not None:
+                self.visit(case.guard)
+            for statement in case.body:
+                self.visit(statement)
+
+    def _lambda(self, node):
+        defaults = node.args.defaults + [default for default in node.args.kw_defaults if default is not None]
+        for child in sorted(defaults, key=_position):
+            self.visit(child)
+        self.visit(node.body)
+
+    def _comprehension(self, node):
+        parent_scope = self.current_scope
+        name = "Generator" if isinstance(node, ast.GeneratorExp) else "Comprehension"
+        self.current_scope = Scope(name, parent=parent_scope)
+        try:
+            for generator in node.generators:
+                if self.source.token_at(generator.target) < 0:
+                    # Inside an f-string: no tokens to extract the names from
+                    names = [self.source.name(name) for name in ast.walk(generator.target)
+                             if isinstance(name, ast.Name)]
+                else:
+                    names = self._extract_names_from_target(
+                        self.source.text(*self.source.target(generator.target, 'for')))
+                for target_name in names:
+                    self.current_scope.define(target_name)
+            if isinstance(node, ast.DictComp):
+                self.visit(node.key)
+                self.visit(node.value)
+            else:
+                self.visit(node.elt)
+            for generator in node.generators:
+                self.visit(generator.target)
+                self.visit(generator.iter)
+                for condition in generator.ifs:
+                    self.visit(condition)
+        finally:
+            self.current_scope = parent_scope
+
+    _NODES = {
+        ast.Name: _name,
+        ast.Import: _import,
+        ast.ImportFrom: _import,
+        ast.Assign: _assign,
+        ast.AnnAssign: _annotated_assign,
+        ast.FunctionDef: _function,
+        ast.AsyncFunctionDef: _function,
+        ast.ClassDef: _class,
+        ast.For: _for,
+        ast.AsyncFor: _for,
+        ast.With: _with,
+        ast.AsyncWith: _with,
+        ast.ExceptHandler: _except_handler,
+        ast.Lambda: _lambda,
+        ast.ListComp: _comprehension,
+        ast.SetComp: _comprehension,
+        ast.DictComp: _comprehension,
+        ast.GeneratorExp: _comprehension,
+    }
+    if hasattr(ast, 'Match'):
+        _NODES[ast.Match] = _match
+    if hasattr(ast, 'TryStar'):
+        _NODES[ast.TryStar] = _try_star
+
+
+def _position(node):
+    return node.lineno, node.col_offset
@@ -0,0 +1,381 @@
+"""
+Compact parse trees
+
+An ANTLR parse tree spends an object per context and per terminal, and
+most contexts are links in single-child chains (an identifier is an atom
+under a dozen expression levels). CompactTree flattens a parse tree into
+parallel arrays, in pre-order:
+
+    rule          rule index, TERMINAL or ERROR for tokens
+    first, last   token table index of the node's start and stop token
+    parent        parent node, -1 for the root
+    first_child   first child node, -1 if none
+    next_sibling  next child of the same parent, -1 if none
+
+Chains of single-child contexts that no linter looks at are collapsed
+into their lowest node, and the token table only keeps the type, text and
+line of the tokens the parser saw. Once converted the ANTLR tree and its
+token stream can be dropped. A tree built from tokens alone has the token
+table and no nodes, for the token-level rules.
+
+AdvancedCleanCodeListener and MySemanticVisitor run on the compact tree
+unchanged: walk() calls the listener's enter/exit methods and root()
+accepts visitors, both with views that offer what the linters read from
+ANTLR contexts and terminals. Terminal and every-rule listener callbacks
+are not delivered; the linters use neither.
+"""
+from array import array
+
+from antlr4 import Token
+from antlr4.tree.Tree import ErrorNode, TerminalNode
+
+from generated.PythonParser import PythonParser
+
+# Rule index of terminal and error nodes
+TERMINAL = -1
+ERROR = -2
+
+_CALLBACK_PREFIXES = ('enter', 'exit', 'visit')
+# Generated base classes whose methods do nothing for any rule
+_GENERATED_BASES = ('PythonParserListener', 'PythonParserVisitor')
+
+
+def _method_suffix(rule_name):
+    return rule_name[0].upper() + rule_name[1:]
+
+
+def handled_rules(*linters):
+    """
+    Rules a compact tree must keep as nodes for some linter classes
+
+    Those are the rules the classes (or their bases up to the generated
+    listener and visitor) have enter/exit/visit methods for, plus the
+    rules listed in their INSPECTED_RULES, whose contexts they recognise
+    by class name.
+    """
+    suffixes = {_method_suffix(name): name for name in PythonParser.ruleNames}
+    rules = set()
+    for linter in linters:
+        rules.update(getattr(linter, 'INSPECTED_RULES', ()))
+        for klass in linter.__mro__:
+            if klass.__name__ in _GENERATED_BASES or klass is object:
+                break
+            for attribute in vars(klass):
+                for prefix in _CALLBACK_PREFIXES:
+                    if attribute.startswith(prefix) and attribute[len(prefix):] in suffixes:
+                        rules.add(suffixes[attribute[len(prefix):]])
+    return frozenset(rules)
+
+
+class CompactToken:
+    """What the linters read from ctx.start, ctx.stop, terminal symbols and token streams"""
+
+    __slots__ = ('type', 'text', 'line')
+
+    # Only default-channel tokens are kept
+    channel = Token.DEFAULT_CHANNEL
+
+    def __init__(self, type, text, line):
+        self.type = type
+        self.text = text
+        self.line = line
+
+
+class CompactTree:
+    """A parse tree flattened into arrays (see the module docstring)"""
+
+    def __init__(self):
+        self.rule = array('h')
+        self.first = array('i')
+        self.last = array('i')
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        # Token table
+        self.types = array('h')
+        self.texts = []
+        self.lines = array('i')
+        # Table entries from the token stream, before those conjured by
+        # error recovery, and the stream's length including hidden tokens
+        self.lexed = 0
+        self.stream_tokens = 0
+        # Nodes of the ANTLR tree this one was converted from
+        self.parse_nodes = 0
+
+    def __len__(self):
+        return len(self.rule)
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """Tree with the token table of a filled token stream's tokens and no nodes"""
+        compact = cls()
+        compact._add_tokens(tokens)
+        return compact
+
+    def _add_tokens(self, tokens):
+        """Fill the token table; returns token index -> table index (-1 off the default channel)"""
+        table = array('i', [-1]) * len(tokens)
+        for token in tokens:
+            if token.channel == Token.DEFAULT_CHANNEL:
+                table[token.tokenIndex] = len(self.texts)
+                self.types.append(token.type)
+                self.texts.append(token.text)
+                self.lines.append(token.line)
+        self.lexed = len(self.texts)
+        self.stream_tokens = len(tokens)
+        return table
+
+    @classmethod
+    def from_parse_tree(cls, tree, tokens, keep=frozenset()):
+        """
+        Convert an ANTLR parse tree
+
+        Args:
+            tree: Root context returned by the parser
+            tokens: The filled token stream's tokens
+            keep: Names of rules never collapsed (see handled_rules());
+                the root is always kept
+        """
+        compact = cls()
+        table = compact._add_tokens(tokens)
+        types, texts, lines = compact.types, compact.texts, compact.lines
+
+        def table_index(token):
+            if token is None:
+                return -1
+            if token.tokenIndex >= 0:
+                return table[token.tokenIndex]
+            # Conjured by error recovery
+            types.append(token.type)
+            texts.append(token.text)
+            lines.append(token.line)
+            return len(texts) - 1
+
+        kept = [name in keep for name in PythonParser.ruleNames]
+        rule, first, last = compact.rule, compact.first, compact.last
+        parent, first_child, next_sibling = compact.parent, compact.first_child, compact.next_sibling
+        last_child = []
+        parse_nodes = 0
+        stack = [(tree, -1)]
+        while stack:
+            node, parent_index = stack.pop()
+            parse_nodes += 1
+            if isinstance(node, TerminalNode):
+                kind = ERROR if isinstance(node, ErrorNode) else TERMINAL
+                start = stop = table_index(node.symbol)
+                children = None
+            else:
+                children = node.children
+                if parent_index >= 0 and children and len(children) == 1 and not kept[node.getRuleIndex()]:
+                    stack.append((children[0], parent_index))
+                    continue
+                kind = node.getRuleIndex()
+                start = table_index(node.start)
+                stop = table_index(node.stop)
+
+            index = len(rule)
+            rule.append(kind)
+            first.append(start)
+            last.append(stop)
+            parent.append(parent_index)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            last_child.append(-1)
+            if parent_index >= 0:
+                previous = last_child[parent_index]
+                if previous < 0:
+                    first_child[parent_index] = index
+                else:
+                    next_sibling[previous] = index
+                last_child[parent_index] = index
+            if children:
+                stack.extend((child, index) for child in reversed(children))
+        compact.parse_nodes = parse_nodes
+        return compact
+
+    def token(self, index):
+        """CompactToken at a token table index, None for -1"""
+        if index < 0:
+            return None
+        return CompactToken(self.types[index], self.texts[index], self.lines[index])
+
+    def tokens(self):
+        """CompactTokens of the default-channel tokens of the stream, in order"""
+        return [CompactToken(self.types[index], self.texts[index], self.lines[index])
+                for index in range(self.lexed)]
+
+    def children(self, node):
+        """Child nodes of a node"""
+        result = []
+        child = self.first_child[node]
+        while child >= 0:
+            result.append(child)
+            child = self.next_sibling[child]
+        return result
+
+    def subtree_end(self, node):
+        """Node after a node's subtree in pre-order (len(self) for the last one)"""
+        while node >= 0:
+            sibling = self.next_sibling[node]
+            if sibling >= 0:
+                return sibling
+            node = self.parent[node]
+        return len(self)
+
+    def text(self, node):
+        """Concatenated texts of the terminals under a node, as ANTLR's getText()"""
+        rule, first, texts = self.rule, self.first, self.texts
+        if rule[node] < 0:
+            return texts[first[node]]
+        return ''.join([texts[first[index]] for index in range(node, self.subtree_end(node)) if rule[index] < 0])
+
+    def view(self, node):
+        """Context or terminal view of a node"""
+        kind = self.rule[node]
+        if kind == TERMINAL:
+            return TerminalView(self, node)
+        if kind == ERROR:
+            return ErrorView(self, node)
+        return _CONTEXT_VIEWS[kind](self, node)
+
+    def root(self):
+        """View of the root context, for visitor.visit()"""
+        return self.view(0)
+
+    def walk(self, listener, node=0):
+        """Call a listener's enter/exit methods for every context under a node, as ParseTreeWalker does"""
+        names = PythonParser.ruleNames
+        enters = [getattr(listener, 'enter' + _method_suffix(name), None) for name in names]
+        exits = [getattr(listener, 'exit' + _method_suffix(name), None) for name in names]
+        rule, first_child, next_sibling, parent = self.rule, self.first_child, self.next_sibling, self.parent
+        views = {}
+        top = node
+        while node >= 0:
+            kind = rule[node]
+            if kind >= 0 and enters[kind] is not None:
+                views[node] = view = self.view(node)
+                enters[kind](view)
+            child = first_child[node]
+            if child >= 0:
+                node = child
+                continue
+            # Leave the node and every ancestor whose last child it ends
+            while node >= 0:
+                kind = rule[node]
+                if kind >= 0 and exits[kind] is not None:
+                    view = views.pop(node, None) or self.view(node)
+                    exits[kind](view)
+                else:
+                    views.pop(node, None)
+                if node == top:
+                    return
+                sibling = next_sibling[node]
+                if sibling >= 0:
+                    node = sibling
+                    break
+                node = parent[node]
+
+
+class ContextView:
+    """View of a compact context node, with the ANTLR context API the linters use"""
+
+    __slots__ = ('tree', 'node', '_children')
+
+    rule_index = -1
+    _visit = None
+
+    def __init__(self, tree, node):
+        self.tree = tree
+        self.node = node
+        self._children = None
+
+    @property
+    def children(self):
+        if self._children is None:
+            self._children = [self.tree.view(child) for child in self.tree.children(self.node)]
+        return self._children
+
+    @property
+    def start(self):
+        return self.tree.token(self.tree.first[self.node])
+
+    @property
+    def stop(self):
+        return self.tree.token(self.tree.last[self.node])
+
+    @property
+    def parentCtx(self):
+        parent = self.tree.parent[self.node]
+        return None if parent < 0 else self.tree.view(parent)
+
+    def getStart(self):
+        return self.start
+
+    def getStop(self):
+        return self.stop
+
+    def getRuleIndex(self):
+        return self.rule_index
+
+    def getChildCount(self):
+        return len(self.children)
+
+    def getChild(self, i):
+        return self.children[i]
+
+    def getText(self):
+        return self.tree.text(self.node)
+
+    def accept(self, visitor):
+        method = getattr(visitor, self._visit, None)
+        if method is not None:
+            return method(self)
+        return visitor.visitChildren(self)
+
+
+class TerminalView:
+    """View of a compact terminal node"""
+
+    __slots__ = ('tree', 'node')
+
+    def __init__(self, tree, node):
+        self.tree = tree
+        self.node = node
+
+    @property
+    def symbol(self):
+        return self.tree.token(self.tree.first[self.node])
+
+    @property
+    def parentCtx(self):
+        return self.tree.view(self.tree.parent[self.node])
+
+    def getSymbol(self):
+        return self.symbol
+
+    def getChildCount(self):
+        return 0
+
+    def getText(self):
+        return self.tree.texts[self.tree.first[self.node]]
+
+    def accept(self, visitor):
+        return visitor.visitTerminal(self)
+
+
+class ErrorView(TerminalView):
+    """View of a compact error node"""
+
+    __slots__ = ()
+
+    def accept(self, visitor):
+        return visitor.visitErrorNode(self)
+
+
+# ContextView subclass per rule, named like the generated context classes
+# (linters compare class names) and dispatching to the same visit method
+_CONTEXT_VIEWS = [
+    type(_method_suffix(name) + 'Context', (ContextView,),
+         {'__slots__': (), 'rule_index': index, '_visit': 'visit' + _method_suffix(name)})
+    for index, name in enumerate(PythonParser.ruleNames)
+]
@@ -0,0 +1,40 @@
+"""
+Analysis levels of the lint rules
+
+Each linter class maps its rules to the cheapest view of the source the
+check can run on, in RULE_LEVELS next to RULES. A lint stops at the
+deepest level any enabled rule needs, so a run with only token-level
+rules enabled never builds a parse tree.
+"""
+
+# Raw text lines
+LEVEL_LINES = 0
+# Token stream from the lexer
+LEVEL_TOKENS = 1
+# Parse tree
+LEVEL_TREE = 2
+# Scopes built by the semantic visitor over the parse tree
+LEVEL_SCOPES = 3
+
+LEVEL_NAMES = ('lines', 'tokens', 'tree', 'scopes')
+
+
+def enabled_rules(linter, config):
+    """Rules of a linter class that the config does not disable"""
+    disabled = set(config.get('disabled_rules', ()))
+    return [rule for rule in linter.RULES if rule not in disabled]
+
+
+def required_level(linters, config):
+    """
+    Deepest analysis level needed by the enabled rules of some linter classes
+
+    Args:
+        linters: Linter classes that will run (each with RULES and RULE_LEVELS)
+        config: Linter configuration
+
+    Returns:
+        One of the LEVEL_* constants; LEVEL_LINES when no rule is enabled
+    """
+    return max((linter.RULE_LEVELS[rule] for linter in linters for rule in enabled_rules(linter, config)),
+               default=LEVEL_LINES)
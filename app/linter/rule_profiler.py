@@ -0,0 +1,53 @@
+"""
+Per-rule instrumentation for the listener and the semantic visitor
+
+Each linter class lists its rules in a RULES mapping of rule name to the
+names of the methods that implement the check. Instrumentation replaces
+those methods on one linter instance only, so uninstrumented linters run
+the plain methods at no extra cost.
+"""
+import time
+
+
+def _no_op(*args, **kwargs):
+    return None
+
+
+def disable_rules(linter, rules):
+    """
+    Turn off rules on a linter instance
+
+    Args:
+        linter: AdvancedCleanCodeListener or MySemanticVisitor instance
+        rules: Rule names to disable; names the linter does not know are ignored
+    """
+    for rule in rules:
+        for method_name in linter.RULES.get(rule, ()):
+            setattr(linter, method_name, _no_op)
+
+
+def profile_rules(linter, stats):
+    """
+    Attribute the time spent in each rule check of a linter instance
+
+    Args:
+        linter: AdvancedCleanCodeListener or MySemanticVisitor instance
+        stats: Dict updated in place, rule name -> [calls, seconds]
+    """
+    for rule, method_names in linter.RULES.items():
+        counters = stats.setdefault(rule, [0, 0.0])
+        for method_name in method_names:
+            setattr(linter, method_name, _timed(getattr(linter, method_name), counters))
+
+
+def _timed(method, counters):
+    perf_counter = time.perf_counter
+
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            counters[0] += 1
+            counters[1] += perf_counter() - start
+    return timed
@@ -0,0 +1,195 @@
+"""
+Token-level clean-code rules
+
+Runs the rules of AdvancedCleanCodeListener that only look at names and
+line numbers (naming and built-in shadowing) on a token stream, without
+building a parse tree. Statements are told apart by their layout tokens
+and the punctuation outside brackets, as the grammar tells them apart, so
+the findings and their order match a tree walk of any source the parser
+accepts. LinterRunner uses it when no enabled rule needs a deeper level.
+"""
+import io
+import keyword
+import tokenize
+
+from antlr4 import Token
+
+from generated.PythonLexer import PythonLexer
+from linter.MyListener import AdvancedCleanCodeListener
+
+# Layout token kinds
+NEWLINE = 'newline'
+INDENT = 'indent'
+DEDENT = 'dedent'
+
+_ANTLR_LAYOUT = {PythonLexer.NEWLINE: NEWLINE, PythonLexer.INDENT: INDENT, PythonLexer.DEDENT: DEDENT}
+_TOKENIZE_LAYOUT = {tokenize.NEWLINE: NEWLINE, tokenize.INDENT: INDENT, tokenize.DEDENT: DEDENT}
+
+_OPENING = {'(', '[', '{'}
+_CLOSING = {')', ']', '}'}
+_AUGASSIGN = {'+=', '-=', '*=', '@=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>=', '**=', '//='}
+
+# Keywords that start a statement with a header ending in ':'
+_COMPOUND = {'if', 'elif', 'else', 'while', 'for', 'try', 'except', 'finally', 'with', 'def', 'class'}
+
+
+def antlr_tokens(tokens):
+    """
+    (kind, text, line) tuples of a filled ANTLR token stream
+
+    Hidden tokens and EOF are dropped, and every f-string is reduced to
+    its FSTRING_START token so that its literal parts are not mistaken
+    for punctuation.
+    """
+    result = []
+    fstring_depth = 0
+    for token in tokens:
+        if token.channel != Token.DEFAULT_CHANNEL or token.type == Token.EOF:
+            continue
+        if token.type == PythonLexer.FSTRING_START:
+            if not fstring_depth:
+                result.append((None, token.text, token.line))
+            fstring_depth += 1
+        elif token.type == PythonLexer.FSTRING_END:
+            fstring_depth = max(fstring_depth - 1, 0)
+        elif not fstring_depth:
+            result.append((_ANTLR_LAYOUT.get(token.type), token.text, token.line))
+    return result
+
+
+def python_tokens(source):
+    """
+    (kind, text, line) tuples from the tokenize module
+
+    Raises:
+        tokenize.TokenError, SyntaxError: if the source cannot be tokenized
+    """
+    return [(_TOKENIZE_LAYOUT.get(token.type), token.string, token.start[0])
+            for token in tokenize.generate_tokens(io.StringIO(source).readline)
+            if token.type not in (tokenize.COMMENT, tokenize.NL, tokenize.ENDMARKER)]
+
+
+class TokenCleanCodeListener(AdvancedCleanCodeListener):
+    """
+    AdvancedCleanCodeListener whose token-level rules are driven by a
+    token stream instead of a parse tree walk
+    """
+
+    def walk_tokens(self, tokens):
+        """
+        Check every statement of a module
+
+        Args:
+            tokens: (kind, text, line) tuples from antlr_tokens() or
+                python_tokens()
+        """
+        # Kind of each open block: True for the body of a match statement
+        blocks = []
+        opens_match = False
+        decorator_line = None
+        statement = []
+        for kind, text, line in tokens:
+            if kind is None:
+                statement.append((text, line))
+                continue
+            if statement:
+                in_match = bool(blocks) and blocks[-1]
+                opens_match, decorator_line = self._logical_line(statement, in_match, decorator_line)
+                statement = []
+            if kind == INDENT:
+                blocks.append(opens_match)
+            elif kind == DEDENT and blocks:
+                blocks.pop()
+        if statement:
+            self._logical_line(statement, bool(blocks) and blocks[-1], decorator_line)
+
+    def _logical_line(self, tokens, in_match, decorator_line):
+        """
+        Check one logical line
+
+        Args:
+            tokens: (text, line) pairs of the line
+            in_match: Whether the line is directly in a match statement's body
+            decorator_line: Line of the first of the decorators before it
+
+        Returns:
+            (opens_match, decorator_line) for the lines that follow
+        """
+        first = tokens[0][0]
+        if first == '@':
+            return False, decorator_line or tokens[0][1]
+
+        start = 0
+        if first == 'async' and len(tokens) > 1 and tokens[1][0] in ('def', 'with', 'for'):
+            start = 1
+        keyword_text = tokens[start][0]
+        if keyword_text == 'def' and start + 1 < len(tokens):
+            func_name = tokens[start + 1][0]
+            if func_name not in self.keywords:
+                self.check_function_naming(func_name, decorator_line or tokens[0][1])
+
+        is_match = first == 'match' and len(tokens) > 1 and tokens[-1][0] == ':'
+        if keyword_text in _COMPOUND or is_match or (in_match and first == 'case'):
+            body = self._header_end(tokens, start + 1)
+            if body is None or body == len(tokens):
+                return is_match, None
+            tokens = tokens[body:]
+
+        self._simple_statements(tokens)
+        return False, None
+
+    def _header_end(self, tokens, index):
+        """Index after the ':' that ends a compound statement's header, or None"""
+        depth = 0
+        lambdas = 0
+        for position in range(index, len(tokens)):
+            text = tokens[position][0]
+            if text in _OPENING:
+                depth += 1
+            elif text in _CLOSING:
+                depth -= 1
+            elif depth:
+                continue
+            elif text == 'lambda':
+                lambdas += 1
+            elif text == ':':
+                if not lambdas:
+                    return position + 1
+                lambdas -= 1
+        return None
+
+    def _simple_statements(self, tokens):
+        """Check the ';'-separated simple statements of a line"""
+        depth = 0
+        start = 0
+        for position, (text, _) in enumerate(tokens):
+            if text in _OPENING:
+                depth += 1
+            elif text in _CLOSING:
+                depth -= 1
+            elif text == ';' and not depth:
+                if position > start:
+                    self._simple_statement(tokens[start:position])
+                start = position + 1
+        if start < len(tokens):
+            self._simple_statement(tokens[start:])
+
+    def _simple_statement(self, tokens):
+        """Check a simple statement that the grammar parses as an assignment"""
+        first, line = tokens[0]
+        if first == 'type' and len(tokens) > 1 and tokens[1][0].isidentifier() \
+                and not keyword.iskeyword(tokens[1][0]):
+            return  # type alias
+        depth = 0
+        for text, _ in tokens:
+            if text in _OPENING:
+                depth += 1
+            elif text in _CLOSING:
+                depth -= 1
+            elif depth:
+                continue
+            elif text == 'lambda':
+                return
+            elif text == '=' or text == ':' or text in _AUGASSIGN:
+                self.check_assignment_target(first, line)
+                return
@@ -0,0 +1,3 @@
+"""
+Long-running linter services (daemon and editor integration)
+"""
@@ -0,0 +1,180 @@
+"""
+Lint Client Module
+Thin client for the lint daemon; imports nothing from the ANTLR runtime
+so it starts in milliseconds
+
+Examples (from the app directory):
+    python -m service.client path/to/file.py
+    python -m service.client --stdin --file path/to/file.py < buffer.py
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from service.protocol import default_socket_path, send_message, read_message
+
+# How long --start waits for a freshly spawned daemon to accept connections
+START_TIMEOUT_SECONDS = 30
+
+
+class DaemonUnavailable(Exception):
+    """Raised when no daemon is listening on the socket"""
+
+
+class DaemonClient:
+    """Connection to a running lint daemon"""
+
+    def __init__(self, socket_path=None):
+        self.socket_path = socket_path or default_socket_path()
+        self._sock = None
+        self._file = None
+        self._next_id = 0
+
+    def connect(self):
+        """Open the connection; raises DaemonUnavailable if nothing listens"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise DaemonUnavailable(f"No lint daemon at {self.socket_path}: {e}")
+        self._sock = sock
+        self._file = sock.makefile('rwb')
+        return self
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._sock.close()
+            self._file = None
+            self._sock = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, method, **params):
+        """
+        Send a request and wait for its response
+
+        Args:
+            method: Daemon method name
+            **params: Request parameters
+
+        Returns:
+            Response dictionary
+        """
+        self._next_id += 1
+        send_message(self._file, dict(params, method=method, id=self._next_id))
+        response = read_message(self._file)
+        if response is None:
+            raise DaemonUnavailable("Lint daemon closed the connection")
+        return response
+
+    def lint(self, paths, **options):
+        """Lint files or folders (paths are made absolute for the daemon)"""
+        return self.request('lint', paths=[os.path.abspath(path) for path in paths], **options)
+
+    def lint_source(self, source, file_name, **options):
+        """Lint in-memory source code reported under file_name"""
+        return self.request('lint_source', source=source, file=file_name, **options)
+
+
+def start_daemon(socket_path, config_path):
+    """Spawn a daemon in the background and wait until it accepts connections"""
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.Popen(
+        [sys.executable, '-m', 'service.daemon', '--socket', socket_path,
+         '--config', os.path.abspath(config_path)],
+        cwd=app_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            with DaemonClient(socket_path) as client:
+                client.request('ping')
+                return
+        except DaemonUnavailable:
+            time.sleep(0.05)
+    raise DaemonUnavailable(f"Lint daemon did not start within {START_TIMEOUT_SECONDS}s")
+
+
+def main(argv=None):
+    """Client entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Lint files through a running lint daemon.")
+    parser.add_argument('paths', nargs='*', help="Python files or folders to lint")
+    parser.add_argument('--socket', default=default_socket_path(),
+                        help="Unix socket path (default: %(default)s)")
+    parser.add_argument('--stdin', action='store_true',
+                        help="Read source from stdin instead of files")
+    parser.add_argument('--file', default='<stdin>',
+                        help="File name reported for --stdin source")
+    parser.add_argument('--no-listener', action='store_true',
+                        help="Skip the listener-based clean code linter")
+    parser.add_argument('--no-semantic', action='store_true',
+                        help="Skip the semantic visitor linter")
+    parser.add_argument('--start', action='store_true',
+                        help="Start a daemon in the background if none is running")
+    parser.add_argument('--config', default="config.json",
+                        help="Config file used when starting a daemon (default: config.json)")
+    parser.add_argument('--stats', action='store_true', help="Print daemon statistics")
+    parser.add_argument('--reload', action='store_true', help="Reload daemon config and clear its cache")
+    parser.add_argument('--shutdown', action='store_true', help="Stop the daemon")
+    args = parser.parse_args(argv)
+
+    options = {
+        'use_listener': not args.no_listener,
+        'use_semantic': not args.no_semantic,
+        'format': True,
+    }
+    try:
+        try:
+            client = DaemonClient(args.socket).connect()
+        except DaemonUnavailable:
+            if not args.start:
+                raise
+            start_daemon(args.socket, args.config)
+            client = DaemonClient(args.socket).connect()
+
+        with client:
+            if args.shutdown:
+                client.request('shutdown')
+                return 0
+            if args.reload:
+                client.request('reload')
+            if args.stats:
+                for key, value in client.request('stats').items():
+                    if key != 'id':
+                        print(f"{key}: {value}")
+                return 0
+            if args.stdin:
+                response = client.lint_source(sys.stdin.read(), args.file, **options)
+            elif args.paths:
+                response = client.lint(args.paths, **options)
+            else:
+                return 0
+    except DaemonUnavailable as e:
+        print(f"❌ {e}\nStart one with: python -m service.daemon (or pass --start)", file=sys.stderr)
+        return 2
+
+    if 'error' in response:
+        print(f"❌ {response['error']}", file=sys.stderr)
+        return 2
+    print(response['formatted'])
+    has_issues = any(
+        result['listener_violations'] or result['semantic_output'] or result['errors']
+        for result in response['results']
+    )
+    return 1 if has_issues else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
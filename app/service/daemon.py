@@ -0,0 +1,319 @@
+"""
+Lint Daemon Module
+Keeps the lexer, parser and a result cache warm in a long-running
+process and serves lint requests over a local Unix socket
+
+Start it from the app directory with:
+    python -m service.daemon
+"""
+import argparse
+import hashlib
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# Allow running as "python -m service.daemon" from the app directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.config_manager import ConfigManager
+from gui.linter_runner import LinterRunner
+from gui.incremental_linter import IncrementalLinter
+from service.protocol import default_socket_path, send_message, read_message
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Exercised once at startup so ATN deserialization and common DFA
+# states are paid for before the first real request arrives
+WARMUP_SOURCE = '''
+import os
+from pathlib import Path as P
+
+class Example(Base):
+    """Docstring"""
+    value: int = 0
+
+    def method(self, a, b=1, *args, **kwargs):
+        if a and not b or a is None:
+            return [x * 2 for x in args if x > 0]
+        elif a in kwargs:
+            result = {k: v for k, v in kwargs.items()}
+        else:
+            result = lambda y: y ** 2
+        for i, item in enumerate(args):
+            while i < 10:
+                i += 1
+        try:
+            with open(f"{a}.txt") as handle:
+                data = handle.read()[1:-1]
+        except (OSError, ValueError) as e:
+            raise RuntimeError(str(e)) from e
+        finally:
+            pass
+        return result
+
+async def run(x):
+    await x
+    return {1, 2, 3}, (4,), x.attr.call(1, key=2)
+'''
+
+
+class SocketInUse(Exception):
+    """Raised when the socket path belongs to a daemon that is still running"""
+
+
+def remove_stale_socket(socket_path):
+    """
+    Remove a socket left behind by a daemon that is gone
+
+    Raises:
+        SocketInUse: if a daemon still accepts connections on the socket,
+            or the path cannot be checked
+    """
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        # Nothing listens any more
+        os.unlink(socket_path)
+        return
+    except OSError as e:
+        raise SocketInUse(f"Cannot use {socket_path}: {e}")
+    finally:
+        probe.close()
+    raise SocketInUse(f"A lint daemon is already listening on {socket_path}")
+
+
+class ResultCache:
+    """Bounded LRU cache of lint results, shared by the request handler threads"""
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class LintDaemon:
+    """
+    Serves lint requests with a warm LinterRunner
+
+    Requests are JSON objects with a 'method' field:
+        ping                        -> {"ok": true}
+        lint {paths, ...}           -> {"results": [...], "formatted": str?}
+        lint_source {file, source}  -> {"results": [...], "formatted": str?}
+        reload                      -> re-read config and clear the cache
+        stats                       -> cache and request counters
+        shutdown                    -> stop the daemon
+    """
+
+    def __init__(self, config_path="config.json", cache_size=DEFAULT_CACHE_SIZE):
+        self.config_path = config_path
+        self.cache = ResultCache(cache_size)
+        self.requests = 0
+        self.started = time.time()
+        # The ANTLR runtime shares DFA caches between parsers; lint one request at a time
+        self._lint_lock = threading.Lock()
+        self.server = None
+        self.reload()
+
+    def reload(self):
+        """(Re)load configuration and drop cached results"""
+        self.config_manager = ConfigManager(self.config_path)
+        self.runner = LinterRunner(self.config_manager.get_config())
+        # Re-linting an edited file reparses only its changed statements
+        self.incremental = IncrementalLinter(self.runner.config)
+        self.cache.clear()
+
+    def warm_up(self):
+        """Lint a representative snippet to warm the parser"""
+        with self._lint_lock:
+            self.runner.lint_source(WARMUP_SOURCE, "<warmup>")
+
+    def handle(self, request):
+        """
+        Handle a single decoded request
+
+        Args:
+            request: Request dictionary
+
+        Returns:
+            Response dictionary
+        """
+        self.requests += 1
+        method = request.get('method')
+        use_listener = request.get('use_listener', True)
+        use_semantic = request.get('use_semantic', True)
+
+        if method == 'ping':
+            return {'ok': True}
+        if method == 'lint':
+            paths = request.get('paths', [])
+            if request.get('expand', True):
+                exclude_patterns = self.config_manager.get_exclude_patterns()
+                expanded = []
+                for path in paths:
+                    expanded.extend(str(p) for p in self.runner.find_python_files(path, exclude_patterns))
+                paths = expanded
+            results = [self._lint_path(path, use_listener, use_semantic) for path in paths]
+            return self._results_response(request, results)
+        if method == 'lint_source':
+            result = self._lint_source(request.get('source', ''), request.get('file', '<stdin>'),
+                                       use_listener, use_semantic)
+            return self._results_response(request, [result])
+        if method == 'reload':
+            with self._lint_lock:
+                self.reload()
+            return {'ok': True}
+        if method == 'stats':
+            return {
+                'requests': self.requests,
+                'uptime': time.time() - self.started,
+                'cache_entries': len(self.cache),
+                'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses,
+            }
+        if method == 'shutdown':
+            if self.server is not None:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {'ok': True}
+        return {'error': f"Unknown method: {method}"}
+
+    def _results_response(self, request, results):
+        response = {'results': results}
+        if request.get('format'):
+            response['formatted'] = self.runner.format_results(results)
+        return response
+
+    def _lint_path(self, path, use_listener, use_semantic):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Let the runner report the missing/unreadable file as usual
+            with self._lint_lock:
+                return self.runner.lint_file(path, use_listener, use_semantic)
+
+        key = ('path', path, stat.st_mtime_ns, stat.st_size, use_listener, use_semantic)
+        result = self.cache.get(key)
+        if result is None:
+            with self._lint_lock:
+                result = self.incremental.lint_file(path, use_listener, use_semantic)
+            self.cache.put(key, result)
+        return result
+
+    def _lint_source(self, source, file_name, use_listener, use_semantic):
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        key = ('source', file_name, digest, use_listener, use_semantic)
+        result = self.cache.get(key)
+        if result is None:
+            with self._lint_lock:
+                result = self.incremental.lint_source(source, file_name, use_listener, use_semantic)
+            self.cache.put(key, result)
+        return result
+
+    def serve_forever(self, socket_path):
+        """
+        Listen on a Unix socket until a shutdown request arrives
+
+        Args:
+            socket_path: Filesystem path of the socket
+
+        Raises:
+            SocketInUse: if another daemon is listening on socket_path
+        """
+        remove_stale_socket(socket_path)
+
+        daemon = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        request = read_message(self.rfile)
+                    except ValueError as e:
+                        send_message(self.wfile, {'error': f"Invalid request: {e}"})
+                        continue
+                    if request is None:
+                        return
+                    try:
+                        response = daemon.handle(request)
+                    except Exception as e:
+                        response = {'error': str(e)}
+                    if 'id' in request:
+                        response['id'] = request['id']
+                    send_message(self.wfile, response)
+
+        old_umask = os.umask(0o077)  # socket is private to the current user
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.daemon_threads = True
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+def main(argv=None):
+    """Daemon entry point"""
+    parser = argparse.ArgumentParser(description="Run the linter as a long-running daemon.")
+    parser.add_argument('--socket', default=default_socket_path(),
+                        help="Unix socket path (default: %(default)s)")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help="Maximum number of cached results (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    daemon = LintDaemon(os.path.abspath(args.config), args.cache_size)
+    try:
+        # Fail before spending the warm-up when another daemon owns the socket
+        remove_stale_socket(args.socket)
+        start = time.perf_counter()
+        daemon.warm_up()
+        print(f"🔥 Parser warmed up in {(time.perf_counter() - start) * 1000:.0f} ms")
+        print(f"Listening on {args.socket}")
+        daemon.serve_forever(args.socket)
+    except SocketInUse as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""
+LSP Server Module
+Language Server Protocol server publishing linter findings as
+diagnostics over JSON-RPC on stdio
+
+Start it from the app directory with:
+    python -m service.lsp_server
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+# Allow running as "python -m service.lsp_server" from the app directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.config_manager import ConfigManager
+from gui.linter_runner import LintCancelled
+from gui.incremental_linter import IncrementalLinter
+from gui.result_store import issue_line, classify_violation, is_semantic_issue
+
+# Wait this long after the last edit of a document before linting it
+DEFAULT_DEBOUNCE_SECONDS = 0.05
+
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+TEXT_DOCUMENT_SYNC_FULL = 1
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+
+# Units of the 'character' of LSP positions; UTF-16 unless negotiated
+POSITION_ENCODING_UTF16 = 'utf-16'
+POSITION_ENCODING_UTF32 = 'utf-32'
+
+ERROR_METHOD_NOT_FOUND = -32601
+ERROR_INVALID_REQUEST = -32600
+
+DIAGNOSTIC_SOURCE = "pylinter"
+
+# A line with its line break, as LSP counts lines
+_DOCUMENT_LINE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)?')
+
+
+def uri_to_path(uri):
+    """Convert a file:// URI to a filesystem path"""
+    parsed = urlparse(uri)
+    if parsed.scheme != 'file':
+        return uri
+    return unquote(parsed.path)
+
+
+def _document_lines(text, keepends=False):
+    """
+    Split a document into lines as LSP counts them
+
+    Only \\n, \\r\\n and \\r end lines (str.splitlines() also splits at
+    form feeds and other separators, which would shift every later line)
+    """
+    lines = _DOCUMENT_LINE.findall(text)[:-1] or ['']
+    if keepends:
+        return lines
+    return [line.rstrip('\r\n') for line in lines]
+
+
+def _code_units(text, encoding):
+    """Length of text in the code units of a position encoding"""
+    if encoding == POSITION_ENCODING_UTF32 or text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _code_point_index(text, character, encoding):
+    """Index into text of a position's character offset (clamped to the text)"""
+    if encoding == POSITION_ENCODING_UTF32 or text.isascii():
+        return min(character, len(text))
+    units = 0
+    for index, char in enumerate(text):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
+
+
+def _line_range(lines, line, column=None, encoding=POSITION_ENCODING_UTF16):
+    """LSP range covering a 1-based source line (from a code point column, if given)"""
+    index = min(max(line - 1, 0), max(len(lines) - 1, 0))
+    text = lines[index] if lines else ''
+    length = _code_units(text, encoding)
+    start = min(_code_units(text[:column], encoding), length) if column is not None else 0
+    return {
+        'start': {'line': index, 'character': start},
+        'end': {'line': index, 'character': max(length, start)},
+    }
+
+
+def result_to_diagnostics(result, text, encoding=POSITION_ENCODING_UTF16):
+    """
+    Convert a LinterRunner result into LSP diagnostics
+
+    Args:
+        result: Result dictionary from LinterRunner
+        text: Document text the result was computed from
+        encoding: Position encoding negotiated with the client
+
+    Returns:
+        List of LSP Diagnostic dictionaries
+    """
+    lines = _document_lines(text)
+    diagnostics = []
+
+    for violation in result['listener_violations']:
+        line = issue_line('violations', violation) or 1
+        message = violation.replace('⚠️', '').strip()
+        message = re.sub(r'\[Baris \d+\]', '', message).strip()
+        diagnostics.append({
+            'range': _line_range(lines, line, encoding=encoding),
+            'severity': SEVERITY_WARNING,
+            'source': DIAGNOSTIC_SOURCE,
+            'code': classify_violation(message),
+            'message': message,
+        })
+
+    for output_line in result['semantic_output']:
+        if not is_semantic_issue(output_line):
+            continue
+        line = issue_line('semantic', output_line) or 1
+        diagnostics.append({
+            'range': _line_range(lines, line, encoding=encoding),
+            'severity': SEVERITY_ERROR,
+            'source': DIAGNOSTIC_SOURCE,
+            'code': 'Semantic',
+            'message': output_line.replace('❌', '').replace('[ERROR]', '').strip(),
+        })
+
+    for error in result['errors']:
+        line = issue_line('errors', error) or 1
+        column_match = re.search(r'col (\d+)', error)
+        diagnostics.append({
+            'range': _line_range(lines, line, int(column_match.group(1)) if column_match else None, encoding),
+            'severity': SEVERITY_ERROR,
+            'source': DIAGNOSTIC_SOURCE,
+            'code': 'Syntax',
+            'message': error,
+        })
+
+    return diagnostics
+
+
+def apply_content_change(text, change, encoding=POSITION_ENCODING_UTF16):
+    """
+    Apply one LSP contentChange (full or ranged) to a document text
+
+    Args:
+        text: Document text
+        change: TextDocumentContentChangeEvent
+        encoding: Position encoding negotiated with the client
+    """
+    if 'range' not in change:
+        return change['text']
+    lines = _document_lines(text, keepends=True)
+
+    def offset(position):
+        line = position['line']
+        if line >= len(lines):
+            return len(text)
+        return sum(len(l) for l in lines[:line]) + _code_point_index(lines[line], position['character'], encoding)
+
+    start = offset(change['range']['start'])
+    end = offset(change['range']['end'])
+    return text[:start] + change['text'] + text[end:]
+
+
+class Document:
+    """Per-document state kept between edits"""
+
+    __slots__ = ('uri', 'path', 'version', 'text', 'result', 'linted_version')
+
+    def __init__(self, uri, version, text):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.version = version
+        self.text = text
+        self.result = None
+        self.linted_version = None
+
+
+class LanguageServer:
+    """
+    Minimal LSP server for the linter
+
+    Edits are debounced per document. A single worker thread lints the
+    document whose debounce expired first, and the lint is cancelled as
+    soon as a newer version of the same document arrives.
+    """
+
+    def __init__(self, instream, outstream, config_path="config.json",
+                 debounce=DEFAULT_DEBOUNCE_SECONDS):
+        self.instream = instream
+        self.outstream = outstream
+        self.config_path = config_path
+        self.debounce = debounce
+        self.documents = {}
+        self.linter = None
+        self.position_encoding = POSITION_ENCODING_UTF16
+        self.shutdown_requested = False
+        self.latencies = []
+
+        self._write_lock = threading.Lock()
+        self._state = threading.Condition()
+        self._due = {}  # uri -> monotonic time the lint may start
+        self._edited_at = {}  # uri -> monotonic time of the edit being linted
+        self._stopping = False
+        self._worker = threading.Thread(target=self._lint_worker, daemon=True)
+
+    # ----- JSON-RPC transport -----
+
+    def _read_message(self):
+        headers = {}
+        while True:
+            line = self.instream.readline()
+            if not line:
+                return None
+            line = line.decode('ascii').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        return json.loads(self.instream.read(length).decode('utf-8'))
+
+    def _send(self, message):
+        body = json.dumps(dict(message, jsonrpc='2.0')).encode('utf-8')
+        with self._write_lock:
+            self.outstream.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            self.outstream.flush()
+
+    def _respond(self, request_id, result=None, error=None):
+        message = {'id': request_id}
+        if error is not None:
+            message['error'] = error
+        else:
+            message['result'] = result
+        self._send(message)
+
+    def _notify(self, method, params):
+        self._send({'method': method, 'params': params})
+
+    # ----- Main loop -----
+
+    def run(self):
+        """Serve until 'exit'; returns the process exit code"""
+        self._worker.start()
+        try:
+            while True:
+                message = self._read_message()
+                if message is None:
+                    return 1
+                method = message.get('method')
+                if method == 'exit':
+                    return 0 if self.shutdown_requested else 1
+                self._dispatch(message)
+        finally:
+            with self._state:
+                self._stopping = True
+                self._state.notify_all()
+
+    def _dispatch(self, message):
+        method = message.get('method')
+        params = message.get('params') or {}
+        handler = getattr(self, 'on_' + (method or '').replace('/', '_').replace('$', 'dollar'), None)
+        is_request = 'id' in message
+
+        if handler is None:
+            if is_request:
+                self._respond(message['id'], error={
+                    'code': ERROR_METHOD_NOT_FOUND, 'message': f"Method not found: {method}"
+                })
+            return
+        try:
+            result = handler(params)
+        except Exception as e:
+            if is_request:
+                self._respond(message['id'], error={'code': ERROR_INVALID_REQUEST, 'message': str(e)})
+            return
+        if is_request:
+            self._respond(message['id'], result)
+
+    # ----- Lifecycle -----
+
+    def on_initialize(self, params):
+        options = params.get('initializationOptions') or {}
+        self.config_path = options.get('configPath', self.config_path)
+        self.linter = IncrementalLinter(ConfigManager(self.config_path).get_config())
+        # Code point offsets when the client can use them, saving conversions
+        general = (params.get('capabilities') or {}).get('general') or {}
+        if POSITION_ENCODING_UTF32 in (general.get('positionEncodings') or ()):
+            self.position_encoding = POSITION_ENCODING_UTF32
+        else:
+            self.position_encoding = POSITION_ENCODING_UTF16
+        return {
+            'capabilities': {
+                'positionEncoding': self.position_encoding,
+                'textDocumentSync': {
+                    'openClose': True,
+                    'change': TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                    'save': {'includeText': False},
+                },
+            },
+            'serverInfo': {'name': 'pylinter-lsp', 'version': '1.0.0'},
+        }
+
+    def on_initialized(self, params):
+        return None
+
+    def on_shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def on_dollar_cancelRequest(self, params):
+        # Diagnostics are pushed, not requested; there is nothing to cancel
+        return None
+
+    def on_workspace_didChangeConfiguration(self, params):
+        with self._state:
+            self.linter = IncrementalLinter(ConfigManager(self.config_path).get_config())
+            for uri in self.documents:
+                self._schedule(uri)
+        return None
+
+    # ----- Document synchronization -----
+
+    def on_textDocument_didOpen(self, params):
+        item = params['textDocument']
+        with self._state:
+            self.documents[item['uri']] = Document(item['uri'], item.get('version'), item['text'])
+            self._schedule(item['uri'], immediate=True)
+
+    def on_textDocument_didChange(self, params):
+        uri = params['textDocument']['uri']
+        with self._state:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            for change in params['contentChanges']:
+                document.text = apply_content_change(document.text, change, self.position_encoding)
+            document.version = params['textDocument'].get('version')
+            self._schedule(uri)
+
+    def on_textDocument_didSave(self, params):
+        with self._state:
+            if params['textDocument']['uri'] in self.documents:
+                self._schedule(params['textDocument']['uri'], immediate=True)
+
+    def on_textDocument_didClose(self, params):
+        uri = params['textDocument']['uri']
+        with self._state:
+            document = self.documents.pop(uri, None)
+            self._due.pop(uri, None)
+            if document is not None:
+                self.linter.forget(document.path)
+        self._notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    # ----- Linting -----
+
+    def _schedule(self, uri, immediate=False):
+        """Queue a document for linting (caller holds self._state)"""
+        now = time.monotonic()
+        self._due[uri] = now if immediate else now + self.debounce
+        self._edited_at[uri] = now
+        self._state.notify_all()
+
+    def _lint_worker(self):
+        while True:
+            with self._state:
+                while True:
+                    if self._stopping:
+                        return
+                    if self._due:
+                        uri, due = min(self._due.items(), key=lambda item: item[1])
+                        delay = due - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._state.wait(delay)
+                    else:
+                        self._state.wait()
+                del self._due[uri]
+                document = self.documents.get(uri)
+                if document is None or self.linter is None:
+                    continue
+                version, text, linter = document.version, document.text, self.linter
+                edited_at = self._edited_at.get(uri, time.monotonic())
+
+            def cancelled():
+                # A newer edit is queued for this document (or the server is stopping)
+                return uri in self._due or self._stopping
+
+            try:
+                result = linter.lint_source(text, document.path, cancel_check=cancelled)
+            except LintCancelled:
+                continue
+
+            with self._state:
+                if uri not in self.documents or document.version != version:
+                    continue
+                document.result = result
+                document.linted_version = version
+            self._notify('textDocument/publishDiagnostics', {
+                'uri': uri,
+                'version': version,
+                'diagnostics': result_to_diagnostics(result, text, self.position_encoding),
+            })
+            self.latencies.append(time.monotonic() - edited_at)
+
+
+def main(argv=None):
+    """LSP server entry point"""
+    parser = argparse.ArgumentParser(description="Run the linter as a Language Server (stdio).")
+    parser.add_argument('--config', default="config.json",
+                        help="Path to config file (default: config.json)")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                        help="Seconds to wait after an edit before linting (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    instream = sys.stdin.buffer
+    outstream = sys.stdout.buffer
+    # The protocol owns stdout; stray prints (e.g. config warnings) go to stderr
+    sys.stdout = sys.stderr
+
+    server = LanguageServer(instream, outstream, os.path.abspath(args.config), args.debounce)
+    return server.run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Daemon Protocol Module
+Newline-delimited JSON messages exchanged over the daemon's Unix socket
+"""
+import json
+import os
+import tempfile
+
+
+def default_socket_path():
+    """Per-user socket path, preferring XDG_RUNTIME_DIR when available"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"pylinter-{os.getuid()}.sock")
+
+
+def send_message(sock_file, message):
+    """Write one JSON message followed by a newline and flush"""
+    sock_file.write(json.dumps(message).encode('utf-8') + b'\n')
+    sock_file.flush()
+
+
+def read_message(sock_file):
+    """
+    Read one JSON message, or None when the peer closed the connection
+
+    Raises:
+        ValueError: if the line is not a JSON object
+    """
+    line = sock_file.readline()
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError(f"expected a JSON object, got {type(message).__name__}")
+    return message